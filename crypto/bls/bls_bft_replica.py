@@ -87,7 +87,8 @@ class BlsBftReplica(metaclass=ABCMeta):
         :param key: 3PC-key re;ated to the Ordered message
         :param quorums: quorums
         :param pre_prepare: PrePrepare associated with the ordered messages
-        :return:
+        :return: names of the nodes whose BLS signatures in COMMITs turned out
+        to be wrong (if signatures are not checked when validating COMMITs)
         '''
         pass
 
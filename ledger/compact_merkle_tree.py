@@ -7,7 +7,7 @@ from ledger.hash_stores.hash_store import HashStore
 from ledger.hash_stores.memory_hash_store import MemoryHashStore
 from ledger.tree_hasher import TreeHasher
 from ledger.util import ConsistencyVerificationFailed
-from ledger.util import count_bits_set, lowest_bit_set
+from ledger.util import count_bits_set, lowest_bit_set, highest_bit_set
 
 
 class CompactMerkleTree(merkle_tree.MerkleTree):
@@ -28,6 +28,10 @@ class CompactMerkleTree(merkle_tree.MerkleTree):
         self.__hasher = hasher
         self._update(tree_size, hashes)
 
+    @property
+    def hasher(self):
+        return self.__hasher
+
     @property
     def hashStore(self):
         return self.__hashStore
@@ -135,6 +139,7 @@ class CompactMerkleTree(merkle_tree.MerkleTree):
         if self.hashStore:
             for node in nodes:
                 self.hashStore.writeNode(node)
+            self.hashStore.flush()
 
     def __push_subtree_hash(self, subtree_h: int, sub_hash: bytes):
         size, mintree_h = 1 << (subtree_h - 1), self.__mintree_height
@@ -160,30 +165,94 @@ class CompactMerkleTree(merkle_tree.MerkleTree):
         self._push_subtree([new_leaf])
         return auditPath
 
-    def extend(self, new_leaves: List[bytes]):
+    def extend(self, new_leaves: List[bytes], with_proofs=False):
         """Extend this tree with new_leaves on the end.
 
-        The algorithm works by using _push_subtree() as a primitive, calling
-        it with the maximum number of allowed leaves until we can add the
-        remaining leaves as a valid entire (non-full) subtree in one go.
+        The leaves are added in one pass: the subtree hashes are kept in a
+        local list, carries are resolved as each leaf is added and the tree
+        is updated once at the end. Leaf and node hashes are written to the
+        hash store in the same order as successive calls to `append` would
+        write them.
+
+        If `with_proofs` is True, returns a list with a tuple of the audit
+        path and the root hash for each leaf, same as `append` followed by
+        `root_hash` would give.
         """
-        size = len(new_leaves)
-        final_size = self.tree_size + size
-        idx = 0
-        while True:
-            # keep pushing subtrees until mintree_size > remaining
-            max_h = self.__mintree_height
-            max_size = 1 << (max_h - 1) if max_h > 0 else 0
-            if max_h > 0 and size - idx >= max_size:
-                self._push_subtree(new_leaves[idx:idx + max_size])
-                idx += max_size
-            else:
-                break
-        # fill in rest of tree in one go, now that we can
-        if idx < size:
-            root_hash, hashes = self.__hasher._hash_full(new_leaves, idx, size)
-            self._update(final_size, self.hashes + hashes)
-        assert self.tree_size == final_size
+        hash_leaf = self.__hasher.hash_leaf
+        return self.extend_leaf_hashes([hash_leaf(leaf)
+                                        for leaf in new_leaves],
+                                       with_proofs=with_proofs)
+
+    def extend_leaf_hashes(self, leaf_hashes: Sequence[bytes],
+                           with_proofs=False):
+        """Same as `extend` but with the hashes of the new leaves, for leaves
+        which were hashed already."""
+        hasher = self.__hasher
+        hash_store = self.hashStore
+        tree_size = self.__tree_size
+        hashes = list(self.__hashes)
+        proofs = [] if with_proofs else None
+        for sub_hash in leaf_hashes:
+            if with_proofs:
+                audit_path = hashes[::-1]
+            if hash_store:
+                hash_store.writeLeaf(sub_hash)
+            new_node_hashes = []
+            # addition carry - merge with each full subtree of the same height
+            height = 1
+            size = tree_size
+            while size & 1:
+                sub_hash = hasher.hash_children(hashes.pop(), sub_hash)
+                new_node_hashes.append((sub_hash, height))
+                size >>= 1
+                height += 1
+            hashes.append(sub_hash)
+            tree_size += 1
+            if hash_store:
+                for h, height in new_node_hashes:
+                    hash_store.writeNode((tree_size, height, h))
+            if with_proofs:
+                proofs.append((audit_path, hasher._hash_fold(hashes)))
+        self._update(tree_size, hashes)
+        if hash_store:
+            hash_store.flush()
+        return proofs
+
+    def merge_subtree(self, tree_size: int, hashes: Sequence[bytes],
+                      leaf_hashes: Sequence[bytes] = (),
+                      nodes: Sequence[Tuple[int, int, bytes]] = ()):
+        """Extend this tree with a tree of `tree_size` leaves that was built
+        separately, for example by another process.
+
+        `hashes` are the full subtree hashes of the merged tree, `leaf_hashes`
+        and `nodes` are the contents of its hash store, the nodes being
+        (tree_size, height, hash) relative to the merged tree. The size of
+        this tree must be a multiple of the largest full subtree of the
+        merged tree, so that its nodes are also nodes of this tree.
+        """
+        if tree_size == 0:
+            return
+        largest_subtree_size = 1 << (highest_bit_set(tree_size) - 1)
+        if self.tree_size % largest_subtree_size != 0:
+            raise ValueError("tree of size %s can not be merged into tree of "
+                             "size %s" % (tree_size, self.tree_size))
+        offset = self.tree_size
+        if self.hashStore:
+            for h in leaf_hashes:
+                self.hashStore.writeLeaf(h)
+            for size, height, h in nodes:
+                self.hashStore.writeNode((offset + size, height, h))
+        remaining = tree_size
+        for sub_hash in hashes:
+            subtree_h = highest_bit_set(remaining)
+            remaining -= 1 << (subtree_h - 1)
+            new_node_hashes = self.__push_subtree_hash(subtree_h, sub_hash)
+            if self.hashStore:
+                for h, height in new_node_hashes:
+                    self.hashStore.writeNode((self.tree_size, height, h))
+        if self.hashStore:
+            self.hashStore.flush()
+        assert self.tree_size == offset + tree_size
 
     def extended(self, new_leaves: List[bytes]):
         """Returns a new tree equal to this tree extended with new_leaves."""
@@ -1,6 +1,96 @@
+import mmap
+import os
+
 from ledger.hash_stores.hash_store import HashStore
 from storage.binary_file_store import BinaryFileStore
-from storage.kv_store_file import KeyValueStorageFile
+
+
+class FixedSizeRecordsFile:
+    """
+    Array of fixed size records stored in a binary file.
+
+    Reads are done from a memory map of the file, so reading a record does
+    not need any system call. Appended records are kept in a buffer, which
+    is written to the file with a single write on `flush`, records in the
+    buffer can be read as well.
+    """
+
+    def __init__(self, store: BinaryFileStore, recordSize):
+        self.store = store
+        self.recordSize = recordSize
+        self._buffer = bytearray()
+        self._mmap = None
+        self._fileSize = None
+
+    @property
+    def fileSize(self):
+        if self._fileSize is None:
+            self._fileSize = self.store.db_file.seek(0, 2)
+        return self._fileSize
+
+    @property
+    def count(self):
+        return (self.fileSize + len(self._buffer)) // self.recordSize
+
+    def append(self, data):
+        self._buffer += data
+
+    def flush(self):
+        if not self._buffer:
+            return
+        fileSize = self.fileSize
+        db_file = self.store.db_file
+        db_file.write(self._buffer)
+        db_file.flush()
+        if self.store.ensureDurability:
+            os.fsync(db_file.fileno())
+        self._fileSize = fileSize + len(self._buffer)
+        self._buffer = bytearray()
+
+    def read(self, startpos, endpos):
+        """
+        Read the records from `startpos` to `endpos` (both inclusive and
+        starting from 1). Records are sliced out of a memoryview of the map,
+        so each of them is copied only once.
+        """
+        size = self.recordSize
+        start = (startpos - 1) * size
+        end = endpos * size
+        fileSize = self.fileSize
+        records = []
+        if start < fileSize:
+            with memoryview(self._mapped()) as view:
+                records.extend(bytes(view[i:i + size]) for i in
+                               range(start, min(end, fileSize), size))
+        if end > fileSize:
+            records.extend(bytes(self._buffer[i:i + size]) for i in
+                           range(max(start, fileSize) - fileSize,
+                                 end - fileSize, size))
+        return records
+
+    def _mapped(self):
+        if self._mmap is None or len(self._mmap) < self.fileSize:
+            self._unmap()
+            self._mmap = mmap.mmap(self.store.db_file.fileno(),
+                                   self.fileSize, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def _unmap(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def close(self):
+        self.flush()
+        self._unmap()
+        self._fileSize = None
+        self.store.close()
+
+    def reset(self):
+        self._buffer = bytearray()
+        self._unmap()
+        self.store.reset()
+        self._fileSize = None
 
 
 class FileHashStore(HashStore):
@@ -27,37 +117,31 @@ class FileHashStore(HashStore):
         self.leavesFile.lineSep = b''
         self.nodeSize = nodeSize
         self.leafSize = leafSize
+        self.nodes = FixedSizeRecordsFile(self.nodesFile, nodeSize)
+        self.leaves = FixedSizeRecordsFile(self.leavesFile, leafSize)
 
     @property
     def is_persistent(self) -> bool:
         return True
 
     @staticmethod
-    def write(data, store, size):
+    def write(data, records: FixedSizeRecordsFile):
         if not isinstance(data, bytes):
             data = data.encode()
         dataSize = len(data)
-        if dataSize != size:
+        if dataSize != records.recordSize:
             raise ValueError(
                 "Data size not allowed. Size of the data should be "
                 "{} but instead was {}".format(
-                    size, dataSize))
-        store.put(key=None, value=data)
-
-    @staticmethod
-    def read(store: KeyValueStorageFile, entryNo, size):
-        store.db_file.seek((entryNo - 1) * size)
-        return store.db_file.read(size)
+                    records.recordSize, dataSize))
+        records.append(data)
 
     @staticmethod
-    def dataGen(dataFactory, startpos, endpos):
-        i = startpos
-        while True:
-            data = dataFactory(i)
-            yield data
-            i += 1
-            if i <= endpos:
-                break
+    def read(records: FixedSizeRecordsFile, startpos, endpos):
+        HashStore._validatePos(startpos)
+        if endpos > records.count:
+            raise IndexError("No entry at position {}".format(endpos))
+        return records.read(startpos, endpos)
 
     def writeNode(self, node):
         # TODO: Need to have some exception handling around converting to bytes
@@ -67,40 +151,38 @@ class FileHashStore(HashStore):
         # height = height.to_bytes(1, byteorder='little')
         # data = start + height + nodeHash
         data = node[2]
-        self.write(data, self.nodesFile, self.nodeSize)
+        self.write(data, self.nodes)
 
     def writeLeaf(self, leafHash):
-        self.write(leafHash, self.leavesFile, self.leafSize)
+        self.write(leafHash, self.leaves)
 
     def readNode(self, pos):
-        data = self.read(self.nodesFile, pos, self.nodeSize)
-        if len(data) < self.nodeSize:
-            raise IndexError("No node at given position")
         # start = int.from_bytes(data[:4], byteorder='little')
         # height = int.from_bytes(data[4:5], byteorder='little')
         # nodeHash = data[5:]
         # return start, height, nodeHash
-        return data
+        return self.read(self.nodes, pos, pos)[0]
 
     def readLeaf(self, pos):
-        data = self.read(self.leavesFile, pos, self.leafSize)
-        if len(data) < self.leafSize:
-            raise IndexError("No leaf at given position")
-        return data
+        return self.read(self.leaves, pos, pos)[0]
 
     def readLeafs(self, startpos, endpos):
-        return self.dataGen(self.readLeaf, startpos, endpos)
+        return self.read(self.leaves, startpos, endpos)
 
     def readNodes(self, startpos, endpos):
-        return self.dataGen(self.readNode, startpos, endpos)
+        return self.read(self.nodes, startpos, endpos)
+
+    def flush(self):
+        self.leaves.flush()
+        self.nodes.flush()
 
     @property
     def leafCount(self) -> int:
-        return self.leavesFile.db_file.seek(0, 2) // self.leafSize
+        return self.leaves.count
 
     @property
     def nodeCount(self) -> int:
-        return self.nodesFile.db_file.seek(0, 2) // self.nodeSize
+        return self.nodes.count
 
     @property
     def closed(self):
@@ -111,10 +193,10 @@ class FileHashStore(HashStore):
         self.leavesFile.open()
 
     def close(self):
-        self.nodesFile.close()
-        self.leavesFile.close()
+        self.nodes.close()
+        self.leaves.close()
 
     def reset(self):
-        self.nodesFile.reset()
-        self.leavesFile.reset()
+        self.nodes.reset()
+        self.leaves.reset()
         return True
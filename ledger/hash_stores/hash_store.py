@@ -69,6 +69,12 @@ class HashStore:
         :return: list of nodeHashes
         """
 
+    def flush(self):
+        """
+        Make sure all written leaves and nodes are persisted. Stores that
+        buffer writes flush them here, others do not need to do anything.
+        """
+
     @property
     @abstractmethod
     def leafCount(self) -> int:
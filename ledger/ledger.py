@@ -8,9 +8,11 @@ from ledger.genesis_txn.genesis_txn_initiator import GenesisTxnInitiator
 from ledger.immutable_store import ImmutableStore
 from ledger.merkle_tree import MerkleTree
 from ledger.tree_hasher import TreeHasher
+from ledger.tree_recovery import TreeRecoveryFromTxnLog
 from ledger.util import F, ConsistencyVerificationFailed
 from storage.kv_store import KeyValueStorage
-from storage.kv_store_leveldb_int_keys import KeyValueStorageLeveldbIntKeys
+from storage.kv_store_leveldb_fixed_int_keys import \
+    KeyValueStorageLeveldbFixedIntKeys, migrate_int_keys_store
 
 
 class Ledger(ImmutableStore):
@@ -19,7 +21,10 @@ class Ledger(ImmutableStore):
                       logName,
                       ensureDurability,
                       open=True) -> KeyValueStorage:
-        return KeyValueStorageLeveldbIntKeys(dataDir, logName, open)
+        # Transaction logs created with the integer comparator are converted
+        # before being opened
+        migrate_int_keys_store(dataDir, logName)
+        return KeyValueStorageLeveldbFixedIntKeys(dataDir, logName, open)
 
     def __init__(self,
                  tree: MerkleTree,
@@ -29,7 +34,8 @@ class Ledger(ImmutableStore):
                  fileName: str = None,
                  ensureDurability: bool = True,
                  transactionLogStore: KeyValueStorage = None,
-                 genesis_txn_initiator: GenesisTxnInitiator = None):
+                 genesis_txn_initiator: GenesisTxnInitiator = None,
+                 recovery_workers: int = 0):
         """
         :param tree: an implementation of MerkleTree
         :param dataDir: the directory where the transaction log is stored
@@ -37,6 +43,9 @@ class Ledger(ImmutableStore):
         it and storing it in the MerkleTree
         :param fileName: the name of the transaction log file
         :param genesis_txn_initiator: file or dir to use for initialization of transaction log store
+        :param recovery_workers: number of processes used to hash the
+        transaction log when the tree is recovered from it, CPU count if
+        None, the log is hashed in the current process if 0
         """
         self.genesis_txn_initiator = genesis_txn_initiator
 
@@ -50,6 +59,7 @@ class Ledger(ImmutableStore):
         self._transactionLogName = fileName or "transactions"
         self.ensureDurability = ensureDurability
         self._customTransactionLogStore = transactionLogStore
+        self.recovery_workers = recovery_workers
         self.seqNo = 0
         self.start()
         self.recoverTree()
@@ -81,17 +91,9 @@ class Ledger(ImmutableStore):
         t = end - start
         logging.debug("Recovered tree in {} seconds".format(t))
 
-    def recoverTreeFromTxnLog(self):
-        # TODO: in this and some other lines specific fields of
-        self.tree.reset()
-        self.seqNo = 0
-        for key, entry in self._transactionLog.iterator():
-            if self.txn_serializer != self.hash_serializer:
-                entry = self.serialize_for_tree(
-                    self.txn_serializer.deserialize(entry))
-            if isinstance(entry, str):
-                entry = entry.encode()
-            self._addToTreeSerialized(entry)
+    def recoverTreeFromTxnLog(self, progress_callback=None):
+        TreeRecoveryFromTxnLog(self, workers=self.recovery_workers,
+                               progress_callback=progress_callback).recover()
 
     def recoverTreeFromHashStore(self):
         treeSize = self.tree.leafCount
@@ -120,6 +122,44 @@ class Ledger(ImmutableStore):
 
         return merkle_info
 
+    def addTxns(self, txns, with_merkle_info=False):
+        """
+        Add a batch of leaves (transactions) to the log and the merkle tree.
+
+        All leaves are written to the transaction log with a single batch
+        write and the tree is extended in one pass. The merkle info (root
+        hash and audit path) of each leaf is built only if
+        `with_merkle_info` is True.
+
+        :return: list of merkle info of the added leaves if
+        `with_merkle_info` is True, else None
+        """
+        return self.addSerializedTxns(
+            [self.serialize_for_txn_log(txn) for txn in txns],
+            [self.hash_for_tree(txn) for txn in txns],
+            with_merkle_info=with_merkle_info)
+
+    def addSerializedTxns(self, serialized_txns, leaf_hashes,
+                          with_merkle_info=False):
+        """
+        Same as `addTxns` for transactions already serialized for the
+        transaction log and whose leaf hashes are already computed.
+        """
+        if not serialized_txns:
+            return [] if with_merkle_info else None
+        self._addBatchToStore(serialized_txns, serialized=True)
+        start = self.seqNo
+        proofs = self.tree.extend_leaf_hashes(leaf_hashes,
+                                              with_proofs=with_merkle_info)
+        self.seqNo += len(serialized_txns)
+        if not with_merkle_info:
+            return None
+        return [{
+            F.seqNo.name: seq_no,
+            F.rootHash.name: self.hashToStr(root_hash),
+            F.auditPath.name: [self.hashToStr(h) for h in audit_path]
+        } for seq_no, (audit_path, root_hash) in enumerate(proofs, start + 1)]
+
     def _addToTree(self, leafData, serialized=False):
         serializedLeafData = self.serialize_for_tree(leafData) if \
             not serialized else leafData
@@ -130,6 +170,13 @@ class Ledger(ImmutableStore):
         value = self.serialize_for_txn_log(data) if not serialized else data
         self._transactionLog.put(key=key, value=value)
 
+    def _addBatchToStore(self, data, serialized=False):
+        values = data if serialized else \
+            [self.serialize_for_txn_log(d) for d in data]
+        self._transactionLog.setBatch(
+            (str(seq_no), value)
+            for seq_no, value in enumerate(values, self.seqNo + 1))
+
     def _addToTreeSerialized(self, serializedLeafData):
         audit_path = self.tree.append(serializedLeafData)
         self.seqNo += 1
@@ -173,6 +220,9 @@ class Ledger(ImmutableStore):
     def serialize_for_tree(self, leafData):
         return self.hash_serializer.serialize(leafData, toBytes=True)
 
+    def hash_for_tree(self, leafData) -> bytes:
+        return self.tree.hasher.hash_leaf(self.serialize_for_tree(leafData))
+
     @property
     def size(self) -> int:
         return self.tree.tree_size
@@ -11,7 +11,8 @@ from ledger.ledger import Ledger
 from ledger.util import STH
 from storage.binary_serializer_based_file_store import BinarySerializerBasedFileStore
 from storage.chunked_file_store import ChunkedFileStore
-from storage.kv_store_leveldb_int_keys import KeyValueStorageLeveldbIntKeys
+from storage.kv_store_leveldb_fixed_int_keys import \
+    KeyValueStorageLeveldbFixedIntKeys
 from storage.text_file_store import TextFileStore
 
 
@@ -93,8 +94,8 @@ def create_ledger_text_file_storage(txn_serializer, hash_serializer, tempdir, in
 
 
 def create_ledger_leveldb_file_storage(txn_serializer, hash_serializer, tempdir, init_genesis_txn_file=None):
-    store = KeyValueStorageLeveldbIntKeys(tempdir,
-                                          'transactions')
+    store = KeyValueStorageLeveldbFixedIntKeys(tempdir,
+                                               'transactions')
     return __create_ledger(store, txn_serializer, hash_serializer, tempdir, init_genesis_txn_file)
 
 
@@ -151,6 +151,26 @@ class CompactMerkleTreeTest(unittest.TestCase):
             self.tree.extend(test_vector)
             self.assertEqual(self.tree.root_hash_hex, expected_hash)
 
+    def test_extend_same_as_append(self):
+        leaves = [str(i).encode() for i in range(70)]
+        for i in range(len(leaves)):
+            appended = compact_merkle_tree.CompactMerkleTree()
+            audit_paths = []
+            for leaf in leaves:
+                audit_path = appended.append(leaf)
+                audit_paths.append((audit_path, appended.root_hash))
+
+            extended = compact_merkle_tree.CompactMerkleTree()
+            proofs = extended.extend(leaves[:i], with_proofs=True)
+            proofs += extended.extend(leaves[i:], with_proofs=True)
+
+            self.assertEqual(proofs, audit_paths)
+            self.assertEqual(extended.hashes, appended.hashes)
+            self.assertEqual(extended.hashStore._leafs,
+                             appended.hashStore._leafs)
+            self.assertEqual(extended.hashStore._nodes,
+                             appended.hashStore._nodes)
+
 
 class MerkleVerifierTest(unittest.TestCase):
     # (old_tree_size, new_tree_size, old_root, new_root, proof)
@@ -99,3 +99,52 @@ def testRandomAndRepeatedReads(nodesLeaves, tempdir):
     fhs.writeLeaf(leaves[-1])
     fhs.writeLeaf(leaves[0])
     assert leaves[idx] == fhs.readLeaf(idx + 1)
+
+
+def testBufferedWritesAreReadableAndFlushedOnce(nodesLeaves, tempdir):
+    nodes, leaves = nodesLeaves
+    fhs = writtenFhs(tempdir=tempdir, nodes=nodes, leaves=leaves)
+
+    # Nothing is written to the files before flush, but everything is
+    # readable
+    assert fhs.leavesFile.db_file.seek(0, 2) == 0
+    assert fhs.nodesFile.db_file.seek(0, 2) == 0
+    assert fhs.leafCount == len(leaves)
+    assert fhs.nodeCount == len(nodes)
+    assert fhs.readLeafs(1, len(leaves)) == leaves
+
+    fhs.flush()
+    assert fhs.leavesFile.db_file.seek(0, 2) == len(leaves) * fhs.leafSize
+    assert fhs.nodesFile.db_file.seek(0, 2) == len(nodes) * fhs.nodeSize
+
+    # Reads can span the flushed and the buffered records
+    fhs.writeLeaf(leaves[0])
+    assert fhs.readLeafs(len(leaves) - 1, len(leaves) + 1) == \
+        leaves[-2:] + leaves[:1]
+    assert fhs.leafCount == len(leaves) + 1
+
+    fhs.close()
+    reopened_hash_store = FileHashStore(tempdir)
+    assert reopened_hash_store.leafCount == len(leaves) + 1
+    assert reopened_hash_store.readLeafs(1, len(leaves)) == leaves
+    assert reopened_hash_store.readNodes(1, len(nodes)) == \
+        [node[2] for node in nodes]
+
+
+def testReadOutOfRange(nodesLeaves, tempdir):
+    nodes, leaves = nodesLeaves
+    fhs = writtenFhs(tempdir=tempdir, nodes=nodes, leaves=leaves)
+    fhs.flush()
+
+    with pytest.raises(IndexError):
+        fhs.readLeaf(0)
+    with pytest.raises(IndexError):
+        fhs.readLeaf(len(leaves) + 1)
+    with pytest.raises(IndexError):
+        fhs.readNodes(1, len(nodes) + 1)
+
+    fhs.reset()
+    assert fhs.leafCount == 0
+    assert fhs.nodeCount == 0
+    with pytest.raises(IndexError):
+        fhs.readLeaf(1)
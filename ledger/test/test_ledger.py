@@ -1,4 +1,5 @@
 import base64
+import os
 import itertools
 from binascii import hexlify
 from collections import OrderedDict
@@ -7,11 +8,14 @@ import pytest
 from common.serializers.compact_serializer import CompactSerializer
 from common.serializers.msgpack_serializer import MsgPackSerializer
 from ledger.compact_merkle_tree import CompactMerkleTree
+from ledger.hash_stores.file_hash_store import FileHashStore
+from ledger.ledger import Ledger
 from ledger.test.conftest import orderedFields
 from ledger.test.helper import NoTransactionRecoveryLedger, \
     check_ledger_generator, create_ledger_text_file_storage, create_default_ledger, random_txn
 from ledger.test.test_file_hash_store import generateHashes
 from ledger.util import ConsistencyVerificationFailed, F
+from storage.kv_store_leveldb_int_keys import KeyValueStorageLeveldbIntKeys
 
 
 def b64e(s):
@@ -80,6 +84,56 @@ def test_query_merkle_info(ledger, genesis_txns, genesis_txn_file):
             sorted(ledger.merkleInfo(i + 1 + offset).items())
 
 
+def test_add_txns(ledger, genesis_txns, genesis_txn_file):
+    offset = len(genesis_txns) if genesis_txn_file else 0
+    txns = [random_txn(i) for i in range(20)]
+    assert ledger.addTxns(txns) is None
+    assert ledger.size == 20 + offset
+
+    for i, txn in enumerate(txns):
+        txn[F.seqNo.name] = i + 1 + offset
+        assert sorted(txn.items()) == sorted(ledger[i + 1 + offset].items())
+    check_ledger_generator(ledger)
+    assert ledger.tree.hashStore.is_consistent
+
+
+def test_add_txns_same_as_add(create_ledger_callable, tempdir,
+                              txn_serializer, hash_serializer):
+    batch_dir = os.path.join(tempdir, 'batch')
+    one_by_one_dir = os.path.join(tempdir, 'one_by_one')
+    os.makedirs(batch_dir)
+    os.makedirs(one_by_one_dir)
+    batch_ledger = create_ledger_callable(
+        txn_serializer, hash_serializer, batch_dir, None)
+    one_by_one_ledger = create_ledger_callable(
+        txn_serializer, hash_serializer, one_by_one_dir, None)
+
+    txns = [random_txn(i) for i in range(37)]
+    merkle_infos = batch_ledger.addTxns(txns[:5], with_merkle_info=True)
+    merkle_infos += batch_ledger.addTxns(txns[5:], with_merkle_info=True)
+    expected_merkle_infos = [one_by_one_ledger.add(txn) for txn in txns]
+
+    assert merkle_infos == expected_merkle_infos
+    assert batch_ledger.size == one_by_one_ledger.size
+    assert batch_ledger.seqNo == one_by_one_ledger.seqNo
+    assert batch_ledger.root_hash == one_by_one_ledger.root_hash
+    assert batch_ledger.tree.hashes == one_by_one_ledger.tree.hashes
+    for seq_no in range(1, len(txns) + 1):
+        assert batch_ledger.merkleInfo(seq_no) == \
+            one_by_one_ledger.merkleInfo(seq_no)
+    assert list(batch_ledger.getAllTxn()) == \
+        list(one_by_one_ledger.getAllTxn())
+
+
+def test_add_no_txns(ledger):
+    size = ledger.size
+    root_hash = ledger.root_hash
+    assert ledger.addTxns([]) is None
+    assert ledger.addTxns([], with_merkle_info=True) == []
+    assert ledger.size == size
+    assert ledger.root_hash == root_hash
+
+
 """
 If the server holding the ledger restarts, the ledger should be fully rebuilt
 from persisted data. Any incoming commands should be stashed. (Does this affect
@@ -332,3 +386,21 @@ def test_add_get_txns(ledger_no_genesis):
                                                               2) if i <= j]:
         for s, t in ledger.getAllTxn(frm=frm, to=to):
             assert txns[s - 1] == t
+
+
+def test_default_ledger_migrates_int_keys_txn_log(tempdir):
+    ledger = Ledger(CompactMerkleTree(hashStore=FileHashStore(dataDir=tempdir)),
+                    dataDir=tempdir,
+                    transactionLogStore=KeyValueStorageLeveldbIntKeys(
+                        tempdir, 'transactions'))
+    txns = [random_txn(i) for i in range(12)]
+    ledger.addTxns(txns)
+    root_hash = ledger.root_hash
+    ledger.stop()
+
+    ledger = create_default_ledger(tempdir)
+    assert ledger.size == 12
+    assert ledger.root_hash == root_hash
+    assert [txn for _, txn in ledger.getAllTxn(frm=9)] == txns[8:]
+    assert ledger.getBySeqNo(10) == {**txns[9], F.seqNo.name: 10}
+    ledger.stop()
@@ -0,0 +1,68 @@
+from functools import partial
+
+import pytest
+
+from ledger.test.helper import random_txn
+from ledger.tree_recovery import TreeRecoveryFromTxnLog
+
+
+@pytest.fixture(scope='function', params=[0, 2])
+def workers(request):
+    return request.param
+
+
+def test_recovery_with_invalid_chunk_size(ledger_no_genesis):
+    with pytest.raises(ValueError):
+        TreeRecoveryFromTxnLog(ledger_no_genesis, chunk_size=10)
+
+
+@pytest.mark.parametrize('txn_count', [1, 8, 35])
+def test_recover_tree_in_chunks(create_ledger_callable, tempdir,
+                                txn_serializer, hash_serializer,
+                                workers, txn_count):
+    ledger = create_ledger_callable(txn_serializer, hash_serializer, tempdir)
+    for i in range(txn_count):
+        ledger.add(random_txn(i))
+
+    hashes_before = ledger.tree.hashes
+    root_hash_before = ledger.root_hash
+    leaves_before = [ledger.tree.hashStore.readLeaf(seq_no)
+                     for seq_no in range(1, txn_count + 1)]
+    merkle_info_before = [ledger.merkleInfo(seq_no)
+                          for seq_no in range(1, txn_count + 1)]
+
+    progress = []
+    TreeRecoveryFromTxnLog(ledger, chunk_size=4, workers=workers,
+                           progress_callback=progress.append).recover()
+
+    assert ledger.size == txn_count
+    assert ledger.seqNo == txn_count
+    assert ledger.tree.hashes == hashes_before
+    assert ledger.root_hash == root_hash_before
+    assert ledger.tree.hashStore.is_consistent
+    assert [ledger.tree.hashStore.readLeaf(seq_no)
+            for seq_no in range(1, txn_count + 1)] == leaves_before
+    assert [ledger.merkleInfo(seq_no)
+            for seq_no in range(1, txn_count + 1)] == merkle_info_before
+    assert progress == list(range(4, txn_count, 4)) + [txn_count]
+
+    # The tree can grow further after the recovery
+    ledger.add(random_txn(txn_count))
+    assert ledger.tree.hashStore.is_consistent
+    ledger.stop()
+
+
+def test_ledger_recovers_tree_in_process_by_default(ledger_no_genesis,
+                                                    monkeypatch):
+    for i in range(10):
+        ledger_no_genesis.add(random_txn(i))
+    root_hash = ledger_no_genesis.root_hash
+
+    # Small chunks, so the log would be hashed by worker processes if any
+    monkeypatch.setattr('ledger.ledger.TreeRecoveryFromTxnLog',
+                        partial(TreeRecoveryFromTxnLog, chunk_size=4))
+    monkeypatch.setattr('ledger.tree_recovery.ProcessPoolExecutor',
+                        lambda *args, **kwargs: pytest.fail(
+                            'Worker processes started'))
+    ledger_no_genesis.recoverTreeFromTxnLog()
+    assert ledger_no_genesis.root_hash == root_hash
@@ -0,0 +1,33 @@
+import os
+import time
+
+import pytest
+
+from common.serializers.json_serializer import JsonSerializer
+from common.serializers.signing_serializer import SigningSerializer
+from ledger.test.helper import random_txn, create_ledger_leveldb_file_storage
+from ledger.tree_recovery import TreeRecoveryFromTxnLog
+
+
+@pytest.mark.parametrize('txn_count', [1000, 10000])
+def testMeasureRecoveryTime(tempdir, txn_count):
+    ledger_dir = os.path.join(tempdir, str(txn_count))
+    os.makedirs(ledger_dir)
+    ledger = create_ledger_leveldb_file_storage(JsonSerializer(),
+                                                SigningSerializer(),
+                                                ledger_dir)
+    ledger.addTxns([random_txn(i % 100) for i in range(txn_count)])
+    root_hash = ledger.root_hash
+
+    timings = {}
+    for workers in (0, os.cpu_count()):
+        start = time.perf_counter()
+        TreeRecoveryFromTxnLog(ledger, workers=workers).recover()
+        timings[workers] = time.perf_counter() - start
+        assert ledger.root_hash == root_hash
+        assert ledger.tree.hashStore.is_consistent
+    ledger.stop()
+
+    for workers, t in timings.items():
+        print("Recovery of a ledger of {} txns with {} worker processes "
+              "took {} seconds".format(txn_count, workers, t))
@@ -0,0 +1,119 @@
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, chain
+
+from ledger.compact_merkle_tree import CompactMerkleTree
+from ledger.hash_stores.memory_hash_store import MemoryHashStore
+from ledger.util import isPowerOf2
+
+
+def hash_txn_log_chunk(entries, hasher, txn_serializer=None,
+                       hash_serializer=None):
+    """
+    Build a merkle tree of a chunk of transaction log entries.
+
+    If the serializers are given, each entry is deserialized with
+    `txn_serializer` and serialized again with `hash_serializer` before
+    hashing.
+
+    :return: tuple of the size of the tree, its full subtree hashes, the leaf
+    hashes and the nodes of the tree
+    """
+    leaves = []
+    for entry in entries:
+        if txn_serializer is not None:
+            entry = hash_serializer.serialize(
+                txn_serializer.deserialize(entry), toBytes=True)
+        if isinstance(entry, str):
+            entry = entry.encode()
+        leaves.append(entry)
+    hash_store = MemoryHashStore()
+    tree = CompactMerkleTree(hasher=hasher, hashStore=hash_store)
+    tree.extend(leaves)
+    return tree.tree_size, tree.hashes, hash_store._leafs, hash_store._nodes
+
+
+class TreeRecoveryFromTxnLog:
+    """
+    Rebuilds the merkle tree of a ledger (and its hash store) from the
+    transaction log.
+
+    The log is read in chunks of `chunk_size` entries and each chunk is
+    hashed into a separate tree by a pool of `workers` processes. Since
+    `chunk_size` is a power of 2, every chunk (except maybe the last one) is
+    a full subtree of the ledger's tree, so the trees of the chunks are merged
+    in order into the ledger's tree. At most `2 * workers` chunks are read
+    ahead of the merge.
+    """
+
+    def __init__(self, ledger, chunk_size=4096, workers=None,
+                 progress_callback=None):
+        """
+        :param ledger: the ledger whose tree is recovered
+        :param chunk_size: number of txns hashed by a worker in one go, has
+        to be a power of 2
+        :param workers: number of worker processes, `os.cpu_count()` if None;
+        if 0 the chunks are hashed in the current process
+        :param progress_callback: called with the number of recovered txns
+        after each merged chunk
+        """
+        if not isPowerOf2(chunk_size):
+            raise ValueError("chunk size should be a power of 2, but was {}".
+                             format(chunk_size))
+        self.ledger = ledger
+        self.chunk_size = chunk_size
+        self.workers = os.cpu_count() if workers is None else workers
+        self.progress_callback = progress_callback
+
+    def recover(self):
+        ledger = self.ledger
+        ledger.tree.reset()
+        ledger.seqNo = 0
+        start = time.perf_counter()
+
+        if ledger.txn_serializer != ledger.hash_serializer:
+            serializers = (ledger.txn_serializer, ledger.hash_serializer)
+        else:
+            serializers = (None, None)
+        hasher = ledger.tree.hasher
+        chunks = self._chunks()
+        head = list(islice(chunks, 2))
+        chunks = chain(head, chunks)
+
+        if len(head) < 2 or self.workers == 0:
+            # No need to start the worker processes for a small log
+            for chunk in chunks:
+                self._merge(hash_txn_log_chunk(chunk, hasher, *serializers),
+                            start)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            pending = deque()
+            for chunk in chunks:
+                if len(pending) >= 2 * self.workers:
+                    self._merge(pending.popleft().result(), start)
+                pending.append(executor.submit(hash_txn_log_chunk, chunk,
+                                               hasher, *serializers))
+            while pending:
+                self._merge(pending.popleft().result(), start)
+
+    def _chunks(self):
+        entries = (entry for _, entry in
+                   self.ledger._transactionLog.iterator())
+        while True:
+            chunk = list(islice(entries, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def _merge(self, hashed_chunk, start):
+        tree_size, hashes, leaf_hashes, nodes = hashed_chunk
+        self.ledger.tree.merge_subtree(tree_size, hashes, leaf_hashes, nodes)
+        self.ledger.seqNo = self.ledger.tree.tree_size
+        logging.debug("Recovered {} txns from transaction log in {} seconds".
+                      format(self.ledger.seqNo, time.perf_counter() - start))
+        if self.progress_callback:
+            self.progress_callback(self.ledger.seqNo)
@@ -16,15 +16,18 @@ class BlsFactoryBftPlenum(BlsFactoryBft):
     def create_bls_store(self):
         return BlsStore(key_value_type=self._node.config.stateSignatureStorage,
                         data_location=self._node.dataLocation,
-                        key_value_storage_name=self._node.config.stateSignatureDbName)
+                        key_value_storage_name=self._node.config.stateSignatureDbName,
+                        db_config=self._node.config.rocksdbConfig)
 
     def create_bls_key_register(self) -> BlsKeyRegister:
         return BlsKeyRegisterPoolManager(self._node.poolManager)
 
     def create_bls_bft_replica(self, is_master) -> BlsBftReplica:
-        return BlsBftReplicaPlenum(self._node.name,
-                                   self._node.bls_bft,
-                                   is_master)
+        return BlsBftReplicaPlenum(
+            self._node.name,
+            self._node.bls_bft,
+            is_master,
+            verify_commits_in_aggregate=self._node.config.BLS_VERIFY_COMMIT_SIGS_IN_AGGREGATE)
 
 
 def create_default_bls_bft_factory(node):
@@ -17,10 +17,17 @@ class BlsBftReplicaPlenum(BlsBftReplica):
     def __init__(self,
                  node_id,
                  bls_bft: BlsBft,
-                 is_master):
+                 is_master,
+                 verify_commits_in_aggregate=False):
         super().__init__(bls_bft, is_master)
         self.node_id = node_id
+        # If True, signatures from COMMITs are verified all at once in the
+        # multi-signature when ordering
+        self._verify_commits_in_aggregate = verify_commits_in_aggregate
         self._signatures = {}
+        # Value signed for a batch is needed for each COMMIT, so it is
+        # cached: {3PC-key: (values it was created from, value, serialized)}
+        self._multi_sig_values = {}
         self._bls_latest_multi_sig = None  # MultiSignature
         self.state_root_serializer = state_roots_serializer
 
@@ -46,6 +53,10 @@ class BlsBftReplicaPlenum(BlsBftReplica):
             # TODO: It's optional for now
             return
 
+        if self._verify_commits_in_aggregate:
+            # Checked in `process_order`
+            return
+
         if not self._validate_signature(sender, commit.blsSig, pre_prepare):
             return BlsBftReplica.CM_BLS_SIG_WRONG
 
@@ -114,16 +125,22 @@ class BlsBftReplicaPlenum(BlsBftReplica):
         if not self._can_calculate_multi_sig(key, quorums):
             return
 
+        wrong_sigs_from = []
+        if self._verify_commits_in_aggregate:
+            wrong_sigs_from = self._drop_wrong_signatures(key, pre_prepare)
+            if wrong_sigs_from and \
+                    not self._can_calculate_multi_sig(key, quorums):
+                return wrong_sigs_from
+
         # calculate signature always to keep master and non-master in sync
         # but save on master only
         bls_multi_sig = self._calculate_multi_sig(key, pre_prepare)
 
-        if not self._is_master:
-            return
-
-        self._save_multi_sig_local(bls_multi_sig)
+        if self._is_master:
+            self._save_multi_sig_local(bls_multi_sig)
+            self._bls_latest_multi_sig = bls_multi_sig
 
-        self._bls_latest_multi_sig = bls_multi_sig
+        return wrong_sigs_from
 
     # ----GC----
 
@@ -134,6 +151,9 @@ class BlsBftReplicaPlenum(BlsBftReplica):
                 keys_to_remove.append(key)
         for key in keys_to_remove:
             self._signatures.pop(key, None)
+        for key in [k for k in self._multi_sig_values
+                    if compare_3PC_keys(k, key_3PC) >= 0]:
+            self._multi_sig_values.pop(key)
 
     # ----MULT_SIG----
 
@@ -145,17 +165,85 @@ class BlsBftReplicaPlenum(BlsBftReplica):
                                               timestamp=pre_prepare.ppTime)
         return multi_sig_value
 
+    def _get_multi_sig_value(self, pre_prepare: PrePrepare):
+        """
+        :return: multi-signature value for the batch and its serialized form
+        """
+        pool_root_hash = bytes(
+            self._bls_bft.bls_key_register.get_pool_root_hash_committed())
+        signed = (pool_root_hash, pre_prepare.ledgerId,
+                  pre_prepare.stateRootHash, pre_prepare.txnRootHash,
+                  pre_prepare.ppTime)
+        key = (pre_prepare.viewNo, pre_prepare.ppSeqNo)
+        cached = self._multi_sig_values.get(key)
+        if cached is None or cached[0] != signed:
+            pool_root_hash_ser = self.state_root_serializer.serialize(
+                pool_root_hash)
+            value = self._create_multi_sig_value_for_pre_prepare(
+                pre_prepare, pool_root_hash_ser)
+            cached = (signed, value, value.as_single_value())
+            self._multi_sig_values[key] = cached
+        return cached[1], cached[2]
+
     def _validate_signature(self, sender, bls_sig, pre_prepare: PrePrepare):
         sender_node = self.get_node_name(sender)
         pk = self._bls_bft.bls_key_register.get_key_by_name(sender_node)
         if not pk:
             return False
-        pool_state_root_hash_str = self.state_root_serializer.serialize(
-            bytes(self._bls_bft.bls_key_register.get_pool_root_hash_committed()))
-        message = self._create_multi_sig_value_for_pre_prepare(pre_prepare,
-                                                               pool_state_root_hash_str).as_single_value()
+        _, message = self._get_multi_sig_value(pre_prepare)
         return self._bls_bft.bls_crypto_verifier.verify_sig(bls_sig, message, pk)
 
+    def _drop_wrong_signatures(self, key_3PC, pre_prepare: PrePrepare):
+        """
+        Verify the signatures collected for the batch and drop the wrong ones
+
+        :return: names of the nodes whose signatures were dropped
+        """
+        sigs_for_request = self._signatures[key_3PC]
+        _, message = self._get_multi_sig_value(pre_prepare)
+        wrong_sigs_from = self._find_wrong_signatures(
+            list(sigs_for_request.items()), message)
+        for node_name in wrong_sigs_from:
+            logger.warning("{}{} got wrong BLS signature from {} for batch {}"
+                           .format(BLS_PREFIX, self, node_name, key_3PC))
+            sigs_for_request.pop(node_name)
+        return wrong_sigs_from
+
+    def _find_wrong_signatures(self, sigs, message):
+        """
+        Verify the signatures aggregated into one multi-signature, if it is
+        wrong, look for the wrong signatures in each half of them
+
+        :param sigs: list of tuples of node name and its signature
+        :return: names of the nodes whose signatures are wrong
+        """
+        key_register = self._bls_bft.bls_key_register
+        verifier = self._bls_bft.bls_crypto_verifier
+        pks = [key_register.get_key_by_name(node_name)
+               for node_name, _ in sigs]
+        if len(sigs) == 1:
+            node_name, sig = sigs[0]
+            if pks[0] and verifier.verify_sig(sig, message, pks[0]):
+                return []
+            return [node_name]
+
+        if all(pks):
+            try:
+                multi_sig = verifier.create_multi_sig(
+                    [sig for _, sig in sigs])
+            except Exception as ex:
+                # One of the signatures can not be even parsed
+                logger.debug("{}{} can not aggregate BLS signatures: {}"
+                             .format(BLS_PREFIX, self, ex))
+                multi_sig = None
+            if multi_sig and verifier.verify_multi_sig(multi_sig, message,
+                                                       pks):
+                return []
+
+        middle = len(sigs) // 2
+        return self._find_wrong_signatures(sigs[:middle], message) + \
+            self._find_wrong_signatures(sigs[middle:], message)
+
     def _validate_multi_sig(self, multi_sig: MultiSignature):
         public_keys = []
         pool_root_hash = self.state_root_serializer.deserialize(
@@ -172,10 +260,7 @@ class BlsBftReplicaPlenum(BlsBftReplica):
                                                                   public_keys)
 
     def _sign_state(self, pre_prepare: PrePrepare):
-        pool_root_hash_ser = self.state_root_serializer.serialize(
-            bytes(self._bls_bft.bls_key_register.get_pool_root_hash_committed()))
-        message = self._create_multi_sig_value_for_pre_prepare(pre_prepare,
-                                                               pool_root_hash_ser).as_single_value()
+        _, message = self._get_multi_sig_value(pre_prepare)
         return self._bls_bft.bls_crypto_signer.sign(message)
 
     def _can_calculate_multi_sig(self,
@@ -203,10 +288,7 @@ class BlsBftReplicaPlenum(BlsBftReplica):
         participants = list(sigs_for_request.keys())
 
         sig = self._bls_bft.bls_crypto_verifier.create_multi_sig(bls_signatures)
-        pool_root_hash_ser = self.state_root_serializer.serialize(
-            bytes(self._bls_bft.bls_key_register.get_pool_root_hash_committed()))
-        multi_sig_value = self._create_multi_sig_value_for_pre_prepare(pre_prepare,
-                                                                       pool_root_hash_ser)
+        multi_sig_value, _ = self._get_multi_sig_value(pre_prepare)
         return MultiSignature(signature=sig,
                               participants=participants,
                               value=multi_sig_value)
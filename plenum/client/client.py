@@ -43,7 +43,8 @@ from plenum.common.constants import REPLY, POOL_LEDGER_TXNS, \
 from plenum.common.txn_util import idr_from_req_data
 from plenum.common.types import f
 from plenum.common.util import getMaxFailures, rawToFriendly, mostCommonElement
-from plenum.persistence.client_req_rep_store_file import ClientReqRepStoreFile
+from plenum.persistence.client_req_rep_store_leveldb import \
+    ClientReqRepStoreLeveldb
 from plenum.persistence.client_txn_log import ClientTxnLog
 from plenum.server.has_action_queue import HasActionQueue
 from plenum.server.quorums import Quorums
@@ -219,7 +220,7 @@ class Client(Motor,
         return verifier
 
     def getReqRepStore(self):
-        return ClientReqRepStoreFile(self.ledger_dir)
+        return ClientReqRepStoreLeveldb(self.ledger_dir)
 
     def getTxnLogStore(self):
         return ClientTxnLog(self.ledger_dir)
@@ -293,6 +294,7 @@ class Client(Motor,
         # be reset ever so in `__init__` the `prod` method should be patched.
         if self.ledger:
             s += self.ledgerManager._serviceActions()
+        self.reqRepStore.flush()
         return s
 
     def submitReqs(self, *reqs: Request) -> Tuple[List[Request], List[str]]:
@@ -420,6 +422,7 @@ class Client(Motor,
             if self.hashStore and not self.hashStore.closed:
                 self.hashStore.close()
         self.txnLog.close()
+        self.reqRepStore.close()
 
     def getReply(self, identifier: str, reqId: int) -> Optional:
         """
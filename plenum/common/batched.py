@@ -1,5 +1,5 @@
 from collections import deque
-from typing import Any, Iterable, Dict
+from typing import Any, Iterable, Dict, Mapping
 
 from plenum.common.constants import BATCH, OP_FIELD_NAME
 from plenum.common.prepare_batch import split_messages_on_batches
@@ -154,12 +154,27 @@ class Batched(MessageProcessor):
     def doProcessReceived(self, msg, frm, ident):
         if OP_FIELD_NAME in msg and msg[OP_FIELD_NAME] == BATCH:
             if f.MSGS.nm in msg and isinstance(msg[f.MSGS.nm], list):
-                # Removing ping and pong messages from Batch
+                # Removing ping and pong messages from Batch and parsing the
+                # rest, so they are not parsed again when the batch is
+                # unpacked
                 relevantMsgs = []
                 for m in msg[f.MSGS.nm]:
-                    r = self.handlePingPong(m, frm, ident)
-                    if not r:
+                    if isinstance(m, Mapping):
+                        # Batches in binary format carry parsed messages
                         relevantMsgs.append(m)
+                        continue
+                    if isinstance(m, bytes) and m in self.healthMessages:
+                        # while health messages stay raw frames
+                        m = m.decode()
+                    r = self.handlePingPong(m, frm, ident)
+                    if r:
+                        continue
+                    try:
+                        relevantMsgs.append(self.deserializeMsg(m))
+                    except Exception as e:
+                        logger.error('Error {} while converting message {} '
+                                     'in a batch to JSON from {}'.
+                                     format(e, m, frm))
 
                 if not relevantMsgs:
                     return None
@@ -16,6 +16,13 @@ class Ledger(_Ledger):
         self.uncommittedTxns = []
         self.uncommittedRootHash = None
         self.uncommittedTree = None
+        # Tuples of the serialized txn and its leaf hash for each txn of
+        # `uncommittedTxns`, computed when the txn is applied and written to
+        # the ledger as they are when the txn is committed
+        self.uncommittedLeaves = []
+        # The uncommitted tree after each batch of applied txns, so that
+        # discarding batches does not rebuild the tree
+        self.uncommittedTrees = []
 
     @property
     def uncommitted_size(self) -> int:
@@ -25,11 +32,15 @@ class Ledger(_Ledger):
         # These transactions are not yet committed so they do not go to
         # the ledger
         uncommittedSize = self.size + len(self.uncommittedTxns)
-        self.uncommittedTree = self.treeWithAppliedTxns(txns,
-                                                        self.uncommittedTree)
+        leaves = [(self.serialize_for_txn_log(txn), self.hash_for_tree(txn))
+                  for txn in txns]
+        self.uncommittedTree = self.treeWithAppliedLeafHashes(
+            [leaf_hash for _, leaf_hash in leaves], self.uncommittedTree)
         self.uncommittedRootHash = self.uncommittedTree.root_hash
         self.uncommittedTxns.extend(txns)
         if txns:
+            self.uncommittedLeaves.extend(leaves)
+            self.uncommittedTrees.append(self.uncommittedTree)
             return (uncommittedSize + 1, uncommittedSize + len(txns)), txns
         else:
             return (uncommittedSize, uncommittedSize), txns
@@ -42,11 +53,18 @@ class Ledger(_Ledger):
         numbers of the committed txns
         """
         committedSize = self.size
-        committedTxns = []
-        for txn in self.uncommittedTxns[:count]:
-            txn.update(self.append(txn))
-            committedTxns.append(txn)
+        committedTxns = self.uncommittedTxns[:count]
+        leaves = self.uncommittedLeaves[:count]
+        merkle_infos = self.addSerializedTxns(
+            [serialized for serialized, _ in leaves],
+            [leaf_hash for _, leaf_hash in leaves],
+            with_merkle_info=True)
+        for txn, merkle_info in zip(committedTxns, merkle_infos):
+            txn.update(merkle_info)
         self.uncommittedTxns = self.uncommittedTxns[count:]
+        self.uncommittedLeaves = self.uncommittedLeaves[count:]
+        self.uncommittedTrees = [tree for tree in self.uncommittedTrees
+                                 if tree.tree_size > self.size]
         logger.debug('Committed {} txns, {} are uncommitted'.
                      format(len(committedTxns), len(self.uncommittedTxns)))
         if not self.uncommittedTxns:
@@ -60,8 +78,7 @@ class Ledger(_Ledger):
 
     def appendCommittedTxns(self, txns: List):
         # Called while receiving committed txns from other nodes
-        for txn in txns:
-            self.append(txn)
+        self.addTxns(txns)
 
     def discardTxns(self, count: int):
         """
@@ -70,17 +87,31 @@ class Ledger(_Ledger):
         :param count:
         :return:
         """
-        # TODO: This can be optimised if multiple discards are combined
-        # together since merkle root computation will be done only once.
         old_hash = self.uncommittedRootHash
         self.uncommittedTxns = self.uncommittedTxns[:-count]
+        self.uncommittedLeaves = self.uncommittedLeaves[:-count]
+        size = self.uncommitted_size
+        while self.uncommittedTrees and \
+                self.uncommittedTrees[-1].tree_size > size:
+            self.uncommittedTrees.pop()
         if not self.uncommittedTxns:
+            self.uncommittedTrees = []
             self.uncommittedTree = None
             self.uncommittedRootHash = None
         else:
-            self.uncommittedTree = self.treeWithAppliedTxns(
-                self.uncommittedTxns)
-            self.uncommittedRootHash = self.uncommittedTree.root_hash
+            tree = self.uncommittedTrees[-1] if self.uncommittedTrees \
+                else None
+            if tree is None or tree.tree_size != size:
+                # Part of a batch was discarded, the tree is extended with
+                # the remaining txns of the batch
+                base_size = tree.tree_size if tree else self.size
+                tree = self.treeWithAppliedLeafHashes(
+                    [leaf_hash for _, leaf_hash in
+                     self.uncommittedLeaves[base_size - self.size:]],
+                    tree)
+                self.uncommittedTrees.append(tree)
+            self.uncommittedTree = tree
+            self.uncommittedRootHash = tree.root_hash
         logger.debug('Discarding {} txns and root hash {} and new root hash '
                      'is {}. {} are still uncommitted'.
                      format(count, old_hash, self.uncommittedRootHash,
@@ -92,16 +123,26 @@ class Ledger(_Ledger):
         :param txns:
         :return:
         """
+        return self.treeWithAppliedLeafHashes(
+            [self.hash_for_tree(txn) for txn in txns], currentTree)
+
+    def treeWithAppliedLeafHashes(self, leaf_hashes: List[bytes],
+                                  currentTree=None):
+        """
+        Return a copy of merkle tree after appending leaves with the
+        given hashes
+        """
         currentTree = currentTree or self.tree
         # Copying the tree is not a problem since its a Compact Merkle Tree
         # so the size of the tree would be 32*(lg n) bytes where n is the
         # number of leaves (no. of txns)
         tempTree = copy(currentTree)
-        for txn in txns:
-            tempTree.append(self.serialize_for_tree(txn))
+        tempTree.extend_leaf_hashes(leaf_hashes)
         return tempTree
 
     def reset_uncommitted(self):
         self.uncommittedTxns = []
+        self.uncommittedLeaves = []
+        self.uncommittedTrees = []
         self.uncommittedRootHash = None
         self.uncommittedTree = None
@@ -464,18 +464,56 @@ class LedgerManager(HasActionQueue):
                      .format(frm, end - start + 1, start, end))
         logger.debug("{} generating consistency proof: {} from {}".
                      format(self, end, req.catchupTill))
-        cons_proof = self._make_consistency_proof(ledger, end, req.catchupTill)
-        txns = {}
-        for seq_no, txn in ledger.getAllTxn(start, end):
-            txns[seq_no] = self.owner.update_txn_with_extra_data(txn)
-        sorted_txns = SortedDict(txns)
-        rep = CatchupRep(getattr(req, f.LEDGER_ID.nm),
-                         sorted_txns,
-                         cons_proof)
+        # Sizes of the replies are estimated, so they are still split if
+        # they happen to be too large
         message_splitter = self._make_split_for_catchup_rep(ledger, req.catchupTill)
-        self.sendTo(msg=rep,
-                    to=frm,
-                    message_splitter=message_splitter)
+        ledger_id = getattr(req, f.LEDGER_ID.nm)
+        for rep in self._make_catchup_reps(ledger, ledger_id, start, end,
+                                           req.catchupTill):
+            self.sendTo(msg=rep,
+                        to=frm,
+                        message_splitter=message_splitter)
+
+    def _make_catchup_reps(self, ledger, ledger_id, start, end, catchup_till):
+        """
+        Generate the replies with the transactions from `start` to `end`
+        read from the ledger one by one. Transactions are added to a reply
+        while its estimated size fits into the message length limit, each
+        reply has the consistency proof for its last transaction.
+        """
+        serialize = self.nodestack.serializeMsg
+        size_limit = self.nodestack.msg_len_val.max_allowed - \
+            self._catchup_rep_overhead(ledger_id, catchup_till)
+        txns = []
+        size = 0
+        for seq_no, txn in ledger.getAllTxn(start, end):
+            txn = self.owner.update_txn_with_extra_data(txn)
+            # Key, separators and the serialized transaction
+            txn_size = len(str(seq_no)) + 6 + len(serialize(txn))
+            if txns and size + txn_size > size_limit:
+                yield self._make_catchup_rep(ledger, ledger_id, txns,
+                                             catchup_till)
+                txns = []
+                size = 0
+            txns.append((seq_no, txn))
+            size += txn_size
+        if txns:
+            yield self._make_catchup_rep(ledger, ledger_id, txns, catchup_till)
+
+    def _make_catchup_rep(self, ledger, ledger_id, txns, catchup_till):
+        cons_proof = self._make_consistency_proof(ledger, txns[-1][0],
+                                                  catchup_till)
+        return CatchupRep(ledger_id, SortedDict(txns), cons_proof)
+
+    def _catchup_rep_overhead(self, ledger_id, catchup_till):
+        """
+        Size of a serialized reply without transactions and with the longest
+        possible consistency proof
+        """
+        proof = [Ledger.hashToStr(b'\xff' * 32)] * \
+            (2 * catchup_till.bit_length())
+        rep = CatchupRep(ledger_id, {}, proof)
+        return len(self.nodestack.sign_and_serialize(rep))
 
     def _make_consistency_proof(self, ledger, end, catchup_till):
         # TODO: make catchup_till optional
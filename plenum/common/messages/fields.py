@@ -303,6 +303,8 @@ class LedgerIdField(ChooseField):
 
 class Base58Field(FieldBase):
     _base_types = (str,)
+    # Value of each base58 digit
+    _digits = {c: i for i, c in enumerate(base58.alphabet)}
 
     def __init__(self, byte_lengths=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -317,12 +319,22 @@ class Base58Field(FieldBase):
             return 'should not contain the following chars {}{}'.format(
                 to_print, ' (truncated)' if len(to_print) < len(invalid_chars) else '')
         if self.byte_lengths is not None:
-            # TODO could impact performace, need to check
-            b58len = len(base58.b58decode(val))
+            b58len = self._decoded_length(val)
             if b58len not in self.byte_lengths:
                 return 'b58 decoded value length {} should be one of {}' \
                     .format(b58len, list(self.byte_lengths))
 
+    @classmethod
+    def _decoded_length(cls, val):
+        # Length of `base58.b58decode(val)` without building the bytes, each
+        # leading '1' is decoded to a zero byte
+        digits = cls._digits
+        number = 0
+        for c in val:
+            number = number * 58 + digits[c]
+        leading_zeros = len(val) - len(val.lstrip(base58.alphabet[0]))
+        return leading_zeros + (number.bit_length() + 7) // 8
+
 
 class IdentifierField(Base58Field):
     _base_types = (str,)
@@ -463,6 +475,11 @@ class SerializedValueField(FieldBase):
             return 'empty serialized value'
 
 
+class SerializedOrParsedValueField(SerializedValueField):
+    # A value which is either serialized or already deserialized into a map
+    _base_types = (bytes, str, dict)
+
+
 class VersionField(LimitedLengthStringField):
     _base_types = (str,)
 
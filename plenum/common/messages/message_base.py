@@ -1,5 +1,5 @@
 from collections import OrderedDict
-from operator import itemgetter
+from itertools import islice
 from typing import Mapping
 
 from plenum.common.constants import OP_FIELD_NAME
@@ -13,6 +13,9 @@ class MessageValidator(FieldValidator):
     schema = ()
     optional = False
     schema_is_strict = True
+    # Tuple of a schema and its `CompiledSchema`, set on the class or on the
+    # instance which has the schema
+    _compiled = None
 
     def __init__(self, schema_is_strict=True):
         self.schema_is_strict = schema_is_strict
@@ -24,21 +27,36 @@ class MessageValidator(FieldValidator):
     def _validate_fields_with_schema(self, dct, schema):
         if not isinstance(dct, dict):
             self._raise_invalid_type(dct)
-        schema_dct = dict(schema)
-        required_fields = filter(lambda x: not x[1].optional, schema)
-        required_field_names = map(lambda x: x[0], required_fields)
-        missed_required_fields = set(required_field_names) - set(dct)
+        compiled = self._compile_schema(schema)
+        missed_required_fields = compiled.required - dct.keys()
         if missed_required_fields:
             self._raise_missed_fields(*missed_required_fields)
+        validators = compiled.validators
         for k, v in dct.items():
-            if k not in schema_dct:
+            validator = validators.get(k)
+            if validator is None:
                 if self.schema_is_strict:
                     self._raise_unknown_fields(k, v)
             else:
-                validation_error = schema_dct[k].validate(v)
+                validation_error = validator.validate(v)
                 if validation_error:
                     self._raise_invalid_fields(k, v, validation_error)
 
+    def _compile_schema(self, schema) -> 'CompiledSchema':
+        """
+        The compiled `schema`, it is compiled only once for a class, or for
+        an instance which has a schema of its own
+        """
+        compiled = self._compiled
+        if compiled is not None and compiled[0] is schema:
+            return compiled[1]
+        compiled = (schema, CompiledSchema(schema))
+        if schema is type(self).schema:
+            type(self)._compiled = compiled
+        else:
+            self._compiled = compiled
+        return compiled[1]
+
     def _validate_message(self, dct):
         return None
 
@@ -69,6 +87,20 @@ class MessageValidator(FieldValidator):
         return 'validation error [{}]:'.format(self.__class__.__name__)
 
 
+class CompiledSchema:
+    """
+    Field names and validators of a message schema in the form used to
+    validate messages
+    """
+    __slots__ = ('names', 'validators', 'required')
+
+    def __init__(self, schema):
+        self.names = tuple(name for name, _ in schema)
+        self.validators = dict(schema)
+        self.required = frozenset(name for name, validator in schema
+                                  if not validator.optional)
+
+
 class MessageBase(Mapping, MessageValidator):
     typename = None
 
@@ -90,23 +122,35 @@ class MessageBase(Mapping, MessageValidator):
 
         self.validate(input_as_dict)
 
+        self._set_fields(input_as_dict)
+
+    @classmethod
+    def trusted(cls, *args, **kwargs):
+        """
+        Create the message without validating it, only for messages the node
+        creates itself from values which are valid already
+        """
+        msg = cls.__new__(cls)
+        msg._set_fields(kwargs if kwargs else msg._join_with_schema(args))
+        return msg
+
+    def _set_fields(self, input_as_dict):
         self._fields = OrderedDict(
             (name, input_as_dict[name])
-            for name, _ in self.schema
+            for name in self._compile_schema(self.schema).names
             if name in input_as_dict)
 
     def _join_with_schema(self, args):
-        return dict(zip(map(itemgetter(0), self.schema), args))
+        return dict(zip(self._compile_schema(self.schema).names, args))
 
     def __getattr__(self, item):
         return self._fields[item]
 
     def __getitem__(self, key):
-        values = list(self._fields.values())
-        if isinstance(key, slice):
-            return values[key]
-        if isinstance(key, int):
-            return values[key]
+        if isinstance(key, int) and 0 <= key < len(self._fields):
+            return next(islice(self._fields.values(), key, None))
+        if isinstance(key, (slice, int)):
+            return list(self._fields.values())[key]
         raise TypeError("Invalid argument type.")
 
     def _asdict(self):
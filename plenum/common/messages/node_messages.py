@@ -6,7 +6,7 @@ from plenum.common.constants import NOMINATE, BATCH, REELECTION, PRIMARY, BLACKL
     MESSAGE_REQUEST, MESSAGE_RESPONSE, OBSERVED_DATA, BATCH_COMMITTED
 from plenum.common.messages.client_request import ClientMessageValidator
 from plenum.common.messages.fields import NonNegativeNumberField, IterableField, \
-    SerializedValueField, SignatureField, TieAmongField, AnyValueField, RequestIdentifierField, TimestampField, \
+    SerializedOrParsedValueField, SignatureField, TieAmongField, AnyValueField, RequestIdentifierField, TimestampField, \
     LedgerIdField, MerkleRootField, Base58Field, LedgerInfoField, AnyField, ChooseField, AnyMapField, \
     LimitedLengthStringField, BlsMultiSignatureField
 from plenum.common.messages.message_base import \
@@ -31,7 +31,7 @@ class Batch(MessageBase):
     typename = BATCH
 
     schema = (
-        (f.MSGS.nm, IterableField(SerializedValueField())),
+        (f.MSGS.nm, IterableField(SerializedOrParsedValueField())),
         (f.SIG.nm, SignatureField(max_length=SIGNATURE_FIELD_LIMIT)),
     )
 
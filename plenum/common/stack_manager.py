@@ -57,7 +57,8 @@ class TxnStackManager(metaclass=ABCMeta):
                         dataDir=data_dir,
                         fileName=self.ledgerFile,
                         ensureDurability=self.config.EnsureLedgerDurability,
-                        genesis_txn_initiator=genesis_txn_initiator)
+                        genesis_txn_initiator=genesis_txn_initiator,
+                        recovery_workers=self.config.LEDGER_RECOVERY_WORKERS)
 
         return ledger
 
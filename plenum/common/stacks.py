@@ -1,8 +1,13 @@
-from typing import Callable, Any, List, Dict
+import json
+from typing import Callable, Any, List, Dict, Mapping
+
+import msgpack
 
 from plenum.common.batched import Batched, logger
 from plenum.common.config_util import getConfig
+from plenum.common.constants import BATCH, OP_FIELD_NAME
 from plenum.common.message_processor import MessageProcessor
+from plenum.common.types import f
 from stp_core.common.constants import CONNECTION_PREFIX
 from stp_core.types import HA
 from stp_zmq.kit_zstack import KITZStack
@@ -62,12 +67,51 @@ class ClientZStack(SimpleZStack, MessageProcessor):
 class NodeZStack(Batched, KITZStack):
     def __init__(self, stackParams: dict, msgHandler: Callable,
                  registry: Dict[str, HA], seed=None, sighex: str=None,
-                 config=None):
+                 config=None, binary_msgs=False):
+        """
+        :param binary_msgs: if True, messages are sent serialized with
+        msgpack, otherwise with JSON. Messages are received in both formats
+        """
         config = config or getConfig()
         Batched.__init__(self, config=config)
         KITZStack.__init__(self, stackParams, msgHandler, registry=registry,
                            seed=seed, sighex=sighex, config=config)
         MessageProcessor.__init__(self, allowDictOnly=False)
+        self.binary_msgs = binary_msgs
+
+    def serializeMsg(self, msg):
+        if not self.binary_msgs or not isinstance(msg, Mapping):
+            return super().serializeMsg(msg)
+        if msg.get(OP_FIELD_NAME) != BATCH:
+            msg = to_json_types(msg)
+        # Messages of a batch are already serialized, so they are carried
+        # as raw frames
+        return msgpack.packb(msg, use_bin_type=True)
+
+    def _make_batch(self, msgs):
+        if not self.binary_msgs or not self._should_batch(msgs):
+            return super()._make_batch(msgs)
+        # msgpack values are self-delimiting, so messages serialized with it
+        # are put in the batch as they are and are unpacked together with
+        # the batch, not parsed one by one when it is received
+        packer = msgpack.Packer(use_bin_type=True)
+        parts = [packer.pack_map_header(3),
+                 packer.pack(OP_FIELD_NAME), packer.pack(BATCH),
+                 packer.pack(f.MSGS.nm), packer.pack_array_header(len(msgs))]
+        parts.extend(msg if self._is_packed(msg) else packer.pack(msg)
+                     for msg in msgs)
+        parts.extend([packer.pack(f.SIG.nm), packer.pack(None)])
+        return b''.join(parts)
+
+    def _is_packed(self, msg):
+        return msg[:1] != b'{' and msg not in self.healthMessages
+
+    def deserializeMsg(self, msg):
+        # Serialized JSON messages are always objects, while msgpack maps
+        # never start with `{`
+        if isinstance(msg, bytes) and msg[:1] != b'{':
+            return msgpack.unpackb(msg, encoding='utf-8')
+        return super().deserializeMsg(msg)
 
     # TODO: Reconsider defaulting `reSetupAuth` to True.
     def start(self, restricted=None, reSetupAuth=True):
@@ -80,5 +124,27 @@ class NodeZStack(Batched, KITZStack):
                     extra={"tags": ["node-listening"]})
 
 
+def to_json_types(value):
+    """
+    Convert `value` to the types it would have after a round trip through
+    JSON, so messages are the same whatever format they are sent in: map keys
+    become strings, bytes are decoded and tuples become lists.
+    """
+    if isinstance(value, Mapping):
+        return {k if isinstance(k, str) else _json_key(k): to_json_types(v)
+                for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_json_types(v) for v in value]
+    if isinstance(value, bytes):
+        return value.decode()
+    return value
+
+
+def _json_key(key):
+    if isinstance(key, bytes):
+        return key.decode()
+    return json.dumps(key)
+
+
 nodeStackClass = NodeZStack
 clientStackClass = ClientZStack
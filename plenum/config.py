@@ -56,6 +56,9 @@ stateSignatureDbName = 'state_signature'
 # request id to sequence numbers
 seqNoDbName = 'seq_no_db'
 
+# Number of stewards in the domain ledger with the ledger size it covers
+stewardsCountDbName = 'stewards_count'
+
 clientBootStrategy = ClientBootStrategy.PoolTxn
 
 hashStore = {
@@ -70,6 +73,14 @@ configStateStorage = KeyValueStorageType.Leveldb
 reqIdToTxnStorage = KeyValueStorageType.Leveldb
 
 stateSignatureStorage = KeyValueStorageType.Leveldb
+stewardsCountStorage = KeyValueStorageType.Leveldb
+
+# Options of databases of the stores above which use Rocksdb, sizes in bytes
+rocksdbConfig = {
+    'block_cache_size': 64 * 1024 * 1024,
+    'bloom_filter_bits': 10,
+    'sync_writes': False,
+}
 
 DefaultPluginPath = {
     # PLUGIN_BASE_DIR_PATH: "<abs path of plugin directory can be given here,
@@ -169,6 +180,10 @@ ExpectedConnectTime = 3.3 if sys.platform == 'win32' else 2
 # repository
 EnsureLedgerDurability = False
 
+# Number of processes hashing the transaction log when the merkle tree of a
+# ledger is recovered from it on start, 0 hashes it in the node process
+LEDGER_RECOVERY_WORKERS = 0
+
 log_override_tags = dict(cli={}, demo={})
 
 
@@ -176,6 +191,26 @@ log_override_tags = dict(cli={}, demo={})
 LISTENER_MESSAGE_QUOTA = 100
 REMOTES_MESSAGE_QUOTA = 100
 
+# If True, a node sends messages to other nodes serialized with msgpack
+# instead of JSON, batches then carry the messages as raw frames. Nodes
+# receive messages in both formats, so this can be enabled only once all
+# nodes of the pool are able to receive msgpack. Clients always use JSON
+NODE_TO_NODE_BINARY_MSGS = False
+
+# Signatures of the client requests received in one pass over the client
+# stack are verified together by this many threads before the requests are
+# processed. If 0, they are verified one by one as the requests are processed
+CLIENT_SIG_VERIFICATION_WORKERS = 4
+
+# The longest time a node waits to be prodded by an event driven looper
+# when nothing is received and no action is scheduled
+NODE_MAX_IDLE_TIME = 0.1
+
+# If True, BLS signatures of COMMITs are not verified one by one when received
+# but aggregated into the multi-signature which is verified once the batch is
+# ordered. Only if it is wrong, the wrong signatures are searched for
+BLS_VERIFY_COMMIT_SIGS_IN_AGGREGATE = False
+
 # After `Max3PCBatchSize` requests or `Max3PCBatchWait`, whichever is earlier,
 # a 3 phase batch is sent
 # Max batch size for 3 phase commit
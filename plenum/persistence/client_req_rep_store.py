@@ -60,6 +60,15 @@ class ClientReqRepStore:
     def getRejects(self, identifier: str, reqId: int) -> dict:
         pass
 
+    def flush(self):
+        """
+        Persists the added messages if the store buffers them
+        """
+        pass
+
+    def close(self):
+        pass
+
     def getAllReplies(self, identifier: str, reqId: int):
         replies = self.getReplies(identifier, reqId)
         errors = self.getNacks(identifier, reqId)
@@ -0,0 +1,158 @@
+import os
+from collections import OrderedDict
+from typing import Any, List, Dict, Optional
+
+from plenum.common.constants import REQACK, REQNACK, REPLY, REJECT
+from plenum.common.has_file_storage import HasFileStorage
+from plenum.common.request import Request
+from plenum.common.txn_util import getTxnOrderedFields
+from plenum.common.types import f
+from plenum.common.util import updateFieldsWithSeqNo
+from plenum.persistence.client_req_rep_store import ClientReqRepStore
+from storage.kv_store_leveldb import KeyValueStorageLeveldb
+
+
+class ClientReqRepStoreLeveldb(ClientReqRepStore, HasFileStorage):
+    """
+    Stores requests of the client and messages received for them in one
+    leveldb database. Every message is a separate record with a key starting
+    with the key of the request, so messages of a request are read by one
+    range scan:
+    `<identifier>,<reqId>~0` - the request,
+    `<identifier>,<reqId>~<message type>~<sender>` - ACK, NACK, REJECT or
+    REPLY from the sender.
+
+    Records are written in batches on `flush`, which the client calls once
+    per prod cycle, the ones not flushed yet are read from memory.
+    """
+
+    RequestTag = '0'
+    Tags = {REQACK: 'A', REQNACK: 'N', REJECT: 'J', REPLY: 'R'}
+    LastReqIdKey = 'lastReqId'
+
+    def __init__(self, dataLocation):
+        assert dataLocation is not None
+        HasFileStorage.__init__(self, dataLocation)
+        if not os.path.exists(self.dataLocation):
+            os.makedirs(self.dataLocation)
+        self.reqStore = KeyValueStorageLeveldb(self.dataLocation,
+                                               "client_req_rep")
+        self.delimiter = '~'
+        # Records not written to the database yet
+        self._pending = OrderedDict()
+        try:
+            self._lastReqId = int(self.reqStore.get(self.LastReqIdKey))
+        except KeyError:
+            self._lastReqId = 0
+
+    @property
+    def lastReqId(self) -> int:
+        return self._lastReqId
+
+    @staticmethod
+    def create_key(idr, req_id):
+        return "{},{}".format(idr, req_id)
+
+    def _record_key(self, idr, req_id, typ, sender=None) -> str:
+        key = self.create_key(idr, req_id) + self.delimiter + typ
+        if sender is not None:
+            key += self.delimiter + sender
+        return key
+
+    def flush(self):
+        if not self._pending:
+            return
+        self._pending[self.LastReqIdKey] = str(self._lastReqId)
+        self.reqStore.setBatch(self._pending.items())
+        self._pending.clear()
+
+    def close(self):
+        self.flush()
+        self.reqStore.close()
+
+    def addRequest(self, req: Request):
+        key = self._record_key(req.identifier, req.reqId, self.RequestTag)
+        self._pending[key] = self.serializeReq(req)
+        self._lastReqId = max(self._lastReqId, req.reqId)
+
+    def _addFromSender(self, msg: Any, sender: str, typ: str, value: str):
+        key = self._record_key(msg[f.IDENTIFIER.nm], msg[f.REQ_ID.nm],
+                               self.Tags[typ], sender)
+        self._pending[key] = value
+
+    def addAck(self, msg: Any, sender: str):
+        self._addFromSender(msg, sender, REQACK, '')
+
+    def addNack(self, msg: Any, sender: str):
+        self._addFromSender(msg, sender, REQNACK, msg[f.REASON.nm])
+
+    def addReject(self, msg: Any, sender: str):
+        self._addFromSender(msg, sender, REJECT, msg[f.REASON.nm])
+
+    def addReply(self, identifier: str, reqId: int, sender: str,
+                 result: Any) -> int:
+        serializedReply = self.txnSerializer.serialize(result, toBytes=False)
+        key = self._record_key(identifier, reqId, self.Tags[REPLY], sender)
+        self._pending[key] = serializedReply
+        return len(self._getFromSenders(identifier, reqId, REPLY))
+
+    def hasRequest(self, identifier: str, reqId: int) -> bool:
+        return self._get(self._record_key(identifier, reqId,
+                                          self.RequestTag)) is not None
+
+    def getRequest(self, identifier: str, reqId: int) -> Optional[Request]:
+        serReq = self._get(self._record_key(identifier, reqId,
+                                            self.RequestTag))
+        if serReq is not None:
+            return self.deserializeReq(serReq)
+
+    def getReplies(self, identifier: str, reqId: int):
+        replies = self._getFromSenders(identifier, reqId, REPLY)
+        for sender, reply in replies.items():
+            replies[sender] = self.txnSerializer.deserialize(reply)
+        return replies
+
+    def getAcks(self, identifier: str, reqId: int) -> List[str]:
+        return list(self._getFromSenders(identifier, reqId, REQACK).keys())
+
+    def getNacks(self, identifier: str, reqId: int) -> dict:
+        return self._getFromSenders(identifier, reqId, REQNACK)
+
+    def getRejects(self, identifier: str, reqId: int) -> dict:
+        return self._getFromSenders(identifier, reqId, REJECT)
+
+    @property
+    def txnFieldOrdering(self):
+        fields = getTxnOrderedFields()
+        return updateFieldsWithSeqNo(fields)
+
+    def serializeReq(self, req: Request) -> str:
+        return self.txnSerializer.serialize(req.__getstate__(), toBytes=False)
+
+    def deserializeReq(self, serReq: str) -> Request:
+        return Request.fromState(
+            self.txnSerializer.deserialize(serReq))
+
+    def _get(self, key: str) -> Optional[str]:
+        if key in self._pending:
+            return self._pending[key]
+        try:
+            return self.reqStore.get(key).decode()
+        except KeyError:
+            return None
+
+    def _getFromSenders(self, identifier: str, reqId: int,
+                        typ: str) -> Dict[str, str]:
+        """
+        Returns messages of the given type for the request by their senders
+        """
+        prefix = self._record_key(identifier, reqId, self.Tags[typ], '')
+        # Keys are ascii, so all keys with the prefix are before the end
+        result = OrderedDict(
+            (key.decode()[len(prefix):], value.decode())
+            for key, value in self.reqStore.iterator(
+                start=prefix.encode(), end=prefix.encode() + b'\xff'))
+        for key, value in self._pending.items():
+            if key.startswith(prefix):
+                result[key[len(prefix):]] = value
+        return result
@@ -28,9 +28,14 @@ class Storage(ABC):
 
 
 def initKeyValueStorage(keyValueType, dataLocation,
-                        keyValueStorageName) -> KeyValueStorage:
+                        keyValueStorageName, db_config=None) -> KeyValueStorage:
     if keyValueType == KeyValueStorageType.Leveldb:
         return KeyValueStorageLeveldb(dataLocation, keyValueStorageName)
+    elif keyValueType == KeyValueStorageType.Rocksdb:
+        # Rocksdb is an optional dependency
+        from storage.kv_store_rocksdb import KeyValueStorageRocksdb
+        return KeyValueStorageRocksdb(dataLocation, keyValueStorageName,
+                                      db_config=db_config)
     elif keyValueType == KeyValueStorageType.Memory:
         return KeyValueStorageInMemory()
     else:
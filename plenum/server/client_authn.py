@@ -2,6 +2,7 @@
 Clients are authenticated with a digital signature.
 """
 from abc import abstractmethod
+from collections import OrderedDict
 from typing import Dict
 
 import base58
@@ -54,6 +55,26 @@ class ClientAuthNr:
         correct; a SigningException is raised if threshold was not met
         """
 
+    def verify_in_bulk(self, reqs, executor=None):
+        """
+        Verify the signatures of many requests at once so that authenticating
+        any of them afterwards does not need to verify its signatures again.
+        Does nothing by default.
+
+        :param reqs: requests as dictionaries
+        :param executor: optional `concurrent.futures.Executor` to verify the
+        signatures with
+        """
+
+    def forget(self, req_data):
+        """
+        Forget that the signatures of the request were verified, so they are
+        verified again if the request is authenticated later. Does nothing by
+        default.
+
+        :param req_data: request as a dictionary
+        """
+
     @abstractmethod
     def addIdr(self, identifier, verkey, role=None):
         """
@@ -78,6 +99,24 @@ class ClientAuthNr:
 
 
 class NaclAuthNr(ClientAuthNr):
+    # Number of verified signatures remembered
+    VERIFIED_SIGS_CACHE_SIZE = 1000
+    # Number of identifiers whose verifiers are remembered
+    VERIFIERS_CACHE_SIZE = 1000
+
+    def __init__(self):
+        # The same request is authenticated when received from the client
+        # and then in PROPAGATEs from each node, so signatures verified
+        # for a payload are remembered to not verify them again. Key is a
+        # tuple of verifier, identifier, signature and payload
+        self._verified_sigs = OrderedDict()
+        # Lookups of signatures to verify in `_verified_sigs`
+        self.hits = 0
+        self.misses = 0
+        # Verifiers of the identifiers which sent requests recently, so
+        # their verkeys do not need to be looked up and decoded for each
+        # request. Must be forgotten when the verkey of an identifier changes
+        self._verifiers = OrderedDict()
 
     def authenticate_multi(self, msg: Dict, signatures: Dict[str, str],
                            threshold: int=None, verifier: Verifier=DidVerifier):
@@ -89,20 +128,7 @@ class NaclAuthNr(ClientAuthNr):
             threshold = num_sigs
         correct_sigs_from = []
         for idr, sig in signatures.items():
-            try:
-                sig = base58.b58decode(sig)
-            except Exception as ex:
-                raise InvalidSignatureFormat from ex
-
-            ser = self.serializeForSig(msg, identifier=idr)
-            verkey = self.getVerkey(idr)
-
-            if verkey is None:
-                raise CouldNotAuthenticate(
-                    'Can not find verkey for {}'.format(idr))
-
-            vr = verifier(verkey, identifier=idr)
-            if vr.verify(sig, ser):
+            if self._verify(*self._sig_to_verify(msg, idr, sig, verifier)):
                 correct_sigs_from.append(idr)
                 if len(correct_sigs_from) == threshold:
                     break
@@ -111,6 +137,111 @@ class NaclAuthNr(ClientAuthNr):
                                                 threshold)
         return correct_sigs_from
 
+    def _sig_to_verify(self, msg, identifier, sig, verifier):
+        """
+        :return: tuple of verifier instance, identifier, decoded signature and
+        serialized `msg` which are needed to verify `sig`
+        """
+        try:
+            sig = base58.b58decode(sig)
+        except Exception as ex:
+            raise InvalidSignatureFormat from ex
+
+        ser = self.serializeForSig(msg, identifier=identifier)
+        return self._get_verifier(verifier, identifier), identifier, sig, ser
+
+    def _get_verifier(self, verifier, identifier):
+        vr = self._verifiers.get(identifier)
+        if vr is not None and type(vr) is verifier:
+            self._verifiers.move_to_end(identifier)
+            return vr
+
+        verkey = self.getVerkey(identifier)
+        if verkey is None:
+            raise CouldNotAuthenticate(
+                'Can not find verkey for {}'.format(identifier))
+        vr = verifier(verkey, identifier=identifier)
+        self._verifiers[identifier] = vr
+        if len(self._verifiers) > self.VERIFIERS_CACHE_SIZE:
+            self._verifiers.popitem(last=False)
+        return vr
+
+    def forget_identifier(self, identifier):
+        """
+        Forget the verifier of the identifier and the signatures verified
+        with it, should be called when its verkey changes
+        """
+        self._verifiers.pop(identifier, None)
+        keys = [key for key in self._verified_sigs if key[1] == identifier]
+        for key in keys:
+            del self._verified_sigs[key]
+
+    def forget_sigs(self, msg: Dict, signatures: Dict[str, str],
+                    verifier: Verifier=DidVerifier):
+        """
+        Forget that the signatures of `msg` were verified
+
+        :param signatures: A mapping from identifiers to signatures.
+        """
+        for idr, sig in signatures.items():
+            # Signatures can only be remembered with the current verifier
+            # of the identifier
+            vr = self._verifiers.get(idr)
+            if vr is None or type(vr) is not verifier:
+                continue
+            try:
+                sig = base58.b58decode(sig)
+            except Exception:
+                continue
+            ser = self.serializeForSig(msg, identifier=idr)
+            self._verified_sigs.pop((vr, idr, sig, ser), None)
+
+    @property
+    def hit_rate(self):
+        """
+        Share of the signatures to verify which were found verified before
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0
+
+    @staticmethod
+    def _check_sig(key):
+        vr, identifier, sig, ser = key
+        return vr.verify(sig, ser)
+
+    def _verify(self, vr, identifier, sig, ser):
+        key = (vr, identifier, sig, ser)
+        if key in self._verified_sigs:
+            self._verified_sigs.move_to_end(key)
+            self.hits += 1
+            return True
+        self.misses += 1
+        if not self._check_sig(key):
+            return False
+        self._remember_verified(key)
+        return True
+
+    def _remember_verified(self, key):
+        self._verified_sigs[key] = None
+        if len(self._verified_sigs) > self.VERIFIED_SIGS_CACHE_SIZE:
+            self._verified_sigs.popitem(last=False)
+
+    def _verify_in_bulk(self, keys, executor=None):
+        """
+        Verify the signatures given as tuples returned by `_sig_to_verify`
+        and remember the correct ones. The checks are independent of each
+        other, so they are spread over `executor` if given; the verification
+        itself is done by libsodium which releases the GIL.
+        """
+        keys = [key for key in set(keys) if key not in self._verified_sigs]
+        if executor is None or len(keys) < 2:
+            results = map(self._check_sig, keys)
+        else:
+            results = executor.map(self._check_sig, keys)
+        for key, verified in zip(keys, results):
+            if verified:
+                self._remember_verified(key)
+
     @abstractmethod
     def addIdr(self, identifier, verkey, role=None):
         pass
@@ -131,6 +262,7 @@ class SimpleAuthNr(NaclAuthNr):
     """
 
     def __init__(self, state=None):
+        NaclAuthNr.__init__(self)
         # key: some identifier, value: verification key
         self.clients = {}  # type: Dict[str, Dict]
         self.state = state
@@ -139,6 +271,7 @@ class SimpleAuthNr(NaclAuthNr):
         if identifier in self.clients:
             # raise RuntimeError("client already added")
             logger.debug("client already added")
+        self.forget_identifier(identifier)
         self.clients[identifier] = {
             VERKEY: verkey,
             ROLE: role
@@ -215,6 +348,38 @@ class CoreAuthMixin:
         :param verifier:
         :return:
         """
+        to_serialize, signatures = self._signed_data(req_data, identifier,
+                                                     signature)
+        return self.authenticate_multi(to_serialize,
+                                       signatures=signatures, verifier=verifier)
+
+    def verify_in_bulk(self, reqs, executor=None,
+                       verifier: Verifier=DidVerifier):
+        keys = []
+        for req_data in reqs:
+            try:
+                to_serialize, signatures = self._signed_data(req_data)
+                keys.extend(self._sig_to_verify(to_serialize, idr, sig,
+                                                verifier)
+                            for idr, sig in signatures.items())
+            except Exception:
+                # The error is raised when the request is authenticated
+                continue
+        self._verify_in_bulk(keys, executor)
+
+    def forget(self, req_data, verifier: Verifier=DidVerifier):
+        try:
+            to_serialize, signatures = self._signed_data(req_data)
+        except Exception:
+            return
+        self.forget_sigs(to_serialize, signatures, verifier=verifier)
+
+    def _signed_data(self, req_data, identifier: str=None,
+                     signature: str=None):
+        """
+        :return: tuple of the part of the request which is signed and the
+        mapping of identifiers to their signatures
+        """
         to_serialize = {k: v for k, v in req_data.items()
                         if k not in self.excluded_from_signing}
         if req_data.get(f.SIG.nm) is None and \
@@ -238,8 +403,7 @@ class CoreAuthMixin:
                 raise ex
         else:
             signatures = req_data[f.SIGS.nm]
-        return self.authenticate_multi(to_serialize,
-                                       signatures=signatures, verifier=verifier)
+        return to_serialize, signatures
 
     def serializeForSig(self, msg, identifier=None, topLevelKeysToIgnore=None):
         if not msg.get(f.IDENTIFIER.nm):
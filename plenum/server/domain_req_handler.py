@@ -1,5 +1,7 @@
 from hashlib import sha256
+from typing import List
 
+from common.error import error
 from common.serializers.serialization import domain_state_serializer, \
     proof_nodes_serializer, state_roots_serializer
 from ledger.util import F
@@ -21,11 +23,33 @@ class DomainRequestHandler(RequestHandler):
     stateSerializer = domain_state_serializer
     write_types = {NYM, }
 
-    def __init__(self, ledger, state, config, reqProcessors, bls_store):
+    stewardsCountKey = b'stewards_count'
+
+    def __init__(self, ledger, state, config, reqProcessors, bls_store,
+                 stewards_count_store=None):
         super().__init__(ledger, state)
         self.config = config
         self.reqProcessors = reqProcessors
         self.bls_store = bls_store
+        # Number of NYM txns adding a STEWARD in the first
+        # `_stewardsCountedSize` txns of the committed ledger and in the
+        # uncommitted ledger, counted by `initStewardsCount` when the node
+        # starts and then kept up to date as txns are applied, committed
+        # and reverted
+        self._committedStewardsCount = None
+        self._stewardsCountedSize = 0
+        self._uncommittedStewardsCount = None
+        # Keeps the committed count with the ledger size it covers, so
+        # the ledger is not counted again when the node starts
+        self.stewards_count_store = stewards_count_store
+        # Called with a nym when its verkey changes in state, also when the
+        # change is reverted
+        self._verkeyListeners = []
+        # Nyms whose verkeys are changed by uncommitted txns
+        self._uncommittedVerkeyNyms = set()
+
+    def register_verkey_listener(self, listener):
+        self._verkeyListeners.append(listener)
 
     def doStaticValidation(self, request: Request):
         pass
@@ -83,24 +107,112 @@ class DomainRequestHandler(RequestHandler):
             logger.debug(
                 'Cannot apply request of type {} to state'.format(typ))
 
-    def countStewards(self) -> int:
+    @staticmethod
+    def isStewardTxn(txn) -> bool:
+        return txn[TXN_TYPE] == NYM and txn.get(ROLE) == STEWARD
+
+    def initStewardsCount(self):
         """
-        Count the number of stewards added to the pool transaction store
-        Note: This is inefficient, a production use case of this function
-        should require an efficient storage mechanism
+        Count the stewards added to the domain ledger. Starts from the
+        stored count and counts only the txns of the ledger it does not
+        cover, the count is updated as NYM txns are applied and committed
+        after that
         """
-        # THIS SHOULD NOT BE DONE FOR PRODUCTION
-        return sum(1 for _, txn in self.ledger.getAllTxn() if
-                   (txn[TXN_TYPE] == NYM) and (txn.get(ROLE) == STEWARD))
+        self._committedStewardsCount, self._stewardsCountedSize = \
+            self._storedStewardsCount()
+        self._countCommittedStewards()
+        self._countUncommittedStewards()
+
+    def countStewards(self, isCommitted=True) -> int:
+        """
+        Count the number of stewards added to the domain ledger
+        """
+        if self._committedStewardsCount is None:
+            error('Stewards are not counted yet', RuntimeError)
+        # Txns can be added to the committed ledger by catchup too
+        self._countCommittedStewards()
+        if isCommitted:
+            return self._committedStewardsCount
+        return self._committedStewardsCount + self._uncommittedStewardsCount
+
+    def _storedStewardsCount(self):
+        if self.stewards_count_store is None or \
+                self.stewardsCountKey not in self.stewards_count_store:
+            return 0, 0
+        count, size = map(int, self.stewards_count_store.get(
+            self.stewardsCountKey).split(b':'))
+        if size > self.ledger.size:
+            # The ledger is not the one counted
+            return 0, 0
+        return count, size
+
+    def _countCommittedStewards(self, txns=None):
+        """
+        Count the stewards in the committed txns not counted yet and store
+        the count
+
+        :param txns: the last committed txns if they are the only ones not
+        counted, otherwise the txns are read from the ledger
+        """
+        size = self.ledger.size
+        if self._stewardsCountedSize == size:
+            return
+        if txns is None or self._stewardsCountedSize + len(txns) != size:
+            txns = (txn for _, txn in self.ledger.getAllTxn(
+                frm=self._stewardsCountedSize + 1))
+        self._committedStewardsCount += sum(
+            1 for txn in txns if self.isStewardTxn(txn))
+        self._stewardsCountedSize = size
+        if self.stewards_count_store is not None:
+            self.stewards_count_store.put(
+                self.stewardsCountKey,
+                '{}:{}'.format(self._committedStewardsCount, size))
+
+    def _countUncommittedStewards(self):
+        self._uncommittedStewardsCount = sum(
+            1 for txn in self.ledger.uncommittedTxns if self.isStewardTxn(txn))
 
     def stewardThresholdExceeded(self, config) -> bool:
         """We allow at most `stewardThreshold` number of  stewards to be added
         by other stewards"""
         return self.countStewards() > config.stewardThreshold
 
+    def commit(self, txnCount, stateRoot, txnRoot) -> List:
+        committedTxns = super().commit(txnCount, stateRoot, txnRoot)
+        if self._committedStewardsCount is not None:
+            self._countCommittedStewards(committedTxns)
+            self._uncommittedStewardsCount -= sum(
+                1 for txn in committedTxns if self.isStewardTxn(txn))
+        if self._uncommittedVerkeyNyms:
+            self._uncommittedVerkeyNyms = self._nymsWithUncommittedVerkeys()
+        return committedTxns
+
+    def onBatchRejected(self):
+        super().onBatchRejected()
+        # The txns of the rejected batch are already discarded from ledger
+        if self._committedStewardsCount is not None:
+            self._countUncommittedStewards()
+        for nym in self._uncommittedVerkeyNyms:
+            self._verkeyChanged(nym)
+        self._uncommittedVerkeyNyms = self._nymsWithUncommittedVerkeys()
+
+    def _nymsWithUncommittedVerkeys(self):
+        return {txn.get(TARGET_NYM) for txn in self.ledger.uncommittedTxns
+                if txn.get(TXN_TYPE) == NYM and VERKEY in txn}
+
+    def _verkeyChanged(self, nym):
+        for listener in self._verkeyListeners:
+            listener(nym)
+
     def updateNym(self, nym, txn, isCommitted=True):
+        # Committed txns are counted from the ledger
+        if self._committedStewardsCount is not None and \
+                not isCommitted and self.isStewardTxn(txn):
+            self._uncommittedStewardsCount += 1
         existingData = self.getNymDetails(self.state, nym,
                                           isCommitted=isCommitted)
+        verkeyChanged = VERKEY in txn and \
+            existingData.get(VERKEY) != txn[VERKEY]
         newData = {}
         if not existingData:
             # New nym being added to state, set the TrustAnchor
@@ -122,6 +234,10 @@ class DomainRequestHandler(RequestHandler):
         val = self.stateSerializer.serialize(existingData)
         key = self.nym_to_state_key(nym)
         self.state.set(key, val)
+        if verkeyChanged:
+            if not isCommitted:
+                self._uncommittedVerkeyNyms.add(nym)
+            self._verkeyChanged(nym)
         return existingData
 
     def hasNym(self, nym, isCommitted: bool=True):
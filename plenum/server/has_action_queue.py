@@ -1,3 +1,4 @@
+import heapq
 import time
 from collections import deque
 from functools import wraps
@@ -14,11 +15,17 @@ class HasActionQueue:
         # holds a deque of Callables; use functools.partial if the callable
         # needs arguments
         self.actionQueue = deque()
-        self.aqStash = deque()
-        self.aqNextCheck = float('inf')  # next time to check
+        # heap of (time, action id, Callable) of the delayed actions, the
+        # entries of cancelled actions are removed when they reach the top
+        # of the heap or when there are too many of them
+        self.aqStash = []
+        self.aqCancelled = 0  # cancelled entries which can be in aqStash
         self.aid = 0  # action id
         self.repeatingActions = set()
+        # action -> set of ids of its scheduled events
         self.scheduled = dict()
+        # action id -> action, for the scheduled events not run or cancelled
+        self.scheduledIds = dict()
 
     def _schedule(self, action: Callable, seconds: int=0) -> int:
         """
@@ -30,20 +37,19 @@ class HasActionQueue:
         self.aid += 1
         if seconds > 0:
             nxt = time.perf_counter() + seconds
-            if nxt < self.aqNextCheck:
-                self.aqNextCheck = nxt
             logger.trace("{} scheduling action {} with id {} to run in {} "
                          "seconds".format(self, get_func_name(action),
                                           self.aid, seconds))
-            self.aqStash.append((nxt, (action, self.aid)))
+            heapq.heappush(self.aqStash, (nxt, self.aid, action))
         else:
             logger.trace("{} scheduling action {} with id {} to run now".
                          format(self, get_func_name(action), self.aid))
             self.actionQueue.append((action, self.aid))
 
         if action not in self.scheduled:
-            self.scheduled[action] = []
-        self.scheduled[action].append(self.aid)
+            self.scheduled[action] = set()
+        self.scheduled[action].add(self.aid)
+        self.scheduledIds[self.aid] = action
 
         return self.aid
 
@@ -58,18 +64,57 @@ class HasActionQueue:
         """
         if action is not None:
             if action in self.scheduled:
+                aids = self.scheduled.pop(action)
                 logger.trace("{} cancelling all events for action {}, ids: {}"
-                             "".format(self, action, self.scheduled[action]))
-                self.scheduled[action].clear()
+                             "".format(self, action, aids))
+                for aid in aids:
+                    del self.scheduledIds[aid]
+                self._stashCancelled(len(aids))
         elif aid is not None:
-            for action, aids in self.scheduled.items():
-                try:
-                    aids.remove(aid)
-                except ValueError:
-                    pass
-                else:
-                    logger.trace("{} cancelled action {} with id {}".format(self, action, aid))
-                    break
+            action = self.scheduledIds.pop(aid, None)
+            if action is not None:
+                self._unschedule(action, aid)
+                logger.trace("{} cancelled action {} with id {}".format(self, action, aid))
+                self._stashCancelled(1)
+
+    def _unschedule(self, action: Callable, aid: int):
+        aids = self.scheduled[action]
+        aids.discard(aid)
+        if not aids:
+            del self.scheduled[action]
+
+    def _stashCancelled(self, count: int):
+        """
+        Remove the entries of cancelled actions from the stash once they
+        are more than the entries of actions still to run, so cancelling
+        does not need to search the stash and it does not keep growing
+        """
+        self.aqCancelled += count
+        if self.aqCancelled > len(self.aqStash) // 2:
+            self.aqStash = [d for d in self.aqStash
+                            if d[1] in self.scheduledIds]
+            heapq.heapify(self.aqStash)
+            self.aqCancelled = 0
+
+    def _clearActions(self):
+        """
+        Drop all the actions scheduled to run now or later
+        """
+        self.actionQueue.clear()
+        self.aqStash.clear()
+        self.aqCancelled = 0
+        self.scheduled.clear()
+        self.scheduledIds.clear()
+
+    def _nextActionTime(self) -> float:
+        """
+        Time when the earliest delayed action is due, infinity if there are
+        no delayed actions.
+        """
+        while self.aqStash and self.aqStash[0][1] not in self.scheduledIds:
+            heapq.heappop(self.aqStash)
+            self.aqCancelled = max(0, self.aqCancelled - 1)
+        return self.aqStash[0][0] if self.aqStash else float('inf')
 
     def _serviceActions(self) -> int:
         """
@@ -79,22 +124,18 @@ class HasActionQueue:
         """
         if self.aqStash:
             tm = time.perf_counter()
-            if tm > self.aqNextCheck:
-                earliest = float('inf')
-                for d in list(self.aqStash):
-                    nxt, action = d
-                    if tm > nxt:
-                        self.actionQueue.appendleft(action)
-                        self.aqStash.remove(d)
-                    if nxt < earliest:
-                        earliest = nxt
-                self.aqNextCheck = earliest
+            due = []
+            while self._nextActionTime() < tm:
+                _, aid, action = heapq.heappop(self.aqStash)
+                due.append((action, aid))
+            # Delayed actions run before the ones scheduled to run now, in
+            # the order they were due
+            self.actionQueue.extendleft(reversed(due))
         count = len(self.actionQueue)
         while self.actionQueue:
             action, aid = self.actionQueue.popleft()
-            assert action in self.scheduled
-            if aid in self.scheduled[action]:
-                self.scheduled[action].remove(aid)
+            if self.scheduledIds.pop(aid, None) is not None:
+                self._unschedule(action, aid)
                 logger.trace("{} running action {} with id {}".
                              format(self, get_func_name(action), aid))
                 action()
@@ -103,6 +144,15 @@ class HasActionQueue:
                              format(self, get_func_name(action), aid))
         return count
 
+    def _timeToNextAction(self) -> float:
+        """
+        Time until the next scheduled action is due, 0 if there are actions
+        to run now and infinity if there are no actions.
+        """
+        if self.actionQueue:
+            return 0
+        return max(0, self._nextActionTime() - time.perf_counter())
+
     def startRepeating(self, action: Callable, seconds: int):
         @wraps(action)
         def wrapper():
@@ -1,12 +1,13 @@
 import time
+from collections import deque
 from datetime import datetime
-from operator import itemgetter
 from statistics import mean
 from typing import Dict, Iterable, Optional, Set
 from typing import List
 from typing import Tuple
 
 import psutil
+from sortedcontainers import SortedList
 
 from plenum.common.config_util import getConfig
 from plenum.common.constants import MONITORING_PREFIX
@@ -44,7 +45,12 @@ class Monitor(HasActionQueue, PluginLoaderHelper):
                  blacklister: Blacklister, nodeInfo: Dict,
                  notifierEventTriggeringConfig: Dict,
                  pluginPaths: Iterable[str]=None,
-                 notifierEventsEnabled: bool = True):
+                 notifierEventsEnabled: bool = True,
+                 clientAuthNr=None):
+        """
+        :param clientAuthNr: authenticator of client requests which caches
+        verified signatures, the hit rate of its cache is reported
+        """
         self.name = name
         self.instances = instances
         self.nodestack = nodestack
@@ -52,6 +58,7 @@ class Monitor(HasActionQueue, PluginLoaderHelper):
         self.nodeInfo = nodeInfo
         self.notifierEventTriggeringConfig = notifierEventTriggeringConfig
         self.notifierEventsEnabled = notifierEventsEnabled
+        self.clientAuthNr = clientAuthNr
 
         self.Delta = Delta
         self.Lambda = Lambda
@@ -67,6 +74,11 @@ class Monitor(HasActionQueue, PluginLoaderHelper):
         # protocol instance
         self.numOrderedRequests = []  # type: List[Tuple[int, int]]
 
+        # Numbers of ordered requests of all replicas (the first items of
+        # `numOrderedRequests`) kept sorted, so the smallest one is known
+        # without scanning all instances
+        self._ordered_requests_counts = SortedList()
+
         # Requests that have been sent for ordering. Key of the dictionary is a
         # tuple of client id and request id and the value is the time at which
         # the request was submitted for ordering
@@ -75,6 +87,16 @@ class Monitor(HasActionQueue, PluginLoaderHelper):
         # Contains keys of ordered requests
         self.ordered_requests_keys = set()  # type: Set[Tuple[str, int]]
 
+        # Times at which ordering of requests started in the order of
+        # `requestUnOrdered` calls, used to clean up `ordered_requests_keys`
+        # once requests are out of the window of the unordered requests check
+        self._ordering_started_queue = deque()  # type: deque
+
+        # Times at which ordering of requests not yet ordered by master
+        # started, sorted. Used to check for many unordered requests without
+        # going over all requests
+        self._unordered_started_at = SortedList()
+
         # Request latencies for the master protocol instances. Key of the
         # dictionary is a tuple of client id and request id and the value is
         # the time the master instance took for ordering it
@@ -172,6 +194,9 @@ class Monitor(HasActionQueue, PluginLoaderHelper):
             ("total requests", self.totalRequests),
             ("avg backup throughput", backupThrp),
             ("master throughput ratio", r)]
+        if self.clientAuthNr is not None:
+            m.append(("client signatures cache hit rate",
+                      self.clientAuthNr.hit_rate))
         return m
 
     @property
@@ -195,8 +220,11 @@ class Monitor(HasActionQueue, PluginLoaderHelper):
         logger.debug("{}'s Monitor being reset".format(self))
         num_instances = len(self.instances.started)
         self.numOrderedRequests = [(0, 0)] * num_instances
+        self._ordered_requests_counts = SortedList([0] * num_instances)
         self.requestOrderingStarted = {}
         self.ordered_requests_keys.clear()
+        self._ordering_started_queue.clear()
+        self._unordered_started_at.clear()
         self.masterReqLatencies = {}
         self.masterReqLatencyTooHigh = False
         self.clientAvgReqLatencies = [{} for _ in self.instances.started]
@@ -209,6 +237,7 @@ class Monitor(HasActionQueue, PluginLoaderHelper):
         """
         self.instances.add()
         self.numOrderedRequests.append((0, 0))
+        self._ordered_requests_counts.add(0)
         self.clientAvgReqLatencies.append({})
 
     def removeInstance(self, index=None):
@@ -216,6 +245,8 @@ class Monitor(HasActionQueue, PluginLoaderHelper):
             if index is None:
                 index = self.instances.count - 1
             self.instances.remove(index)
+            self._ordered_requests_counts.discard(
+                self.numOrderedRequests[index][0])
             del self.numOrderedRequests[index]
             del self.clientAvgReqLatencies[index]
 
@@ -235,10 +266,13 @@ class Monitor(HasActionQueue, PluginLoaderHelper):
                     "but it was from a previous view".
                     format(identifier, reqId))
                 continue
-            duration = now - self.requestOrderingStarted[(identifier, reqId)]
+            started_at = self.requestOrderingStarted[(identifier, reqId)]
+            duration = now - started_at
             if byMaster:
                 self.masterReqLatencies[(identifier, reqId)] = duration
-                self.ordered_requests_keys.add((identifier, reqId))
+                if (identifier, reqId) not in self.ordered_requests_keys:
+                    self.ordered_requests_keys.add((identifier, reqId))
+                    self._unordered_started_at.discard(started_at)
                 self.orderedRequestsInLast.append(now)
                 self.latenciesByMasterInLast.append((now, duration))
             else:
@@ -261,10 +295,11 @@ class Monitor(HasActionQueue, PluginLoaderHelper):
         orderedNow = len(durations)
         self.numOrderedRequests[instId] = (reqs + orderedNow,
                                            tm + sum(durations.values()))
+        if orderedNow:
+            self._ordered_requests_counts.discard(reqs)
+            self._ordered_requests_counts.add(reqs + orderedNow)
 
-        # TODO: Inefficient, as on every request a minimum of a large list is
-        # calculated
-        if min(r[0] for r in self.numOrderedRequests) == (reqs + orderedNow):
+        if self._ordered_requests_counts[0] == (reqs + orderedNow):
             # If these requests is ordered by the last instance then increment
             # total requests, but why is this important, why cant is ordering
             # by master not enough?
@@ -279,28 +314,47 @@ class Monitor(HasActionQueue, PluginLoaderHelper):
         """
         Record the time at which request ordering started.
         """
-        self.requestOrderingStarted[(identifier, reqId)] = time.perf_counter()
+        key = (identifier, reqId)
+        now = time.perf_counter()
+        if key not in self.ordered_requests_keys:
+            if key in self.requestOrderingStarted:
+                self._unordered_started_at.discard(
+                    self.requestOrderingStarted[key])
+            self._unordered_started_at.add(now)
+        self.requestOrderingStarted[key] = now
+        self._ordering_started_queue.append((now, key))
         self.warn_has_lot_unordered_requests()
 
     def warn_has_lot_unordered_requests(self):
-        unordered_started_at = []
         now = time.perf_counter()
-        sorted_by_started_at = sorted(self.requestOrderingStarted.items(), key=itemgetter(1))
-        for key, started_at in sorted_by_started_at:
-            in_window = (now - started_at) < self.WARN_NOT_PARTICIPATING_WINDOW_MINS * 60
-            if in_window and key not in self.ordered_requests_keys:
-                    dt = (started_at - unordered_started_at[-1]) if unordered_started_at else None
-                    if dt is None or dt > self.WARN_NOT_PARTICIPATING_MIN_DIFF_SEC:
-                        unordered_started_at.append(started_at)
-            elif not in_window and key in self.ordered_requests_keys:
-                self.ordered_requests_keys.remove(key)
-
-        if len(unordered_started_at) >= self.WARN_NOT_PARTICIPATING_UNORDERED_NUM:
+        window_start = now - self.WARN_NOT_PARTICIPATING_WINDOW_MINS * 60
+
+        # Forget ordered requests which are out of the window
+        queue = self._ordering_started_queue
+        while queue and queue[0][0] <= window_start:
+            started_at, key = queue.popleft()
+            if self.requestOrderingStarted.get(key) == started_at:
+                self.ordered_requests_keys.discard(key)
+
+        started_ats = self._unordered_started_at
+        del started_ats[:started_ats.bisect_right(window_start)]
+
+        # Count unordered requests in the window which started at least
+        # `WARN_NOT_PARTICIPATING_MIN_DIFF_SEC` after the previous counted
+        # one, jumping from one such request to the next one
+        unordered_count = 0
+        idx = 0
+        while idx < len(started_ats):
+            unordered_count += 1
+            idx = started_ats.bisect_right(
+                started_ats[idx] + self.WARN_NOT_PARTICIPATING_MIN_DIFF_SEC)
+
+        if unordered_count >= self.WARN_NOT_PARTICIPATING_UNORDERED_NUM:
             logger.warning('It looks like {} does not participate in processing messages '
                            'because it has {} unordered requests '
                            'in the last {} minutes (assumed that minimum difference between unordered '
                            'requests is at least {} seconds)'
-                           .format(self, len(unordered_started_at),
+                           .format(self, unordered_count,
                                    self.WARN_NOT_PARTICIPATING_WINDOW_MINS,
                                    self.WARN_NOT_PARTICIPATING_MIN_DIFF_SEC))
             return True
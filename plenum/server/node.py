@@ -3,6 +3,7 @@ import os
 import time
 from binascii import unhexlify
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import closing
 from functools import partial
 from typing import Dict, Any, Mapping, Iterable, List, Optional, Set, Tuple, Callable
@@ -27,7 +28,7 @@ from plenum.common.constants import POOL_LEDGER_ID, DOMAIN_LEDGER_ID, \
     OP_FIELD_NAME, CATCH_UP_PREFIX, NYM, \
     GET_TXN, DATA, TXN_TIME, VERKEY, \
     TARGET_NYM, ROLE, STEWARD, TRUSTEE, ALIAS, \
-    NODE_IP, BLS_PREFIX, NodeHooks
+    NODE_IP, BLS_PREFIX, NodeHooks, BATCH
 from plenum.common.exceptions import SuspiciousNode, SuspiciousClient, \
     MissingNodeOp, InvalidNodeOp, InvalidNodeMsg, InvalidClientMsgType, \
     InvalidClientRequest, BaseExc, \
@@ -64,7 +65,8 @@ from plenum.persistence.req_id_to_txn import ReqIdrToTxn
 from plenum.persistence.storage import Storage, initStorage, initKeyValueStorage
 from plenum.server.blacklister import Blacklister
 from plenum.server.blacklister import SimpleBlacklister
-from plenum.server.client_authn import ClientAuthNr, SimpleAuthNr, CoreAuthNr
+from plenum.server.client_authn import ClientAuthNr, SimpleAuthNr, \
+    CoreAuthNr, NaclAuthNr
 from plenum.server.config_req_handler import ConfigReqHandler
 from plenum.server.domain_req_handler import DomainRequestHandler
 from plenum.server.gossiper import Gossipper
@@ -190,10 +192,12 @@ class Node(HasActionQueue, Motor, Propagator, MessageProcessor, HasFileStorage,
         # init before domain req handler!
         self.bls_bft = self._create_bls_bft()
 
+        self.stewardsCountDB = self.loadStewardsCountDB()
         self.register_req_handler(DOMAIN_LEDGER_ID, self.getDomainReqHandler())
         self.register_executer(DOMAIN_LEDGER_ID, self.executeDomainTxns)
 
         self.initDomainState()
+        self.get_req_handler(DOMAIN_LEDGER_ID).initStewardsCount()
 
         self.clientAuthNr = clientAuthNr or self.defaultAuthNr()
 
@@ -208,16 +212,22 @@ class Node(HasActionQueue, Motor, Propagator, MessageProcessor, HasFileStorage,
         self.nodeReg = self.poolManager.nodeReg
 
         kwargs = dict(stackParams=self.poolManager.nstack,
-                      msgHandler=self.handleOneNodeMsg, registry=self.nodeReg)
+                      msgHandler=self.handleOneNodeMsg, registry=self.nodeReg,
+                      binary_msgs=self.config.NODE_TO_NODE_BINARY_MSGS)
         cls = self.nodeStackClass
         kwargs.update(seed=seed)
         # noinspection PyCallingNonCallable
         self.nodestack = cls(**kwargs)
         self.nodestack.onConnsChanged = self.onConnsChanged
 
+        # Messages received by the client stack in the current pass, they are
+        # handled once their signatures are verified together
+        self.receivedClientMsgs = []
+        self._sigVerificationExecutor = None
+
         kwargs = dict(
             stackParams=self.poolManager.cstack,
-            msgHandler=self.handleOneClientMsg,
+            msgHandler=self.receivedClientMsgs.append,
             # TODO, Reject is used when dynamic validation fails, use Reqnack
             msgRejectHandler=self.reject_client_msg_handler)
         cls = self.clientStackClass
@@ -230,7 +240,7 @@ class Node(HasActionQueue, Motor, Propagator, MessageProcessor, HasFileStorage,
 
         HasActionQueue.__init__(self)
 
-        Propagator.__init__(self)
+        Propagator.__init__(self, on_request_removed=self.forgetAuthenticated)
 
         MessageReqProcessor.__init__(self)
 
@@ -267,7 +277,8 @@ class Node(HasActionQueue, Motor, Propagator, MessageProcessor, HasFileStorage,
                                nodeInfo=self.nodeInfo,
                                notifierEventTriggeringConfig=self.config.notifierEventTriggeringConfig,
                                pluginPaths=pluginPaths,
-                               notifierEventsEnabled=self.config.SpikeEventsEnabled)
+                               notifierEventsEnabled=self.config.SpikeEventsEnabled,
+                               clientAuthNr=self.sigCachingAuthNr)
 
         self.replicas = self.create_replicas()
 
@@ -459,14 +470,16 @@ class Node(HasActionQueue, Motor, Propagator, MessageProcessor, HasFileStorage,
         return Ledger(CompactMerkleTree(hashStore=hashStore),
                       dataDir=self.dataLocation,
                       fileName=self.config.configTransactionsFile,
-                      ensureDurability=self.config.EnsureLedgerDurability)
+                      ensureDurability=self.config.EnsureLedgerDurability,
+                      recovery_workers=self.config.LEDGER_RECOVERY_WORKERS)
 
     def loadConfigState(self):
         return PruningState(
             initKeyValueStorage(
                 self.config.configStateStorage,
                 self.dataLocation,
-                self.config.configStateDbName)
+                self.config.configStateDbName,
+                db_config=self.config.rocksdbConfig)
         )
 
     def initConfigState(self):
@@ -591,14 +604,23 @@ class Node(HasActionQueue, Motor, Propagator, MessageProcessor, HasFileStorage,
                                     self.states[DOMAIN_LEDGER_ID],
                                     self.config,
                                     self.reqProcessors,
-                                    self.bls_bft.bls_store)
+                                    self.bls_bft.bls_store,
+                                    self.stewardsCountDB)
+
+    def loadStewardsCountDB(self):
+        return initKeyValueStorage(
+            self.config.stewardsCountStorage,
+            self.dataLocation,
+            self.config.stewardsCountDbName,
+            db_config=self.config.rocksdbConfig)
 
     def loadSeqNoDB(self):
         return ReqIdrToTxn(
             initKeyValueStorage(
                 self.config.reqIdToTxnStorage,
                 self.dataLocation,
-                self.config.seqNoDbName)
+                self.config.seqNoDbName,
+                db_config=self.config.rocksdbConfig)
         )
 
     # noinspection PyAttributeOutsideInit
@@ -695,7 +717,8 @@ class Node(HasActionQueue, Motor, Propagator, MessageProcessor, HasFileStorage,
                 dataDir=self.dataLocation,
                 fileName=self.config.domainTransactionsFile,
                 ensureDurability=self.config.EnsureLedgerDurability,
-                genesis_txn_initiator=genesis_txn_initiator)
+                genesis_txn_initiator=genesis_txn_initiator,
+                recovery_workers=self.config.LEDGER_RECOVERY_WORKERS)
         else:
             # TODO: we need to rethink this functionality
             return initStorage(self.config.primaryStorage,
@@ -783,7 +806,8 @@ class Node(HasActionQueue, Motor, Propagator, MessageProcessor, HasFileStorage,
             initKeyValueStorage(
                 self.config.domainStateStorage,
                 self.dataLocation,
-                self.config.domainStateDbName)
+                self.config.domainStateDbName,
+                db_config=self.config.rocksdbConfig)
         )
 
     def _create_bls_bft(self):
@@ -940,6 +964,10 @@ class Node(HasActionQueue, Motor, Propagator, MessageProcessor, HasFileStorage,
         self.nodestack.stop()
         self.clientstack.stop()
 
+        if self._sigVerificationExecutor is not None:
+            self._sigVerificationExecutor.shutdown(wait=False)
+            self._sigVerificationExecutor = None
+
         self.closeAllKVStores()
 
         self.mode = None
@@ -954,6 +982,8 @@ class Node(HasActionQueue, Motor, Propagator, MessageProcessor, HasFileStorage,
                 state.close()
         if self.seqNoDB:
             self.seqNoDB.close()
+        if self.stewardsCountDB:
+            self.stewardsCountDB.close()
         if self.bls_bft.bls_store:
             self.bls_bft.bls_store.close()
 
@@ -967,8 +997,7 @@ class Node(HasActionQueue, Motor, Propagator, MessageProcessor, HasFileStorage,
         self.nodestack.conns.clear()
         # TODO: Should `self.clientstack.conns` be cleared too
         # self.clientstack.conns.clear()
-        self.aqStash.clear()
-        self.actionQueue.clear()
+        self._clearActions()
         self.elector = None
         self.view_changer = None
 
@@ -998,6 +1027,30 @@ class Node(HasActionQueue, Motor, Propagator, MessageProcessor, HasFileStorage,
         self.gossip()
         return c
 
+    def wakeup_fds(self):
+        return self.nodestack.wakeup_fds() + self.clientstack.wakeup_fds()
+
+    def max_idle_time(self) -> float:
+        """
+        The time the node can wait to be prodded if no message is received:
+        until the next scheduled action of any of its components, but not
+        longer than `NODE_MAX_IDLE_TIME` for the checks which are not
+        scheduled, like the ones of connections
+        """
+        if self.nodeInBox or self.clientInBox or self.receivedClientMsgs:
+            return 0
+        t = min(self.config.NODE_MAX_IDLE_TIME,
+                self.nodestack.max_idle_time(),
+                self.clientstack.max_idle_time())
+        if t <= 0 or self.status is Status.stopped:
+            return max(0, t)
+        queues = [self, self.monitor, self.ledgerManager, self._observable,
+                  self._observer]
+        if self.view_changer is not None:
+            queues.append(self.view_changer)
+        return min(t, self.replicas.max_idle_time(),
+                   *(q._timeToNextAction() for q in queues))
+
     async def serviceReplicas(self, limit) -> int:
         """
         Processes messages from replicas outbox and gives it time
@@ -1029,9 +1082,24 @@ class Node(HasActionQueue, Motor, Propagator, MessageProcessor, HasFileStorage,
         :return: the number of messages successfully processed
         """
         c = await self.clientstack.service(limit)
+        self.handleReceivedClientMsgs()
         await self.processClientInBox()
         return c
 
+    def handleReceivedClientMsgs(self):
+        """
+        Verify the signatures of the messages received by the client stack
+        together and then validate and process the messages one by one.
+        """
+        if not self.receivedClientMsgs:
+            return
+        msgs = self.receivedClientMsgs[:]
+        self.receivedClientMsgs.clear()
+        if self.config.CLIENT_SIG_VERIFICATION_WORKERS > 0:
+            self.verifySignaturesInBulk(msgs)
+        for wrappedMsg in msgs:
+            self.handleOneClientMsg(wrappedMsg)
+
     async def serviceViewChanger(self, limit) -> int:
         """
         Service the view_changer's inBox, outBox and action queues.
@@ -1567,7 +1635,10 @@ class Node(HasActionQueue, Motor, Propagator, MessageProcessor, HasFileStorage,
         if isinstance(msg, Batch):
             logger.debug("{} processing a batch {}".format(self, msg))
             for m in msg.messages:
-                m = self.nodestack.deserializeMsg(m)
+                # Messages of batches received by the node stack are
+                # already parsed
+                if not isinstance(m, Mapping):
+                    m = self.nodestack.deserializeMsg(m)
                 self.handleOneNodeMsg((m, frm))
         else:
             self.postToNodeInBox(msg, frm)
@@ -1594,6 +1665,77 @@ class Node(HasActionQueue, Motor, Propagator, MessageProcessor, HasFileStorage,
                 self.reportSuspiciousNodeEx(ex)
                 self.discard(m, ex, logger.debug)
 
+    def verifySignaturesInBulk(self, wrappedMsgs):
+        """
+        Verify the signatures of the requests in the given client messages
+        (including the requests in batches) together, so that the signature
+        checks done when validating each message are cache hits. Only
+        requests accepted by the request schema are verified, invalid
+        messages are skipped, they are rejected during validation.
+
+        :param wrappedMsgs: messages from clients
+        """
+        reqs_by_authnr = {}
+        for msg, frm in wrappedMsgs:
+            if not isinstance(msg, Mapping) or self.isClientBlacklisted(frm):
+                continue
+            if msg.get(OP_FIELD_NAME) == BATCH:
+                msgs = self._parseClientBatchMsgs(msg)
+            else:
+                msgs = (msg,)
+            for m in msgs:
+                req = self._valid_req_data_to_verify(m)
+                if req is not None:
+                    authnr = self.authNr(req)
+                    reqs_by_authnr.setdefault(id(authnr), (authnr, []))[1].\
+                        append(req)
+        if not reqs_by_authnr:
+            return
+        if self._sigVerificationExecutor is None:
+            self._sigVerificationExecutor = ThreadPoolExecutor(
+                max_workers=self.config.CLIENT_SIG_VERIFICATION_WORKERS)
+        for authnr, reqs in reqs_by_authnr.values():
+            try:
+                authnr.verify_in_bulk(reqs, self._sigVerificationExecutor)
+            except Exception as ex:
+                # Signatures are verified anyway during validation
+                logger.warning("{} could not verify signatures of {} client "
+                               "requests in bulk: {}".
+                               format(self, len(reqs), ex))
+
+    def _parseClientBatchMsgs(self, batch):
+        """
+        Parse the messages of a batch from a client, the parsed messages
+        are put back into the batch so they are not parsed again when
+        unpacked.
+        """
+        msgs = batch.get(f.MSGS.nm)
+        if not isinstance(msgs, list):
+            return ()
+        for i, m in enumerate(msgs):
+            if isinstance(m, (str, bytes)) and \
+                    m not in (ZStack.pingMessage, ZStack.pongMessage):
+                try:
+                    msgs[i] = self.clientstack.deserializeMsg(m)
+                except Exception:
+                    # Such message is rejected when the batch is unpacked
+                    continue
+        return [m for m in msgs if isinstance(m, Mapping)]
+
+    def _valid_req_data_to_verify(self, msg):
+        """
+        :return: the request data of `msg` as it is authenticated during
+        validation or None if `msg` is not a request or the request schema
+        does not accept it
+        """
+        if not (isinstance(msg.get(OPERATION), Mapping) and
+                msg.get(f.REQ_ID.nm) and idr_from_req_data(msg)):
+            return None
+        try:
+            return self._client_request_class(**msg).as_dict
+        except Exception:
+            return None
+
     def handleOneClientMsg(self, wrappedMsg):
         """
         Validate and process a client message
@@ -1700,7 +1842,10 @@ class Node(HasActionQueue, Motor, Propagator, MessageProcessor, HasFileStorage,
                 # parse BATCH messages
                 if m in (ZStack.pingMessage, ZStack.pongMessage):
                     continue
-                m = self.clientstack.deserializeMsg(m)
+                # Messages of batches can be already parsed by
+                # `verifySignaturesInBulk`
+                if not isinstance(m, Mapping):
+                    m = self.clientstack.deserializeMsg(m)
                 self.handleOneClientMsg((m, frm))
         else:
             self.postToClientInBox(msg, frm)
@@ -2486,6 +2631,25 @@ class Node(HasActionQueue, Motor, Propagator, MessageProcessor, HasFileStorage,
     def authNr(self, req):
         return self.clientAuthNr
 
+    def forgetAuthenticated(self, request: Request):
+        """
+        Forget that the request was authenticated once it is freed, so
+        the authenticator does not remember requests which are done
+        """
+        req_data = request.as_dict
+        self.authNr(req_data).forget(req_data)
+
+    @property
+    def sigCachingAuthNr(self) -> Optional[NaclAuthNr]:
+        """
+        The client authenticator which caches verified signatures, if any
+        """
+        if isinstance(self.clientAuthNr, ReqAuthenticator):
+            return self.clientAuthNr.get_authnr_by_type(NaclAuthNr)
+        if isinstance(self.clientAuthNr, NaclAuthNr):
+            return self.clientAuthNr
+        return None
+
     def three_phase_key_for_txn_seq_no(self, ledger_id, seq_no):
         if ledger_id in self.txn_seq_range_to_3phase_key:
             # point query in interval tree
@@ -2613,6 +2777,11 @@ class Node(HasActionQueue, Motor, Propagator, MessageProcessor, HasFileStorage,
         :param state_root: state root after the batch creation
         :return:
         """
+        state = self.getState(ledger_id)
+        if state is not None:
+            # Write the trie nodes of the state after the batch, the batch
+            # can be reverted to once later batches are created
+            state.flush()
         if ledger_id == POOL_LEDGER_ID:
             if isinstance(self.poolManager, TxnPoolManager):
                 self.get_req_handler(POOL_LEDGER_ID).onBatchCreated(state_root)
@@ -2710,7 +2879,13 @@ class Node(HasActionQueue, Motor, Propagator, MessageProcessor, HasFileStorage,
 
     def defaultAuthNr(self) -> ReqAuthenticator:
         req_authnr = ReqAuthenticator()
-        req_authnr.register_authenticator(self.init_core_authenticator())
+        core_authnr = self.init_core_authenticator()
+        req_authnr.register_authenticator(core_authnr)
+        if isinstance(core_authnr, NaclAuthNr):
+            # Cached verifiers and signatures verified with them get stale
+            # when the verkeys of identifiers change
+            self.get_req_handler(DOMAIN_LEDGER_ID).register_verkey_listener(
+                core_authnr.forget_identifier)
         return req_authnr
 
     def processStashedOrderedReqs(self):
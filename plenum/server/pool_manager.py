@@ -144,7 +144,8 @@ class TxnPoolManager(PoolManager, TxnStackManager):
             initKeyValueStorage(
                 self.config.poolStateStorage,
                 self.node.dataLocation,
-                self.config.poolStateDbName)
+                self.config.poolStateDbName,
+                db_config=self.config.rocksdbConfig)
         )
 
     def initPoolState(self):
@@ -56,6 +56,13 @@ class Requests(OrderedDict):
     request is popped out
     """
 
+    def __init__(self, *args, on_removed=None, **kwargs):
+        """
+        :param on_removed: called with the request once it is removed
+        """
+        super().__init__(*args, **kwargs)
+        self.on_removed = on_removed
+
     def add(self, req: Request):
         """
         Add the specified request to this request store.
@@ -138,7 +145,9 @@ class Requests(OrderedDict):
 
     def _clean(self, state):
         if state.executed and state.forwardedTo <= 0:
-            self.pop(state.request.key, None)
+            if self.pop(state.request.key, None) is not None and \
+                    self.on_removed is not None:
+                self.on_removed(state.request)
 
     def has_propagated(self, req: Request, sender: str) -> bool:
         """
@@ -157,8 +166,8 @@ class Requests(OrderedDict):
 class Propagator:
     MAX_REQUESTED_KEYS_TO_KEEP = 1000
 
-    def __init__(self):
-        self.requests = Requests()
+    def __init__(self, on_request_removed=None):
+        self.requests = Requests(on_removed=on_request_removed)
         self.requested_propagates_for = OrderedSet()
 
     # noinspection PyUnresolvedReferences
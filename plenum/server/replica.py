@@ -27,6 +27,7 @@ from plenum.common.util import updateNamedTuple, compare_3PC_keys, max_3PC_key,
     mostCommonElement, SortedDict
 from plenum.server.has_action_queue import HasActionQueue
 from plenum.server.models import Commits, Prepares
+from plenum.server.request_queue import RequestQueue
 from plenum.server.router import Router
 from plenum.server.suspicion_codes import Suspicions
 from sortedcontainers import SortedList
@@ -247,7 +248,7 @@ class Replica(HasActionQueue, MessageProcessor, HookManager):
         self._lastPrePrepareSeqNo = self.h  # type: int
 
         # Queues used in PRE-PREPARE for each ledger,
-        self.requestQueues = {}  # type: Dict[int, deque]
+        self.requestQueues = {}  # type: Dict[int, RequestQueue]
         for ledger_id in self.ledger_ids:
             self.register_ledger(ledger_id)
 
@@ -295,12 +296,12 @@ class Replica(HasActionQueue, MessageProcessor, HookManager):
         HookManager.__init__(self, ReplicaHooks.get_all_vals())
 
     def register_ledger(self, ledger_id):
-        # Using ordered set since after ordering each PRE-PREPARE,
+        # Using request queue since after ordering each PRE-PREPARE,
         # the request key is removed, so fast lookup and removal of
         # request key is needed. Need the collection to be ordered since
         # the request key needs to be removed once its ordered
         if ledger_id not in self.requestQueues:
-            self.requestQueues[ledger_id] = OrderedSet()
+            self.requestQueues[ledger_id] = RequestQueue()
 
     def ledger_uncommitted_size(self, ledgerId):
         if not self.isMaster:
@@ -710,17 +711,20 @@ class Replica(HasActionQueue, MessageProcessor, HookManager):
         validReqs = []
         inValidReqs = []
         rejects = []
+        queue = self.requestQueues[ledger_id]
         while len(validReqs) + len(inValidReqs) < self.config.Max3PCBatchSize \
-                and self.requestQueues[ledger_id]:
-            key = self.requestQueues[ledger_id].pop(0)
-            if key in self.requests:
-                fin_req = self.requests[key].finalised
-                self.processReqDuringBatch(
-                    fin_req, tm, validReqs, inValidReqs, rejects)
-            else:
-                logger.debug('{} found {} in its request queue but the '
-                             'corresponding request was removed'.
-                             format(self, key))
+                and queue:
+            keys = queue.take(self.config.Max3PCBatchSize -
+                              len(validReqs) - len(inValidReqs))
+            for key in keys:
+                if key in self.requests:
+                    fin_req = self.requests[key].finalised
+                    self.processReqDuringBatch(
+                        fin_req, tm, validReqs, inValidReqs, rejects)
+                else:
+                    logger.debug('{} found {} in its request queue but the '
+                                 'corresponding request was removed'.
+                                 format(self, key))
 
         reqs = validReqs + inValidReqs
         digest = self.batchDigest(reqs)
@@ -742,7 +746,7 @@ class Replica(HasActionQueue, MessageProcessor, HookManager):
         # BLS multi-sig:
         params = self._bls_bft_replica.update_pre_prepare(params, ledger_id)
 
-        pre_prepare = PrePrepare(*params)
+        pre_prepare = PrePrepare.trusted(*params)
         if self.isMaster:
             rv = self.execute_hook(ReplicaHooks.CREATE_PPR, pre_prepare)
             pre_prepare = rv if rv is not None else pre_prepare
@@ -1073,7 +1077,7 @@ class Replica(HasActionQueue, MessageProcessor, HookManager):
         # BLS multi-sig:
         params = self._bls_bft_replica.update_prepare(params, pp.ledgerId)
 
-        prepare = Prepare(*params)
+        prepare = Prepare.trusted(*params)
         if self.isMaster:
             rv = self.execute_hook(ReplicaHooks.CREATE_PR, prepare)
             prepare = rv if rv is not None else prepare
@@ -1099,7 +1103,7 @@ class Replica(HasActionQueue, MessageProcessor, HookManager):
             pre_prepare = self.getPrePrepare(*key_3pc)
             params = self._bls_bft_replica.update_commit(params, pre_prepare)
 
-        commit = Commit(*params)
+        commit = Commit.trusted(*params)
         if self.isMaster:
             rv = self.execute_hook(ReplicaHooks.CREATE_CM, commit)
             commit = rv if rv is not None else commit
@@ -1210,6 +1214,10 @@ class Replica(HasActionQueue, MessageProcessor, HookManager):
                 return PP_APPLY_ROOT_HASH_MISMATCH
 
             self.outBox.extend(rejects)
+            # Write the trie nodes of the state after the batch, later
+            # batches can be reverted to it even if the batch is not
+            # created, like when it is stashed while catching up
+            self.node.getState(pre_prepare.ledgerId).flush()
         return None
 
     def _can_process_pre_prepare(self, pre_prepare: PrePrepare, sender: str) -> Optional[int]:
@@ -1614,14 +1622,14 @@ class Replica(HasActionQueue, MessageProcessor, HookManager):
         # TODO seems not enough for production where optimization happens
         assert pp
         self.addToOrdered(*key)
-        ordered = Ordered(self.instId,
-                          pp.viewNo,
-                          pp.reqIdr[:pp.discarded],
-                          pp.ppSeqNo,
-                          pp.ppTime,
-                          pp.ledgerId,
-                          pp.stateRootHash,
-                          pp.txnRootHash)
+        ordered = Ordered.trusted(self.instId,
+                                  pp.viewNo,
+                                  pp.reqIdr[:pp.discarded],
+                                  pp.ppSeqNo,
+                                  pp.ppTime,
+                                  pp.ledgerId,
+                                  pp.stateRootHash,
+                                  pp.txnRootHash)
         if self.isMaster:
             rv = self.execute_hook(ReplicaHooks.CREATE_ORD, ordered)
             ordered = rv if rv is not None else ordered
@@ -1656,9 +1664,12 @@ class Replica(HasActionQueue, MessageProcessor, HookManager):
         self.addToCheckpoint(pp.ppSeqNo, pp.digest)
 
         # BLS multi-sig:
-        self._bls_bft_replica.process_order(key,
-                                            self.quorums,
-                                            pp)
+        wrong_bls_sigs_from = self._bls_bft_replica.process_order(key,
+                                                                  self.quorums,
+                                                                  pp)
+        for node_name in wrong_bls_sigs_from or ():
+            self.node.reportSuspiciousNodeEx(
+                SuspiciousNode(node_name, Suspicions.CM_BLS_SIG_WRONG, None))
 
         return True
 
@@ -1,3 +1,4 @@
+import time
 from collections import deque
 from typing import Generator
 
@@ -71,6 +72,23 @@ class Replicas:
             sum(replica.serviceQueues(limit) for replica in self._replicas)
         return number_of_processed_messages
 
+    def max_idle_time(self) -> float:
+        """
+        The time the replicas can wait to be serviced if they get no
+        messages: until the next action of any of them or until the next
+        3PC batch of a primary replica with queued requests
+        """
+        t = float('inf')
+        for replica in self._replicas:
+            if replica.inBox:
+                return 0
+            t = min(t, replica._timeToNextAction())
+            if replica.isPrimary and \
+                    any(len(q) > 0 for q in replica.requestQueues.values()):
+                t = min(t, replica.lastBatchCreated +
+                        replica.config.Max3PCBatchWait - time.perf_counter())
+        return max(0, t)
+
     def pass_message(self, message, instance_id=None):
         replicas = self._replicas
         if instance_id is not None:
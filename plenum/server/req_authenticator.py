@@ -41,6 +41,41 @@ class ReqAuthenticator:
             raise NoAuthenticatorFound
         return identifiers
 
+    def verify_in_bulk(self, reqs, executor=None):
+        """
+        Verifies the signatures of the given requests data in one go with
+        the authenticators which would authenticate them, so that
+        `authenticate` does not need to verify them again. Errors are not
+        raised here but by `authenticate`.
+        :param reqs:
+        :param executor: optional executor to spread the verification over
+        :return:
+        """
+        reqs = list(reqs)
+        for authenticator in self._authenticators:
+            to_verify = []
+            rest = []
+            for req_data in reqs:
+                typ = req_data.get(OPERATION, {}).get(TXN_TYPE)
+                if authenticator.is_query(typ):
+                    continue
+                rest.append(req_data)
+                if authenticator.is_write(typ):
+                    to_verify.append(req_data)
+            if to_verify:
+                authenticator.verify_in_bulk(to_verify, executor)
+            reqs = rest
+
+    def forget(self, req_data):
+        """
+        Forgets with all the authenticators that the signatures of the given
+        request data were verified, so it is authenticated again if received
+        later
+        :param req_data:
+        """
+        for authenticator in self._authenticators:
+            authenticator.forget(req_data)
+
     @property
     def core_authenticator(self):
         if not self._authenticators:
@@ -0,0 +1,71 @@
+from collections import OrderedDict
+from itertools import islice
+from typing import Hashable, Iterable, List
+
+
+class RequestQueue:
+    """
+    Queue of request keys in the order in which they were added, a key is
+    present at most once.
+
+    Backed by an ordered dictionary (a hash table with a linked list of its
+    entries), so adding, removing the first key, discarding any key and
+    checking for membership take constant time.
+    """
+
+    def __init__(self, keys: Iterable[Hashable] = ()):
+        self._keys = OrderedDict.fromkeys(keys)
+
+    def add(self, key: Hashable):
+        """
+        Add `key` to the end of the queue unless it is already present.
+        """
+        if key not in self._keys:
+            self._keys[key] = None
+
+    def discard(self, key: Hashable):
+        """
+        Remove `key` from the queue if it is present.
+        """
+        self._keys.pop(key, None)
+
+    def popleft(self) -> Hashable:
+        """
+        Remove and return the first key of the queue.
+
+        :raises IndexError: if the queue is empty
+        """
+        if not self._keys:
+            raise IndexError('pop from an empty request queue')
+        return self._keys.popitem(last=False)[0]
+
+    def take(self, n: int) -> List[Hashable]:
+        """
+        Remove and return up to `n` first keys of the queue.
+        """
+        keys = self._keys
+        return [keys.popitem(last=False)[0]
+                for _ in range(min(n, len(keys)))]
+
+    def clear(self):
+        self._keys.clear()
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __getitem__(self, index: int):
+        # Needs to walk the queue, meant for inspection only
+        if index < 0:
+            index += len(self._keys)
+        if not 0 <= index < len(self._keys):
+            raise IndexError('request queue index out of range')
+        return next(islice(self._keys, index, None))
+
+    def __repr__(self):
+        return '{}({})'.format(self.__class__.__name__, list(self._keys))
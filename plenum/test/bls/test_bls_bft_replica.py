@@ -27,6 +27,13 @@ def bls_bft_replicas(txnPoolNodeSet):
     return bls_bft_replicas
 
 
+@pytest.fixture()
+def bls_bft_replicas_aggregate(bls_bft_replicas):
+    for bls_bft_replica in bls_bft_replicas:
+        bls_bft_replica._verify_commits_in_aggregate = True
+    return bls_bft_replicas
+
+
 @pytest.fixture()
 def quorums(txnPoolNodeSet):
     return Quorums(len(txnPoolNodeSet))
@@ -321,6 +328,18 @@ def test_validate_commit_incorrect_value_ledger_id(bls_bft_replicas, pre_prepare
             assert status == BlsBftReplica.CM_BLS_SIG_WRONG
 
 
+def test_validate_commit_incorrect_sig_verified_in_aggregate(bls_bft_replicas_aggregate,
+                                                            pre_prepare_with_bls):
+    key = (0, 0)
+    fake_sig = base58.b58encode(b"somefakesignaturesomefakesignaturesomefakesignature")
+    commit = create_commit_with_bls_sig(key, fake_sig)
+    for sender_bls_bft in bls_bft_replicas_aggregate:
+        for verifier_bls_bft in bls_bft_replicas_aggregate:
+            assert not verifier_bls_bft.validate_commit(commit,
+                                                        sender_bls_bft.node_id,
+                                                        pre_prepare_with_bls)
+
+
 # ------ PROCESS 3PC MESSAGES ------
 
 def test_process_pre_prepare_no_multisig(bls_bft_replicas, pre_prepare_no_bls):
@@ -368,6 +387,50 @@ def test_process_order(bls_bft_replicas, pre_prepare_no_bls, quorums):
                               pre_prepare_no_bls)
 
 
+def test_process_order_verified_in_aggregate(bls_bft_replicas_aggregate,
+                                             pre_prepare_no_bls, quorums):
+    key = (0, 0)
+    process_commits_for_key(key, pre_prepare_no_bls, bls_bft_replicas_aggregate)
+    for bls_bft in bls_bft_replicas_aggregate:
+        assert bls_bft.process_order(key, quorums, pre_prepare_no_bls) == []
+        assert len(bls_bft._signatures[key]) == len(bls_bft_replicas_aggregate)
+        assert bls_bft._bls_bft.bls_store.get(pre_prepare_no_bls.stateRootHash)
+
+
+def test_process_order_finds_wrong_sig_in_aggregate(bls_bft_replicas_aggregate,
+                                                    pre_prepare_no_bls, quorums):
+    key = (0, 0)
+    process_commits_for_key(key, pre_prepare_no_bls, bls_bft_replicas_aggregate)
+    faulty = bls_bft_replicas_aggregate[1]
+    fake_sig = base58.b58encode(b"somefakesignaturesomefakesignaturesomefakesignature")
+    for bls_bft in bls_bft_replicas_aggregate:
+        bls_bft._signatures[key][faulty.node_id] = fake_sig
+
+    for bls_bft in bls_bft_replicas_aggregate:
+        assert bls_bft.process_order(key, quorums, pre_prepare_no_bls) == \
+            [faulty.node_id]
+        assert faulty.node_id not in bls_bft._signatures[key]
+        multi_sig = bls_bft._bls_bft.bls_store.get(pre_prepare_no_bls.stateRootHash)
+        assert multi_sig
+        assert faulty.node_id not in multi_sig.participants
+        assert bls_bft._validate_multi_sig(multi_sig)
+
+
+def test_multi_sig_value_cached_for_batch(bls_bft_replicas, pre_prepare_no_bls,
+                                          pre_prepare_incorrect):
+    bls_bft = bls_bft_replicas[0]
+    value, message = bls_bft._get_multi_sig_value(pre_prepare_no_bls)
+    assert message == value.as_single_value()
+    assert bls_bft._get_multi_sig_value(pre_prepare_no_bls)[0] is value
+
+    # Other PrePrepare with the same 3PC key
+    other_value, _ = bls_bft._get_multi_sig_value(pre_prepare_incorrect)
+    assert other_value != value
+
+    bls_bft.gc((pre_prepare_no_bls.viewNo, pre_prepare_no_bls.ppSeqNo))
+    assert not bls_bft._multi_sig_values
+
+
 # ------ CREATE MULTI_SIG ------
 
 def test_create_multi_sig_from_all(bls_bft_replicas, quorums, pre_prepare_no_bls):
@@ -0,0 +1,109 @@
+from hashlib import sha256
+
+import base58
+import pytest
+
+from crypto.bls.bls_crypto import BlsCryptoVerifier
+from plenum.bls.bls_bft_replica_plenum import BlsBftReplicaPlenum
+from plenum.common.constants import DOMAIN_LEDGER_ID
+from plenum.common.messages.node_messages import PrePrepare, Commit
+from plenum.common.util import get_utc_epoch
+from plenum.server.quorums import Quorums
+from plenum.test.testing_utils import FakeSomething
+
+NODES = ['Alpha', 'Beta', 'Gamma', 'Delta']
+KEY = (0, 1)
+
+
+class CountingBlsVerifier(BlsCryptoVerifier):
+    """
+    Verifies signatures made by `sign`, counts the verifications to check
+    how many are done
+    """
+
+    def __init__(self):
+        self.verified_sigs = 0
+        self.verified_multi_sigs = 0
+
+    @staticmethod
+    def sign(message, pk):
+        return 'sig:{}:{}'.format(pk, sha256(message).hexdigest())
+
+    def create_multi_sig(self, signatures):
+        if not all(sig.startswith('sig:') for sig in signatures):
+            raise ValueError('Can not parse signature')
+        return ','.join(signatures)
+
+    def verify_sig(self, signature, message, pk):
+        self.verified_sigs += 1
+        return signature == self.sign(message, pk)
+
+    def verify_multi_sig(self, signature, message, pks):
+        self.verified_multi_sigs += 1
+        return sorted(signature.split(',')) == \
+            sorted(self.sign(message, pk) for pk in pks)
+
+
+@pytest.fixture()
+def bls_bft_replica():
+    key_register = FakeSomething(
+        get_key_by_name=lambda node_name: 'pk_' + node_name,
+        get_pool_root_hash_committed=lambda: b'1' * 32)
+    bls_bft = FakeSomething(bls_key_register=key_register,
+                            bls_crypto_verifier=CountingBlsVerifier(),
+                            bls_store=FakeSomething(multi_sigs=[]))
+    bls_bft.bls_store.put = bls_bft.bls_store.multi_sigs.append
+    return BlsBftReplicaPlenum(NODES[0], bls_bft, is_master=True,
+                               verify_commits_in_aggregate=True)
+
+
+@pytest.fixture()
+def pre_prepare():
+    return PrePrepare(0, KEY[0], KEY[1], get_utc_epoch(), [('1' * 16, 1)], 0,
+                      'random digest', DOMAIN_LEDGER_ID,
+                      base58.b58encode(b'1' * 32), base58.b58encode(b'2' * 32))
+
+
+def receive_commits(bls_bft_replica, pre_prepare, wrong_from=()):
+    _, message = bls_bft_replica._get_multi_sig_value(pre_prepare)
+    verifier = bls_bft_replica._bls_bft.bls_crypto_verifier
+    for node_name in NODES:
+        sig = 'wrong' if node_name in wrong_from else \
+            verifier.sign(message, 'pk_' + node_name)
+        commit = Commit(0, KEY[0], KEY[1], sig)
+        sender = node_name + ':0'
+        assert bls_bft_replica.validate_commit(commit, sender,
+                                               pre_prepare) is None
+        bls_bft_replica.process_commit(commit, sender)
+    # Signatures are not verified when COMMITs are received
+    assert verifier.verified_sigs == verifier.verified_multi_sigs == 0
+
+
+def test_correct_sigs_verified_once(bls_bft_replica, pre_prepare):
+    receive_commits(bls_bft_replica, pre_prepare)
+
+    assert bls_bft_replica.process_order(KEY, Quorums(len(NODES)),
+                                         pre_prepare) == []
+    verifier = bls_bft_replica._bls_bft.bls_crypto_verifier
+    assert (verifier.verified_sigs, verifier.verified_multi_sigs) == (0, 1)
+    multi_sig, = bls_bft_replica._bls_bft.bls_store.multi_sigs
+    assert sorted(multi_sig.participants) == sorted(NODES)
+
+
+@pytest.mark.parametrize('wrong_from', [['Beta'], ['Alpha', 'Delta']])
+def test_wrong_sigs_found_and_dropped(bls_bft_replica, pre_prepare,
+                                      wrong_from):
+    receive_commits(bls_bft_replica, pre_prepare, wrong_from)
+    quorums = Quorums(len(NODES))
+
+    wrong_sigs_from = bls_bft_replica.process_order(KEY, quorums, pre_prepare)
+    assert sorted(wrong_sigs_from) == sorted(wrong_from)
+    assert sorted(bls_bft_replica._signatures[KEY]) == \
+        sorted(set(NODES) - set(wrong_from))
+    multi_sigs = bls_bft_replica._bls_bft.bls_store.multi_sigs
+    if quorums.bls_signatures.is_reached(len(NODES) - len(wrong_from)):
+        multi_sig, = multi_sigs
+        assert sorted(multi_sig.participants) == \
+            sorted(set(NODES) - set(wrong_from))
+    else:
+        assert not multi_sigs
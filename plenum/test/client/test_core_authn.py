@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from plenum.common.constants import GET_TXN, NODE, NYM
@@ -5,6 +7,7 @@ from plenum.common.exceptions import CouldNotAuthenticate, \
     InsufficientSignatures, InsufficientCorrectSignatures, MissingSignature
 from plenum.common.signer_simple import SimpleSigner
 from plenum.common.types import f
+from plenum.common.verifier import DidVerifier
 from plenum.server.client_authn import CoreAuthNr
 
 
@@ -151,3 +154,127 @@ def test_txn_types(sa):
     assert not sa.is_query(NODE)
     assert sa.is_write(NYM)
     assert not sa.is_query(NYM)
+
+
+def test_verified_signature_is_not_verified_again(signer, msg, sig):
+    verified = []
+
+    class CountingVerifier(DidVerifier):
+        def verify(self, sig, msg):
+            verified.append(msg)
+            return super().verify(sig, msg)
+
+    sa = CoreAuthNr()
+    sa.addIdr(signer.identifier, signer.verkey)
+    for _ in range(3):
+        assert sa.authenticate(msg, idr, sig, verifier=CountingVerifier)
+    assert len(verified) == 1
+    assert (sa.hits, sa.misses) == (2, 1)
+    assert sa.hit_rate == 2 / 3
+
+    # A different payload with the same signature is still verified
+    msg2 = {**msg, 'myMsg': msg_str[:-1] + '!'}
+    for _ in range(2):
+        with pytest.raises(InsufficientCorrectSignatures):
+            sa.authenticate(msg2, idr, sig, verifier=CountingVerifier)
+    assert len(verified) == 3
+
+
+def test_verified_signatures_cache_is_bounded(signer):
+    sa = CoreAuthNr()
+    sa.VERIFIED_SIGS_CACHE_SIZE = 2
+    sa.addIdr(signer.identifier, signer.verkey)
+    for i in range(3):
+        m = {'myMsg': str(i), f.IDENTIFIER.nm: idr}
+        assert sa.authenticate(m, idr, signer.sign(m))
+    assert len(sa._verified_sigs) == 2
+
+
+@pytest.mark.parametrize('workers', [0, 2])
+def test_signatures_verified_in_bulk_are_not_verified_again(signer, workers):
+    verified = []
+
+    class CountingVerifier(DidVerifier):
+        def verify(self, sig, msg):
+            verified.append(msg)
+            return super().verify(sig, msg)
+
+    sa = CoreAuthNr()
+    sa.addIdr(signer.identifier, signer.verkey)
+    reqs = []
+    for i in range(5):
+        m = {'myMsg': str(i), f.IDENTIFIER.nm: idr}
+        reqs.append({**m, f.SIG.nm: signer.sign(m)})
+    # Invalid requests are skipped
+    bad_sig = {'myMsg': 'bad', f.IDENTIFIER.nm: idr, f.SIG.nm: reqs[0][f.SIG.nm]}
+    no_sig = {'myMsg': 'none', f.IDENTIFIER.nm: idr}
+
+    executor = ThreadPoolExecutor(workers) if workers else None
+    sa.verify_in_bulk(reqs + [bad_sig, no_sig], executor,
+                      verifier=CountingVerifier)
+    assert len(verified) == 6
+
+    for req in reqs:
+        assert sa.authenticate(req, verifier=CountingVerifier)
+    assert len(verified) == 6
+
+    with pytest.raises(InsufficientCorrectSignatures):
+        sa.authenticate(bad_sig, verifier=CountingVerifier)
+    assert len(verified) == 7
+    with pytest.raises(MissingSignature):
+        sa.authenticate(no_sig, verifier=CountingVerifier)
+
+    if executor:
+        executor.shutdown()
+
+
+def test_verifiers_are_cached_till_verkey_changes(signer):
+    lookups = []
+
+    class LookupCountingAuthNr(CoreAuthNr):
+        def getVerkey(self, identifier):
+            lookups.append(identifier)
+            return super().getVerkey(identifier)
+
+    sa = LookupCountingAuthNr()
+    sa.addIdr(idr, signer.verkey)
+    for i in range(3):
+        m = {'myMsg': str(i), f.IDENTIFIER.nm: idr}
+        assert sa.authenticate(m, idr, signer.sign(m))
+    assert lookups == [idr]
+
+    new_signer = SimpleSigner(idr)
+    sa.addIdr(idr, new_signer.verkey)
+    m = {'myMsg': 'new', f.IDENTIFIER.nm: idr}
+    assert sa.authenticate(m, idr, new_signer.sign(m))
+    assert lookups == [idr, idr]
+    with pytest.raises(InsufficientCorrectSignatures):
+        sa.authenticate(m, idr, signer.sign(m))
+
+    sa.forget_identifier(idr)
+    assert sa.authenticate(m, idr, new_signer.sign(m))
+    assert lookups == [idr, idr, idr]
+
+
+def test_verified_signatures_of_request_forgotten(signer):
+    other_signer = SimpleSigner()
+    sa = CoreAuthNr()
+    reqs = []
+    for s in (signer, other_signer):
+        sa.addIdr(s.identifier, s.verkey)
+        for i in range(2):
+            m = {'myMsg': str(i), f.IDENTIFIER.nm: s.identifier}
+            reqs.append({**m, f.SIG.nm: s.sign(m)})
+            sa.authenticate(reqs[-1])
+    assert len(sa._verified_sigs) == 4
+
+    sa.forget(reqs[0])
+    assert len(sa._verified_sigs) == 3
+    sa.authenticate(reqs[0])
+    assert sa.misses == 5
+
+    # Signatures verified with the verkey of an identifier are forgotten
+    # when its verkey changes
+    sa.forget_identifier(signer.identifier)
+    assert [key[1] for key in sa._verified_sigs] == \
+        [other_signer.identifier] * 2
@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from plenum.common.batched import Batched
+from plenum.common.constants import BATCH, OP_FIELD_NAME
+from plenum.common.types import f
+from plenum.test.testing_utils import FakeSomething
+from stp_zmq.zstack import ZStack
+
+whitelist = ['while converting message']
+
+
+@pytest.fixture()
+def batched():
+    b = Batched(FakeSomething(MSG_LEN_LIMIT=1024))
+    b.pings = []
+    b.healthMessages = ZStack.healthMessages
+    b.handlePingPong = lambda msg, frm, ident: \
+        msg in (ZStack.pingMessage, ZStack.pongMessage) and \
+        b.pings.append(msg) is None
+    b.deserializeMsg = ZStack.deserializeMsg
+    return b
+
+
+def test_messages_of_batch_are_parsed_once_received(batched):
+    inner = [{OP_FIELD_NAME: 'PREPARE', 'viewNo': 0},
+             {OP_FIELD_NAME: 'COMMIT', 'viewNo': 1}]
+    raw = json.dumps({OP_FIELD_NAME: BATCH,
+                      f.MSGS.nm: [json.dumps(inner[0]), ZStack.pingMessage,
+                                  json.dumps(inner[1]), '{invalid'],
+                      f.SIG.nm: None}).encode()
+
+    msg = batched.doProcessReceived(ZStack.deserializeMsg(raw), 'Beta', None)
+
+    assert msg[f.MSGS.nm] == inner
+    assert batched.pings == [ZStack.pingMessage]
+
+
+def test_parsed_messages_of_batch_are_kept(batched):
+    inner = {OP_FIELD_NAME: 'PREPARE', 'viewNo': 0}
+    msg = {OP_FIELD_NAME: BATCH,
+           f.MSGS.nm: [inner, ZStack.pingMessage.encode()],
+           f.SIG.nm: None}
+    assert batched.doProcessReceived(msg, 'Beta', None)[f.MSGS.nm] == [inner]
+    assert batched.pings == [ZStack.pingMessage]
+
+
+def test_batch_of_health_messages_is_dropped(batched):
+    msg = {OP_FIELD_NAME: BATCH,
+           f.MSGS.nm: [ZStack.pingMessage, ZStack.pongMessage],
+           f.SIG.nm: None}
+    assert batched.doProcessReceived(msg, 'Beta', None) is None
+
+
+def test_not_batch_is_not_changed(batched):
+    msg = {OP_FIELD_NAME: 'PREPARE', 'viewNo': 0}
+    assert batched.doProcessReceived(dict(msg), 'Beta', None) == msg
@@ -0,0 +1,72 @@
+import pytest
+
+from ledger.compact_merkle_tree import CompactMerkleTree
+from plenum.common.ledger import Ledger
+
+
+def make_txns(start, count):
+    return [{'type': '1', 'dest': 'nym{}'.format(i)}
+            for i in range(start, start + count)]
+
+
+@pytest.fixture()
+def ledger(tdir_for_func):
+    ledger = Ledger(CompactMerkleTree(), dataDir=tdir_for_func)
+    ledger.addTxns(make_txns(0, 3))
+    yield ledger
+    ledger.stop()
+
+
+def expected_root(ledger, txns):
+    return ledger.treeWithAppliedTxns(txns, ledger.tree).root_hash
+
+
+def test_discard_batches_and_part_of_batch(ledger):
+    batches = [make_txns(10, 2), make_txns(20, 3), make_txns(30, 1)]
+    roots = []
+    for batch in batches:
+        ledger.appendTxns(batch)
+        roots.append(ledger.uncommittedRootHash)
+    assert roots[-1] == expected_root(ledger, sum(batches, []))
+
+    ledger.discardTxns(1)
+    assert ledger.uncommittedRootHash == roots[1]
+    assert len(ledger.uncommittedTrees) == 2
+
+    ledger.discardTxns(2)
+    assert ledger.uncommittedRootHash == \
+        expected_root(ledger, batches[0] + batches[1][:1])
+    assert ledger.uncommitted_size == ledger.size + 3
+
+    ledger.discardTxns(3)
+    assert ledger.uncommittedRootHash is None
+    assert not ledger.uncommittedLeaves and not ledger.uncommittedTrees
+
+
+def test_commit_uses_leaves_of_applied_txns(ledger, tdir_for_func,
+                                            monkeypatch):
+    other = Ledger(CompactMerkleTree(), dataDir=tdir_for_func,
+                   fileName='other_transactions')
+    other.addTxns(make_txns(0, 3))
+    expected_infos = other.addTxns(make_txns(10, 2), with_merkle_info=True)
+    other.stop()
+
+    batches = [make_txns(10, 2), make_txns(20, 3)]
+    for batch in batches:
+        ledger.appendTxns(batch)
+    uncommitted_root = ledger.uncommittedRootHash
+
+    monkeypatch.setattr(ledger, 'serialize_for_tree',
+                        lambda txn: pytest.fail('Txn serialized again'))
+    (start, end), committed = ledger.commitTxns(2)
+    assert (start, end) == (4, 5)
+    assert committed == [dict(txn, **info) for txn, info in
+                         zip(batches[0], expected_infos)]
+    assert ledger.getBySeqNo(5)['dest'] == 'nym11'
+    assert ledger.uncommittedRootHash == uncommitted_root
+    assert len(ledger.uncommittedTrees) == 1
+
+    ledger.commitTxns(3)
+    assert ledger.tree.root_hash == uncommitted_root
+    assert ledger.uncommittedRootHash is None
+    assert not ledger.uncommittedLeaves and not ledger.uncommittedTrees
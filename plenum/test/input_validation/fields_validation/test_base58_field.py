@@ -49,3 +49,11 @@ def test_invalid_symbols_truncated_output():
     assert res
     assert (res == 'should not contain the following chars '
             '{} (truncated)'.format(sorted(set(INVALID_CHARS))[:10]))
+
+
+def test_decoded_length_with_leading_zero_bytes():
+    for value in (b'\x00', b'\x00\x00\x01', b'\x00' + b'\xff' * 31, b'\x01'):
+        val = base58.b58encode(value)
+        validator = Base58Field(byte_lengths=(len(value),))
+        assert not validator.validate(val)
+        assert Base58Field(byte_lengths=(len(value) + 1,)).validate(val)
@@ -0,0 +1,26 @@
+from plenum.common.messages.fields import SerializedOrParsedValueField
+
+validator = SerializedOrParsedValueField()
+
+
+def test_non_empty_string():
+    assert not validator.validate("x")
+
+
+def test_non_empty_bytes():
+    assert not validator.validate(b"hello")
+
+
+def test_non_empty_map():
+    assert not validator.validate({"op": "PREPARE"})
+
+
+def test_empty_values():
+    assert validator.validate("")
+    assert validator.validate(b"")
+    assert validator.validate({})
+
+
+def test_other_types():
+    assert validator.validate(1)
+    assert validator.validate(["x"])
@@ -1,6 +1,45 @@
+import pytest
+
+from plenum.common.messages.fields import NonNegativeNumberField
+from plenum.test.input_validation.stub_messages import Message1
+
+
 def test_correct_message():
-    pass
+    msg = Message1(1, 'bar')
+    assert msg.a == 1 and msg.b == 'bar'
+    assert Message1(b='bar', a=1) == msg
+    assert msg[0] == 1 and msg[1] == 'bar'
+    assert msg[-1] == 'bar'
+    assert msg[:] == [1, 'bar']
+    with pytest.raises(IndexError):
+        msg[2]
 
 
 def test_incorrect_field():
-    pass
+    with pytest.raises(TypeError, match='missed fields - b'):
+        Message1(a=1)
+    with pytest.raises(TypeError, match='invalid type'):
+        Message1.trusted(1, 'bar').validate([1, 'bar'])
+    with pytest.raises(TypeError, match='negative value'):
+        Message1(a=-1, b='bar')
+
+
+def test_schema_compiled_once_per_class(monkeypatch):
+    Message1(1, 'bar')
+    compiled = Message1._compiled
+    Message1(2, 'foo')
+    assert Message1._compiled is compiled
+    assert compiled[1].required == {'a', 'b'}
+
+    # A changed schema is compiled again
+    monkeypatch.setattr(Message1, 'schema',
+                        (('a', NonNegativeNumberField()),))
+    assert Message1(a=1).a == 1
+    with pytest.raises(TypeError, match='unknown field - b=bar'):
+        Message1.trusted(1).validate({'a': 1, 'b': 'bar'})
+
+
+def test_trusted_message_is_not_validated():
+    assert Message1.trusted(1, 'bar') == Message1(1, 'bar')
+    assert Message1.trusted(b='bar', a=1) == Message1(1, 'bar')
+    assert Message1.trusted(-1, 'bar').a == -1
@@ -0,0 +1,26 @@
+import time
+
+from plenum.common.messages.node_message_factory import node_message_factory
+from plenum.common.messages.node_messages import Prepare, Commit, PrePrepare
+
+
+def testMeasureNodeMessagesCreatedPerSecond():
+    digest = 'd' * 64
+    root = 'EHfWPGuJw3RMfrM7UkiK6CxqKu4yrpaVtM5SAbM5AaSa'
+    raw_messages = [
+        Prepare(0, 1, 10, 1499906903, digest, root, root).__dict__,
+        Commit(0, 1, 10).__dict__,
+        PrePrepare(0, 1, 10, 1499906903,
+                   [['4AdS22kC7xzb4bcqg9JATuCfAMNcQYcZa1u5eWzs6cSJ',
+                     1499906902]],
+                   1, digest, 1, root, root).__dict__,
+    ]
+    count = 20000
+    for raw in raw_messages:
+        raw = dict(raw)
+        start = time.perf_counter()
+        for _ in range(count):
+            node_message_factory.get_instance(**raw)
+        elapsed = time.perf_counter() - start
+        print("{}: {} messages per second".
+              format(raw['op'], int(count / elapsed)))
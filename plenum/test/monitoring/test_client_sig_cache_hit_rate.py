@@ -0,0 +1,15 @@
+from plenum.server.client_authn import CoreAuthNr
+from plenum.server.instances import Instances
+from plenum.server.monitor import Monitor
+
+
+def test_client_sig_cache_hit_rate_in_metrics(tconf):
+    authnr = CoreAuthNr()
+    monitor = Monitor('Alpha', Delta=tconf.DELTA, Lambda=tconf.LAMBDA,
+                      Omega=tconf.OMEGA, instances=Instances(),
+                      nodestack=None, blacklister=None, nodeInfo={},
+                      notifierEventTriggeringConfig={}, pluginPaths=[],
+                      clientAuthNr=authnr)
+    monitor.addInstance()
+    authnr.hits, authnr.misses = 3, 1
+    assert ("client signatures cache hit rate", 0.75) in monitor.metrics()
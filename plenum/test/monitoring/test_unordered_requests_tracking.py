@@ -0,0 +1,119 @@
+import time
+
+import pytest
+
+from plenum.server.instances import Instances
+from plenum.server.monitor import Monitor
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(time, 'perf_counter', clock)
+    return clock
+
+
+@pytest.fixture()
+def monitor(tconf):
+    monitor = Monitor('Alpha', Delta=tconf.DELTA, Lambda=tconf.LAMBDA,
+                      Omega=tconf.OMEGA, instances=Instances(),
+                      nodestack=None, blacklister=None, nodeInfo={},
+                      notifierEventTriggeringConfig={}, pluginPaths=[])
+    monitor.addInstance()
+    monitor.addInstance()
+    monitor.WARN_NOT_PARTICIPATING_WINDOW_MINS = 1
+    monitor.WARN_NOT_PARTICIPATING_UNORDERED_NUM = 3
+    monitor.WARN_NOT_PARTICIPATING_MIN_DIFF_SEC = 10
+    return monitor
+
+
+def test_warn_only_for_enough_spread_unordered_requests(monitor, clock):
+    for req_id in range(20):
+        monitor.requestUnOrdered('client', req_id)
+        clock.now += 1
+    # 20 unordered requests, but they are not spread enough
+    assert not monitor.warn_has_lot_unordered_requests()
+
+    clock.now += 10
+    monitor.requestUnOrdered('client', 20)
+    assert monitor.warn_has_lot_unordered_requests()
+
+
+def test_ordered_requests_are_not_counted(monitor, clock):
+    for req_id in range(3):
+        monitor.requestUnOrdered('client', req_id)
+        clock.now += 11
+    assert monitor.warn_has_lot_unordered_requests()
+
+    # Ordering by a backup instance does not matter
+    monitor.requestOrdered([('client', 1)], 1)
+    assert monitor.warn_has_lot_unordered_requests()
+
+    monitor.requestOrdered([('client', 1)], 0, byMaster=True)
+    assert not monitor.warn_has_lot_unordered_requests()
+
+    # Ordering the same request again does not change anything
+    monitor.requestOrdered([('client', 1)], 0, byMaster=True)
+    monitor.requestUnOrdered('client', 1)
+    assert not monitor.warn_has_lot_unordered_requests()
+
+
+def test_requests_out_of_window_are_forgotten(monitor, clock):
+    for req_id in range(3):
+        monitor.requestUnOrdered('client', req_id)
+        clock.now += 11
+    monitor.requestOrdered([('client', 0)], 0, byMaster=True)
+    assert monitor.ordered_requests_keys == {('client', 0)}
+
+    clock.now += 60
+    assert not monitor.warn_has_lot_unordered_requests()
+    assert not monitor.ordered_requests_keys
+    assert not monitor._unordered_started_at
+
+    # A request which was ordered before and is sent for ordering again
+    monitor.requestUnOrdered('client', 0)
+    assert list(monitor._unordered_started_at) == [clock.now]
+
+
+def test_restarted_request_is_counted_once(monitor, clock):
+    for _ in range(3):
+        monitor.requestUnOrdered('client', 1)
+        clock.now += 11
+    assert len(monitor._unordered_started_at) == 1
+    assert not monitor.warn_has_lot_unordered_requests()
+
+
+def test_total_requests_counted_when_ordered_by_all_instances(monitor,
+                                                              clock):
+    monitor.requestUnOrdered('client', 1)
+    monitor.requestUnOrdered('client', 2)
+
+    monitor.requestOrdered([('client', 1), ('client', 2)], 0, byMaster=True)
+    assert monitor.totalRequests == 0
+    monitor.requestOrdered([('client', 1)], 1)
+    assert monitor.totalRequests == 1
+    monitor.requestOrdered([('client', 2)], 1)
+    assert monitor.totalRequests == 2
+
+    # Requests ordered by the slowest instance are counted
+    monitor.addInstance()
+    monitor.requestOrdered([('client', 1)], 2)
+    assert monitor.totalRequests == 3
+    monitor.requestOrdered([('client', 2)], 1)
+    assert monitor.totalRequests == 3
+    monitor.requestOrdered([('client', 2)], 2)
+    assert monitor.totalRequests == 4
+
+    monitor.removeInstance(2)
+    monitor.reset()
+    assert list(monitor._ordered_requests_counts) == [0, 0]
+    assert not monitor.requestOrderingStarted
+    assert not monitor._unordered_started_at
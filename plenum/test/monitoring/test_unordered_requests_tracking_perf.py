@@ -0,0 +1,35 @@
+import time
+
+import pytest
+
+from plenum.server.instances import Instances
+from plenum.server.monitor import Monitor
+
+
+@pytest.mark.parametrize('in_flight', [1000, 10000, 50000])
+def testMeasureRequestIntakeTime(tconf, in_flight):
+    monitor = Monitor('Alpha', Delta=tconf.DELTA, Lambda=tconf.LAMBDA,
+                      Omega=tconf.OMEGA, instances=Instances(),
+                      nodestack=None, blacklister=None, nodeInfo={},
+                      notifierEventTriggeringConfig={}, pluginPaths=[])
+    for _ in range(4):
+        monitor.addInstance()
+    for req_id in range(in_flight):
+        monitor.requestUnOrdered('client', req_id)
+
+    measured = 1000
+    start = time.perf_counter()
+    for req_id in range(in_flight, in_flight + measured):
+        monitor.requestUnOrdered('client', req_id)
+    intake_time = (time.perf_counter() - start) / measured
+
+    start = time.perf_counter()
+    for req_id in range(in_flight, in_flight + measured):
+        for inst_id in range(4):
+            monitor.requestOrdered([('client', req_id)], inst_id,
+                                   byMaster=inst_id == 0)
+    ordering_time = (time.perf_counter() - start) / measured
+
+    print("With {} requests in flight a request is taken in {} seconds and "
+          "ordered by all instances in {} seconds".
+          format(in_flight, intake_time, ordering_time))
@@ -0,0 +1,87 @@
+import pytest
+
+from ledger.compact_merkle_tree import CompactMerkleTree
+from plenum.common.batched import Batched
+from plenum.common.ledger import Ledger
+from plenum.common.ledger_manager import LedgerManager
+from plenum.common.messages.node_messages import CatchupReq
+from plenum.common.constants import DOMAIN_LEDGER_ID
+from plenum.persistence.leveldb_hash_store import LevelDbHashStore
+from stp_core.validators.message_length_validator import MessageLenValidator
+from stp_zmq.zstack import ZStack
+
+TXN_COUNT = 200
+MSG_LEN_LIMIT = 4000
+
+
+class FakeNodeStack(Batched):
+    serializeMsg = staticmethod(ZStack.serializeMsg)
+
+    def __init__(self):
+        Batched.__init__(self)
+        self.msg_len_val = MessageLenValidator(MSG_LEN_LIMIT)
+
+
+class FakeNode:
+    def __init__(self):
+        self.name = 'Node1'
+        self.nodestack = FakeNodeStack()
+
+    @staticmethod
+    def update_txn_with_extra_data(txn):
+        return txn
+
+
+@pytest.fixture()
+def ledger(tdir_for_func):
+    hash_store = LevelDbHashStore(dataDir=tdir_for_func)
+    ledger = Ledger(CompactMerkleTree(hashStore=hash_store),
+                    dataDir=tdir_for_func)
+    ledger.addTxns([{'type': '1', 'dest': 'nym{}'.format(i),
+                     'data': 'x' * (i % 50)} for i in range(TXN_COUNT)])
+    yield ledger
+    ledger.stop()
+
+
+@pytest.fixture()
+def ledger_manager(ledger):
+    ledger_manager = LedgerManager(FakeNode(), ownedByNode=True)
+    ledger_manager.addLedger(DOMAIN_LEDGER_ID, ledger)
+    return ledger_manager
+
+
+def sent_catchup_reps(ledger_manager, start, end, catchup_till):
+    sent = []
+
+    def send_to(msg, to, message_splitter=None):
+        sent.append(msg)
+
+    ledger_manager.sendTo = send_to
+    ledger_manager.processCatchupReq(
+        CatchupReq(DOMAIN_LEDGER_ID, start, end, catchup_till), 'Node2')
+    return sent
+
+
+@pytest.mark.parametrize('start, end', [(1, TXN_COUNT), (17, 150)])
+def test_catchup_reps_fit_message_limit(ledger, ledger_manager, start, end):
+    sent = sent_catchup_reps(ledger_manager, start, end, TXN_COUNT)
+    assert len(sent) > 1
+
+    seq_nos = []
+    for rep in sent:
+        # Replies do not need to be split again
+        assert len(ledger_manager.nodestack.sign_and_serialize(rep)) <= \
+            MSG_LEN_LIMIT
+        rep_seq_nos = list(rep.txns.keys())
+        assert rep.consProof == ledger_manager._make_consistency_proof(
+            ledger, rep_seq_nos[-1], TXN_COUNT)
+        seq_nos.extend(rep_seq_nos)
+    assert seq_nos == list(range(start, end + 1))
+
+
+def test_catchup_rep_with_txn_larger_than_limit(ledger, ledger_manager):
+    ledger.add({'type': '1', 'dest': 'big', 'data': 'x' * MSG_LEN_LIMIT})
+    sent = sent_catchup_reps(ledger_manager, TXN_COUNT - 1, TXN_COUNT + 1,
+                             TXN_COUNT + 1)
+    assert [list(rep.txns.keys()) for rep in sent] == \
+        [[TXN_COUNT - 1, TXN_COUNT], [TXN_COUNT + 1]]
@@ -0,0 +1,46 @@
+import time
+
+from sortedcontainers import SortedDict
+
+from ledger.compact_merkle_tree import CompactMerkleTree
+from plenum.common.constants import DOMAIN_LEDGER_ID
+from plenum.common.ledger import Ledger
+from plenum.common.ledger_manager import LedgerManager
+from plenum.common.messages.node_messages import CatchupRep
+from plenum.persistence.leveldb_hash_store import LevelDbHashStore
+from plenum.test.node_catchup.test_catchup_rep_chunks import FakeNode
+
+
+def testMeasureServingLargeCatchupRange(tdir_for_func):
+    count = 5000
+    hash_store = LevelDbHashStore(dataDir=tdir_for_func)
+    ledger = Ledger(CompactMerkleTree(hashStore=hash_store),
+                    dataDir=tdir_for_func)
+    ledger.addTxns([{'type': '1', 'dest': 'nym{}'.format(i),
+                     'verkey': 'x' * 44} for i in range(count)])
+    ledger_manager = LedgerManager(FakeNode(), ownedByNode=True)
+    ledger_manager.addLedger(DOMAIN_LEDGER_ID, ledger)
+    stack = ledger_manager.nodestack
+
+    timings = {}
+    # Whole range in one reply split till the parts fit
+    start = time.perf_counter()
+    rep = CatchupRep(DOMAIN_LEDGER_ID, SortedDict(ledger.getAllTxn(1, count)),
+                     ledger_manager._make_consistency_proof(ledger, count,
+                                                            count))
+    parts, _ = stack.prepare_for_sending(
+        rep, None, ledger_manager._make_split_for_catchup_rep(ledger, count))
+    timings['split whole range into {} replies'.format(len(parts))] = \
+        time.perf_counter() - start
+
+    start = time.perf_counter()
+    parts = []
+    for rep in ledger_manager._make_catchup_reps(ledger, DOMAIN_LEDGER_ID,
+                                                 1, count, count):
+        parts.extend(stack.prepare_for_sending(rep, None)[0])
+    timings['streamed range in {} replies'.format(len(parts))] = \
+        time.perf_counter() - start
+    ledger.stop()
+
+    for operation, t in timings.items():
+        print("{} txns: {} took {} seconds".format(count, operation, t))
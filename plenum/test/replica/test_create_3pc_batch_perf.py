@@ -0,0 +1,52 @@
+import time
+
+import base58
+import pytest
+
+from plenum.common.constants import DOMAIN_LEDGER_ID
+from plenum.common.request import Request
+from plenum.server.propagator import Requests
+from plenum.server.replica import Replica
+from plenum.test.helper import randomOperation
+from plenum.test.testing_utils import FakeSomething
+
+
+@pytest.fixture()
+def replica(tconf):
+    node = FakeSomething(
+        name="fake node",
+        ledger_ids=[DOMAIN_LEDGER_ID],
+        viewNo=0,
+        requests=Requests(),
+        utc_epoch=lambda: int(time.time()),
+    )
+    bls_bft_replica = FakeSomething(
+        update_pre_prepare=lambda params, ledger_id: params,
+    )
+    # A backup replica, so the requests are not applied while batching
+    return Replica(node, instId=1, config=tconf,
+                   bls_bft_replica=bls_bft_replica)
+
+
+@pytest.mark.parametrize('queue_size', [1000, 100000])
+def testMeasureBatchCreationTime(replica, tconf, queue_size):
+    queue = replica.requestQueues[DOMAIN_LEDGER_ID]
+    identifier = base58.b58encode(b'0' * 16)
+    for req_id in range(queue_size):
+        req = Request(identifier=identifier, reqId=req_id,
+                      operation=randomOperation())
+        req_state = replica.requests.add(req)
+        req_state.finalised = req
+        queue.add(req.key)
+
+    start = time.perf_counter()
+    batches = 0
+    while queue:
+        pre_prepare = replica.create3PCBatch(DOMAIN_LEDGER_ID)
+        assert len(pre_prepare.reqIdr) <= tconf.Max3PCBatchSize
+        batches += 1
+    total_time = time.perf_counter() - start
+
+    assert batches == -(-queue_size // tconf.Max3PCBatchSize)
+    print("Creating {} batches from a queue of {} requests took {} seconds".
+          format(batches, queue_size, total_time))
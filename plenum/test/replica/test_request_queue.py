@@ -0,0 +1,46 @@
+import pytest
+
+from plenum.server.request_queue import RequestQueue
+
+
+def test_keys_are_kept_in_order_of_adding():
+    queue = RequestQueue()
+    for key in [('a', 1), ('b', 1), ('a', 2), ('b', 1)]:
+        queue.add(key)
+
+    assert len(queue) == 3
+    assert list(queue) == [('a', 1), ('b', 1), ('a', 2)]
+    assert queue[0] == ('a', 1)
+    assert queue[-1] == ('a', 2)
+    with pytest.raises(IndexError):
+        queue[3]
+
+
+def test_discard():
+    queue = RequestQueue(range(5))
+    queue.discard(2)
+    queue.discard(10)
+
+    assert 2 not in queue
+    assert 3 in queue
+    assert list(queue) == [0, 1, 3, 4]
+
+
+def test_popleft():
+    queue = RequestQueue([1, 2])
+    assert queue.popleft() == 1
+    assert queue.popleft() == 2
+    assert not queue
+    with pytest.raises(IndexError):
+        queue.popleft()
+
+
+def test_take():
+    queue = RequestQueue(range(10))
+
+    assert queue.take(4) == [0, 1, 2, 3]
+    assert queue.take(0) == []
+    queue.add(0)
+    assert queue.take(10) == [4, 5, 6, 7, 8, 9, 0]
+    assert queue.take(1) == []
+    assert len(queue) == 0
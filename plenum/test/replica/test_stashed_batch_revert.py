@@ -0,0 +1,99 @@
+import base58
+import pytest
+
+from common.serializers.serialization import state_roots_serializer
+from ledger.compact_merkle_tree import CompactMerkleTree
+from plenum.common.constants import DOMAIN_LEDGER_ID
+from plenum.common.ledger import Ledger
+from plenum.common.request import Request
+from plenum.server.propagator import Requests
+from plenum.server.replica import Replica
+from plenum.test.testing_utils import FakeSomething
+from state.pruning_state import PruningState
+from storage.kv_in_memory import KeyValueStorageInMemory
+
+
+def apply_req(state, ledger, req):
+    ledger.appendTxns([req.operation])
+    state.set(req.digest.encode(), str(req.reqId).encode())
+
+
+def make_state():
+    state = PruningState(KeyValueStorageInMemory())
+    # Trie nodes are read from the database only
+    state._trie.node_cache = None
+    return state
+
+
+@pytest.fixture()
+def replica(tconf, tdir_for_func):
+    state = make_state()
+    ledger = Ledger(CompactMerkleTree(), dataDir=tdir_for_func)
+    node = FakeSomething(
+        name="fake node",
+        ledger_ids=[DOMAIN_LEDGER_ID],
+        viewNo=0,
+        requests=Requests(),
+        getState=lambda ledger_id: state,
+        getLedger=lambda ledger_id: ledger,
+        doDynamicValidation=lambda req: None,
+        applyReq=lambda req, cons_time: apply_req(state, ledger, req),
+    )
+    bls_bft_replica = FakeSomething()
+    yield Replica(node, instId=0, isMaster=True, config=tconf,
+                  bls_bft_replica=bls_bft_replica)
+    ledger.stop()
+
+
+def pre_prepare_for(replica, expected_state, expected_ledger, pp_seq_no):
+    identifier = base58.b58encode(b'0' * 16)
+    reqs = [Request(identifier=identifier, reqId=req_id,
+                    operation={'type': 'buy', 'amount': req_id})
+            for req_id in range(pp_seq_no * 10, pp_seq_no * 10 + 5)]
+    for req in reqs:
+        replica.requests.add(req).finalised = req
+        apply_req(expected_state, expected_ledger, req)
+    return FakeSomething(
+        viewNo=0,
+        ppSeqNo=pp_seq_no,
+        ppTime=0,
+        reqIdr=[req.key for req in reqs],
+        discarded=len(reqs),
+        digest=replica.batchDigest(reqs),
+        ledgerId=DOMAIN_LEDGER_ID,
+        stateRootHash=state_roots_serializer.serialize(
+            bytes(expected_state.headHash)),
+        txnRootHash=expected_ledger.hashToStr(
+            expected_ledger.uncommittedRootHash))
+
+
+def test_stashed_batch_can_be_reverted_to(replica, tdir_for_func):
+    """
+    A batch which is applied but not created, as when the node is not
+    participating, can be reverted to after a later batch
+    """
+    expected_state = make_state()
+    expected_ledger = Ledger(CompactMerkleTree(), dataDir=tdir_for_func,
+                             fileName='expected')
+    state = replica.node.getState(DOMAIN_LEDGER_ID)
+    ledger = replica.node.getLedger(DOMAIN_LEDGER_ID)
+
+    pp1 = pre_prepare_for(replica, expected_state, expected_ledger, 1)
+    assert replica._apply_pre_prepare(pp1, 'other') is None
+    root_after_pp1 = state.headHash
+
+    pp2 = pre_prepare_for(replica, expected_state, expected_ledger, 2)
+    assert replica._apply_pre_prepare(pp2, 'other') is None
+    # The later batch is created, which flushes the state
+    state.flush()
+    replica.node.onBatchRejected = lambda ledger_id: None
+    replica.revert(DOMAIN_LEDGER_ID, root_after_pp1, len(pp2.reqIdr))
+
+    assert state.headHash == root_after_pp1
+    assert ledger.uncommitted_size == len(pp1.reqIdr)
+    for pp, applied in ((pp1, True), (pp2, False)):
+        for req_key in pp.reqIdr:
+            req = replica.requests[req_key].finalised
+            value = state.get(req.digest.encode(), isCommitted=False)
+            assert value == (str(req.reqId).encode() if applied else None)
+    expected_ledger.stop()
@@ -0,0 +1,37 @@
+import base58
+
+from plenum.common.constants import BATCH, OP_FIELD_NAME
+from plenum.common.request import SafeRequest
+from plenum.common.types import f
+from plenum.server.node import Node
+from plenum.test.testing_utils import FakeSomething
+
+IDR = base58.b58encode(b'1' * 16)
+SIG = base58.b58encode(b'2' * 64)
+
+
+def request(req_id, **operation):
+    return {f.IDENTIFIER.nm: IDR, f.REQ_ID.nm: req_id, f.SIG.nm: SIG,
+            'operation': dict(type='1', dest=IDR, **operation)}
+
+
+def test_only_valid_requests_verified_in_bulk():
+    verified = []
+    authnr = FakeSomething(
+        verify_in_bulk=lambda reqs, executor: verified.extend(reqs))
+    node = FakeSomething(_client_request_class=SafeRequest,
+                         _sigVerificationExecutor=FakeSomething(),
+                         isClientBlacklisted=lambda frm: False,
+                         authNr=lambda req: authnr)
+    node._valid_req_data_to_verify = \
+        Node._valid_req_data_to_verify.__get__(node)
+    node._parseClientBatchMsgs = Node._parseClientBatchMsgs.__get__(node)
+
+    valid = [request(1), request(2)]
+    batch = {OP_FIELD_NAME: BATCH,
+             f.MSGS.nm: [valid[1], request(-2)], f.SIG.nm: None}
+    Node.verifySignaturesInBulk(node, [(valid[0], 'client'),
+                                       (request(-1), 'client'),
+                                       (batch, 'client')])
+
+    assert verified == [SafeRequest(**req).as_dict for req in valid]
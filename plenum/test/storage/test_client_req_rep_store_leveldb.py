@@ -0,0 +1,71 @@
+import pytest
+
+from plenum.common.request import Request
+from plenum.common.types import f
+from plenum.persistence.client_req_rep_store_leveldb import \
+    ClientReqRepStoreLeveldb
+
+IDR = 'idr1'
+
+
+@pytest.yield_fixture()
+def store(tdir_for_func):
+    store = ClientReqRepStoreLeveldb(tdir_for_func)
+    yield store
+    store.close()
+
+
+def msg(req_id, reason=None):
+    m = {f.IDENTIFIER.nm: IDR, f.REQ_ID.nm: req_id}
+    if reason is not None:
+        m[f.REASON.nm] = reason
+    return m
+
+
+def add_messages(store, req_id):
+    store.addRequest(Request(IDR, req_id, {'type': '1', 'dest': 'x'}))
+    store.addAck(msg(req_id), 'Alpha')
+    store.addAck(msg(req_id), 'Beta')
+    store.addNack(msg(req_id, 'bad'), 'Gamma')
+    store.addReject(msg(req_id, 'worse'), 'Delta')
+    assert store.addReply(IDR, req_id, 'Alpha', {'seqNo': req_id}) == 1
+    assert store.addReply(IDR, req_id, 'Beta', {'seqNo': req_id}) == 2
+
+
+def check_messages(store, req_id):
+    assert store.hasRequest(IDR, req_id)
+    assert store.getRequest(IDR, req_id).reqId == req_id
+    assert store.getAcks(IDR, req_id) == ['Alpha', 'Beta']
+    assert store.getNacks(IDR, req_id) == {'Gamma': 'bad'}
+    assert store.getRejects(IDR, req_id) == {'Delta': 'worse'}
+    assert store.getReplies(IDR, req_id) == {'Alpha': {'seqNo': req_id},
+                                             'Beta': {'seqNo': req_id}}
+
+
+def test_messages_read_before_and_after_flush(store):
+    add_messages(store, 1)
+    check_messages(store, 1)
+    store.flush()
+    check_messages(store, 1)
+
+    # Messages of requests with common prefix of keys are not mixed
+    add_messages(store, 10)
+    check_messages(store, 1)
+    check_messages(store, 10)
+    assert not store.hasRequest(IDR, 2)
+    assert store.getRequest(IDR, 2) is None
+    assert store.getReplies(IDR, 2) == {}
+
+
+def test_last_req_id_is_persisted(tdir_for_func):
+    store = ClientReqRepStoreLeveldb(tdir_for_func)
+    assert store.lastReqId == 0
+    for req_id in (5, 12, 7):
+        add_messages(store, req_id)
+    assert store.lastReqId == 12
+    store.close()
+
+    store = ClientReqRepStoreLeveldb(tdir_for_func)
+    assert store.lastReqId == 12
+    check_messages(store, 7)
+    store.close()
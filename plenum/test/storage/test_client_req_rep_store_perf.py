@@ -0,0 +1,39 @@
+import time
+
+import pytest
+
+from plenum.common.request import Request
+from plenum.common.types import f
+from plenum.persistence.client_req_rep_store_file import ClientReqRepStoreFile
+from plenum.persistence.client_req_rep_store_leveldb import \
+    ClientReqRepStoreLeveldb
+
+
+@pytest.mark.parametrize('store_class', [ClientReqRepStoreFile,
+                                         ClientReqRepStoreLeveldb])
+def testMeasureClientReqRepStore(tdir_for_func, store_class):
+    count = 2000
+    nodes = ['Alpha', 'Beta', 'Gamma', 'Delta']
+    store = store_class(tdir_for_func)
+
+    timings = {}
+    start = time.perf_counter()
+    for req_id in range(1, count + 1):
+        store.addRequest(Request('idr', req_id, {'type': '1'}))
+        for node in nodes:
+            store.addAck({f.IDENTIFIER.nm: 'idr', f.REQ_ID.nm: req_id}, node)
+        for node in nodes:
+            store.addReply('idr', req_id, node, {'seqNo': req_id})
+        # The client flushes once per prod cycle
+        store.flush()
+    timings['{} requests with acks and replies'.format(count)] = \
+        time.perf_counter() - start
+
+    start = time.perf_counter()
+    store.close()
+    assert store_class(tdir_for_func).lastReqId == count
+    timings['reopening and getting last reqId'] = time.perf_counter() - start
+
+    for operation, t in timings.items():
+        print("{}: {} took {} seconds".
+              format(store_class.__name__, operation, t))
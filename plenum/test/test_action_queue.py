@@ -82,3 +82,84 @@ def test_action_cancellation_by_action():
 
         assert 'meth2' in q1.results
         assert 'meth3' not in q1.results
+
+
+def test_event_driven_looper_wakes_for_scheduled_action():
+    class IdleQ(Q1):
+        prods = 0
+
+        async def prod(self, limit: int=None) -> int:
+            self.prods += 1
+            return await super().prod(limit)
+
+        def max_idle_time(self):
+            return self._timeToNextAction()
+
+    with Looper(eventDriven=True) as looper:
+        q1 = IdleQ('q1')
+        q1.meth1 = partial(q1.meth, 'meth1')
+        looper.add(q1)
+
+        scheduled_at = time.perf_counter()
+        q1._schedule(partial(q1.meth1, 1), 0.5)
+        looper.runFor(1)
+
+        assert [t[0] for t in q1.results['meth1']] == [1]
+        assert q1.results['meth1'][0][1] - scheduled_at < 0.6
+        # The looper was not polling while waiting for the action
+        assert q1.prods < 10
+
+
+def test_delayed_actions_run_in_order_of_due_time():
+    q1 = Q1('q1')
+    q1.meth1 = partial(q1.meth, 'meth1')
+    for x, delay in ((1, 0.03), (2, 0.01), (3, 0.02)):
+        q1._schedule(partial(q1.meth1, x), delay)
+    q1._schedule(partial(q1.meth1, 4))
+    assert q1._timeToNextAction() == 0
+
+    time.sleep(0.05)
+    assert q1._serviceActions() == 4
+    assert [t[0] for t in q1.results['meth1']] == [2, 3, 1, 4]
+    assert q1._timeToNextAction() == float('inf')
+    assert not q1.scheduled and not q1.scheduledIds
+
+
+def test_cancelled_actions_removed_from_stash():
+    q1 = Q1('q1')
+    q1.meth1 = partial(q1.meth, 'meth1')
+    aids = [q1._schedule(partial(q1.meth1, i), 10 + i) for i in range(10)]
+    first_due = q1._timeToNextAction()
+    assert 9 < first_due <= 10
+
+    q1._cancel(aid=aids[0])
+    assert q1._timeToNextAction() > first_due
+    for aid in aids[1:6]:
+        q1._cancel(aid=aid)
+    assert len(q1.aqStash) < 10
+    assert len(q1.scheduledIds) == 4
+
+    action = partial(q1.meth1, 'x')
+    q1._schedule(action, 5)
+    q1._schedule(action, 20)
+    q1._cancel(action=action)
+    assert action not in q1.scheduled
+    assert len(q1.scheduledIds) == 4
+    assert 14 < q1._timeToNextAction() <= 16
+
+
+def test_all_actions_cleared():
+    q1 = Q1('q1')
+    q1.meth1 = partial(q1.meth, 'meth1')
+    q1._schedule(partial(q1.meth1, 1))
+    aids = [q1._schedule(partial(q1.meth1, i), 10 + i) for i in range(4)]
+    q1._cancel(aid=aids[0])
+
+    q1._clearActions()
+    assert not q1.actionQueue and not q1.aqStash and q1.aqCancelled == 0
+    assert not q1.scheduled and not q1.scheduledIds
+    assert q1._timeToNextAction() == float('inf')
+
+    q1._schedule(partial(q1.meth1, 5))
+    assert q1._serviceActions() == 1
+    assert [t[0] for t in q1.results['meth1']] == [5]
@@ -0,0 +1,60 @@
+import logging
+import random
+import time
+
+import pytest
+
+from plenum.server.has_action_queue import HasActionQueue
+
+
+@pytest.fixture()
+def noTraceLogs():
+    # Tracing every scheduled action would be measured otherwise
+    root = logging.getLogger()
+    level = root.level
+    root.setLevel(logging.INFO)
+    yield
+    root.setLevel(level)
+
+
+def testMeasureActionQueueWithManyPendingActions(noTraceLogs):
+    count = 100000
+    q = HasActionQueue()
+    ran = []
+    actions = [lambda i=i: ran.append(i) for i in range(count)]
+
+    timings = {}
+    start = time.perf_counter()
+    aids = [q._schedule(action, random.uniform(0.5, 1.5))
+            for action in actions]
+    timings['scheduling {} actions'.format(count)] = \
+        time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(count):
+        q._timeToNextAction()
+    timings['{} lookups of next action time'.format(count)] = \
+        time.perf_counter() - start
+
+    start = time.perf_counter()
+    for aid in aids[::2]:
+        q._cancel(aid=aid)
+    timings['cancelling {} actions by id'.format(count // 2)] = \
+        time.perf_counter() - start
+
+    start = time.perf_counter()
+    for action in actions[1:1000:2]:
+        q._cancel(action=action)
+    timings['cancelling 500 actions'] = time.perf_counter() - start
+
+    time.sleep(max(0, q._timeToNextAction()))
+    serviced = 0
+    start = time.perf_counter()
+    while q.scheduledIds:
+        serviced += q._serviceActions()
+    timings['running {} actions while they become due'.format(serviced)] = \
+        time.perf_counter() - start
+    assert len(ran) == count // 2 - 500
+
+    for operation, t in timings.items():
+        print("{} took {} seconds".format(operation, t))
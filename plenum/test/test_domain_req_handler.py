@@ -0,0 +1,163 @@
+import base58
+import pytest
+
+from ledger.compact_merkle_tree import CompactMerkleTree
+from plenum.common.constants import TXN_TYPE, NYM, TARGET_NYM, ROLE, \
+    STEWARD, TRUSTEE, VERKEY
+from plenum.common.ledger import Ledger
+from plenum.common.request import Request
+from plenum.server.domain_req_handler import DomainRequestHandler
+from state.pruning_state import PruningState
+from storage.kv_in_memory import KeyValueStorageInMemory
+
+
+def nym_txn(nym, role=None):
+    txn = {TXN_TYPE: NYM, TARGET_NYM: nym}
+    if role is not None:
+        txn[ROLE] = role
+    return txn
+
+
+@pytest.fixture()
+def req_handler(tdir_for_func, tconf):
+    ledger = Ledger(CompactMerkleTree(), dataDir=tdir_for_func)
+    for i, role in enumerate((STEWARD, STEWARD, TRUSTEE, None)):
+        ledger.add(nym_txn('nym{}'.format(i), role))
+    handler = DomainRequestHandler(ledger,
+                                   PruningState(KeyValueStorageInMemory()),
+                                   tconf, [], None, KeyValueStorageInMemory())
+    handler.initStewardsCount()
+    yield handler
+    ledger.stop()
+
+
+def apply_nym(handler, nym, role=None):
+    req = Request(identifier='nym0', reqId=1,
+                  operation=nym_txn(nym, role), signature='sig')
+    handler.apply(req, 1)
+
+
+def test_stewards_counted_from_ledger_once(req_handler, monkeypatch):
+    assert req_handler.countStewards() == 2
+    assert req_handler.countStewards(isCommitted=False) == 2
+
+    monkeypatch.setattr(req_handler.ledger, 'getAllTxn',
+                        lambda *args, **kwargs: pytest.fail('Ledger read'))
+    assert not req_handler.stewardThresholdExceeded(req_handler.config)
+    apply_nym(req_handler, 'new_steward', STEWARD)
+    apply_nym(req_handler, 'new_trustee', TRUSTEE)
+    assert req_handler.countStewards() == 2
+    assert req_handler.countStewards(isCommitted=False) == 3
+
+    ledger = req_handler.ledger
+    state = req_handler.state
+    req_handler.commit(2,
+                       base58.b58encode(state.headHash),
+                       ledger.hashToStr(ledger.uncommittedRootHash))
+    assert req_handler.countStewards() == 3
+    assert req_handler.countStewards(isCommitted=False) == 3
+
+
+def test_stewards_count_of_rejected_batch_reverted(req_handler):
+    state = req_handler.state
+    apply_nym(req_handler, 'steward1', STEWARD)
+    req_handler.onBatchCreated(state.headHash)
+    head = state.headHash
+    apply_nym(req_handler, 'steward2', STEWARD)
+    apply_nym(req_handler, 'steward3', STEWARD)
+    assert req_handler.countStewards(isCommitted=False) == 5
+
+    state.revertToHead(head)
+    req_handler.ledger.discardTxns(2)
+    req_handler.onBatchRejected()
+    assert req_handler.countStewards() == 2
+    assert req_handler.countStewards(isCommitted=False) == 3
+
+
+def restarted(handler):
+    restarted = DomainRequestHandler(handler.ledger, handler.state,
+                                     handler.config, [], None,
+                                     handler.stewards_count_store)
+    restarted.initStewardsCount()
+    return restarted
+
+
+def test_stored_stewards_count_used_on_start(req_handler, monkeypatch):
+    ledger = req_handler.ledger
+    apply_nym(req_handler, 'new_steward', STEWARD)
+    req_handler.commit(1, base58.b58encode(req_handler.state.headHash),
+                       ledger.hashToStr(ledger.uncommittedRootHash))
+    # Txns committed to the ledger but not counted, as when the node
+    # crashes after committing them
+    ledger.add(nym_txn('uncounted_steward', STEWARD))
+    ledger.add(nym_txn('uncounted_trustee', TRUSTEE))
+
+    read_from = []
+    get_all_txn = ledger.getAllTxn
+
+    def read_txns(frm=None, to=None):
+        read_from.append(frm)
+        return get_all_txn(frm=frm, to=to)
+
+    monkeypatch.setattr(ledger, 'getAllTxn', read_txns)
+    handler = restarted(req_handler)
+    assert read_from == [6]
+    assert handler.countStewards() == 4
+    assert restarted(handler).countStewards() == 4
+    assert read_from == [6]
+
+
+def test_stewards_recounted_for_other_ledger(req_handler):
+    req_handler.stewards_count_store.put(req_handler.stewardsCountKey,
+                                         '10:100')
+    assert restarted(req_handler).countStewards() == 2
+
+
+def test_stewards_count_updated_with_committed_txns(req_handler):
+    txn = nym_txn('caught_up_steward', STEWARD)
+    req_handler.ledger.add(txn)
+    req_handler.updateState([txn], isCommitted=True)
+    assert req_handler.countStewards() == 3
+    assert req_handler.countStewards(isCommitted=False) == 3
+
+
+def apply_verkey(handler, nym, verkey):
+    req = Request(identifier='nym0', reqId=1,
+                  operation={**nym_txn(nym), VERKEY: verkey},
+                  signature='sig')
+    handler.apply(req, 1)
+
+
+def test_verkey_listeners_notified_of_changes(req_handler):
+    changed = []
+    req_handler.register_verkey_listener(changed.append)
+    state = req_handler.state
+    apply_verkey(req_handler, 'nym3', '~verkey1')
+    apply_verkey(req_handler, 'nym3', '~verkey1')
+    apply_nym(req_handler, 'nym3', STEWARD)
+    assert changed == ['nym3']
+    req_handler.onBatchCreated(state.headHash)
+    head = state.headHash
+
+    apply_verkey(req_handler, 'nym1', '~verkey2')
+    assert changed == ['nym3', 'nym1']
+
+    # Verkey of the rejected batch is changed back
+    state.revertToHead(head)
+    req_handler.ledger.discardTxns(1)
+    req_handler.onBatchRejected()
+    assert 'nym1' in changed[2:]
+    assert req_handler._uncommittedVerkeyNyms == {'nym3'}
+
+    ledger = req_handler.ledger
+    req_handler.commit(3,
+                       base58.b58encode(state.headHash),
+                       ledger.hashToStr(ledger.uncommittedRootHash))
+    assert not req_handler._uncommittedVerkeyNyms
+
+
+def test_stewards_not_counted_before_init(req_handler):
+    handler = DomainRequestHandler(req_handler.ledger, req_handler.state,
+                                   req_handler.config, [], None)
+    with pytest.raises(RuntimeError):
+        handler.countStewards()
@@ -139,7 +139,8 @@ class TestNodeCore(StackedTester):
             MockedBlacklister(),
             nodeInfo=self.nodeInfo,
             notifierEventTriggeringConfig=notifierEventTriggeringConfig,
-            pluginPaths=pluginPaths)
+            pluginPaths=pluginPaths,
+            clientAuthNr=self.sigCachingAuthNr)
         for i in range(len(self.replicas)):
             self.monitor.addInstance()
         self.replicas._monitor = self.monitor
@@ -283,7 +284,8 @@ class TestNodeCore(StackedTester):
         return TestDomainRequestHandler(self.domainLedger,
                                         self.states[DOMAIN_LEDGER_ID],
                                         self.config, self.reqProcessors,
-                                        self.bls_bft.bls_store)
+                                        self.bls_bft.bls_store,
+                                        self.stewardsCountDB)
 
     def init_core_authenticator(self):
         state = self.getState(DOMAIN_LEDGER_ID)
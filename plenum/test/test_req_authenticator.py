@@ -1,10 +1,15 @@
 import pytest
 
-from plenum.common.constants import TXN_TYPE, DATA, GET_TXN, DOMAIN_LEDGER_ID
+from plenum.common.constants import TXN_TYPE, DATA, GET_TXN, DOMAIN_LEDGER_ID, \
+    NYM, NODE
 from plenum.common.exceptions import NoAuthenticatorFound
-from plenum.common.types import f
+from plenum.common.request import Request
+from plenum.common.signer_simple import SimpleSigner
+from plenum.common.types import f, OPERATION
 from plenum.common.util import randomString
+from plenum.common.verifier import DidVerifier
 from plenum.server.client_authn import SimpleAuthNr, CoreAuthNr
+from plenum.server.propagator import Requests
 from plenum.server.req_authenticator import ReqAuthenticator
 from plenum.test.plugin.helper import submitOp
 from plenum.test.pool_transactions.helper import new_client_request
@@ -71,3 +76,60 @@ def test_authentication(pre_reqs, registration, client1, wallet1):
     core_authnr.addIdr(wallet1.defaultId,
                        wallet1.getVerkey(wallet1.defaultId))
     assert req_authnr.authenticate(req.as_dict) == {wallet1.defaultId, }
+
+
+def test_req_authenticator_verifies_only_writes_in_bulk():
+    class RecordingAuthNr(CoreAuthNr):
+        def verify_in_bulk(self, reqs, executor=None, verifier=DidVerifier):
+            bulks.append(reqs)
+            super().verify_in_bulk(reqs, executor, verifier)
+
+    bulks = []
+    signer = SimpleSigner()
+    sa = RecordingAuthNr()
+    sa.addIdr(signer.identifier, signer.verkey)
+    req_authnr = ReqAuthenticator()
+    req_authnr.register_authenticator(sa)
+
+    reqs = []
+    for typ in (NYM, GET_TXN, NODE):
+        m = {OPERATION: {TXN_TYPE: typ}, f.REQ_ID.nm: 1,
+             f.IDENTIFIER.nm: signer.identifier}
+        reqs.append({**m, f.SIG.nm: signer.sign(m)})
+    req_authnr.verify_in_bulk(reqs)
+    assert bulks == [[reqs[0], reqs[2]]]
+    assert len(sa._verified_sigs) == 2
+
+
+def test_requests_forgotten_by_authenticators():
+    signer = SimpleSigner()
+    authnr = CoreAuthNr()
+    authnr.addIdr(signer.identifier, signer.verkey)
+    req_authnr = ReqAuthenticator()
+    req_authnr.register_authenticator(authnr)
+
+    m = {OPERATION: {TXN_TYPE: NYM}, f.REQ_ID.nm: 1,
+         f.IDENTIFIER.nm: signer.identifier}
+    req_data = {**m, f.SIG.nm: signer.sign(m)}
+    for _ in range(2):
+        assert req_authnr.authenticate(req_data) == {signer.identifier}
+    assert (authnr.hits, authnr.misses) == (1, 1)
+
+    req_authnr.forget(req_data)
+    assert not authnr._verified_sigs
+    assert req_authnr.authenticate(req_data) == {signer.identifier}
+    assert (authnr.hits, authnr.misses) == (1, 2)
+
+
+def test_requests_report_removed_request():
+    removed = []
+    requests = Requests(on_removed=removed.append)
+    req = Request(identifier='idr', reqId=1, operation={TXN_TYPE: NYM})
+    requests.add(req)
+    requests.mark_as_forwarded(req, 2)
+    requests.mark_as_executed(req)
+    requests.free(req.key)
+    assert removed == []
+    requests.free(req.key)
+    assert removed == [req]
+    assert req.key not in requests
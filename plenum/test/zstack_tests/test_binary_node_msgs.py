@@ -0,0 +1,96 @@
+from collections import OrderedDict
+
+import pytest
+
+from plenum.common.stacks import NodeZStack, to_json_types
+from stp_core.loop.eventually import eventually
+from stp_core.network.auth_mode import AuthMode
+from stp_core.network.port_dispenser import genHa
+from stp_core.test.helper import prepStacks
+from stp_zmq.test.helper import genKeys
+
+
+@pytest.fixture()
+def stacks(tdir, looper, tconf):
+    names = ['Alpha', 'Beta']
+    genKeys(tdir, names)
+    registry = {name: genHa() for name in names}
+    received = {name: [] for name in names}
+    stacks = []
+    for name, binary_msgs in zip(names, [True, False]):
+        stack_params = dict(name=name, ha=registry[name], basedirpath=tdir,
+                            auth_mode=AuthMode.RESTRICTED.value)
+        stacks.append(NodeZStack(stack_params, received[name].append,
+                                 {n: ha for n, ha in registry.items()
+                                  if n != name},
+                                 config=tconf, binary_msgs=binary_msgs))
+    prepStacks(looper, *stacks, connect=True, useKeys=True)
+    return stacks, received
+
+
+def test_to_json_types():
+    msg = OrderedDict([('op', 'X'), ('keys', {1: b'a', None: (1, 2)}),
+                       ('values', [b'b', ('c', {2.5: True})])])
+    assert to_json_types(msg) == {'op': 'X',
+                                  'keys': {'1': 'a', 'null': [1, 2]},
+                                  'values': ['b', ['c', {'2.5': True}]]}
+
+
+def test_binary_msg_format(stacks):
+    binary, plain = stacks[0]
+    msg = {'op': 'X', 'data': {1: [b'a', 2]}}
+
+    serialized = binary.serializeMsg(msg)
+    assert serialized[:1] != b'{'
+    assert binary.deserializeMsg(serialized) == \
+        plain.deserializeMsg(plain.serializeMsg(msg)) == \
+        {'op': 'X', 'data': {'1': ['a', 2]}}
+
+    # Both stacks receive messages in both formats
+    assert plain.deserializeMsg(serialized) == binary.deserializeMsg(
+        serialized)
+    assert binary.deserializeMsg(plain.serializeMsg(msg)) == \
+        {'op': 'X', 'data': {'1': ['a', 2]}}
+
+
+def test_msgs_and_batches_between_binary_and_json_stacks(looper, stacks):
+    (binary, plain), received = stacks
+
+    def unbatched(name):
+        msgs = []
+        for msg, _ in received[name]:
+            if msg['op'] == 'BATCH':
+                msgs.extend(msg['messages'])
+            else:
+                msgs.append(msg)
+        return msgs
+
+    def check_received(name, expected):
+        assert unbatched(name) == expected
+
+    for stack, other in [(binary, plain), (plain, binary)]:
+        msgs = [{'op': 'X', 'i': i, 'by': stack.name} for i in range(3)]
+        for msg in msgs:
+            stack.send(msg)
+        stack.flushOutBoxes()
+        looper.run(eventually(check_received, other.name, msgs,
+                              retryWait=.1, timeout=5))
+        assert any(msg['op'] == 'BATCH' for msg, _ in received[other.name])
+
+
+def test_binary_batch_is_unpacked_at_once(stacks):
+    binary, plain = stacks[0]
+    msgs = [{'op': 'X', 'i': i, 'data': {1: b'a'}} for i in range(2)]
+    frames = [binary.serializeMsg(msg) for msg in msgs] + [b'pi']
+
+    batch = binary.deserializeMsg(binary._make_batch(frames))
+
+    # Messages of the batch are parsed together with it, health messages
+    # are left as raw frames
+    assert batch == {'op': 'BATCH',
+                     'messages': [{'op': 'X', 'i': 0, 'data': {'1': 'a'}},
+                                  {'op': 'X', 'i': 1, 'data': {'1': 'a'}},
+                                  b'pi'],
+                     'signature': None}
+    assert binary.doProcessReceived(batch, plain.name, None)['messages'] == \
+        batch['messages'][:2]
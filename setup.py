@@ -62,7 +62,8 @@ setup(
     extras_require={
         'tests': tests_require,
         'stats': ['python-firebase'],
-        'benchmark': ['pympler']
+        'benchmark': ['pympler'],
+        'rocksdb': ['python-rocksdb']
     },
     tests_require=tests_require,
     scripts=['scripts/plenum', 'scripts/init_plenum_keys',
@@ -7,6 +7,11 @@ class BaseDB:
     def inc_refcount(self, key, value):
         raise NotImplementedError
 
+    def inc_refcounts(self, items):
+        # Same as `inc_refcount` for each (key, value) of `items`
+        for key, value in items:
+            self.inc_refcount(key, value)
+
     @abstractmethod
     def dec_refcount(self, key):
         raise NotImplementedError
@@ -4,7 +4,7 @@ from typing import Optional
 from state.db.persistent_db import PersistentDB
 from state.state import State
 from state.trie.pruning_trie import BLANK_ROOT, Trie, BLANK_NODE, \
-    bin_to_nibbles
+    bin_to_nibbles, copy_node
 from state.util.fast_rlp import encode_optimized as rlp_encode, \
     decode_optimized as rlp_decode
 from state.util.utils import to_string, isHex
@@ -25,8 +25,15 @@ class PruningState(State):
     # SOME KEY THAT DOES NOT COLLIDE WITH ANY STATE VARIABLE'S NAME
     rootHashKey = b'\x88\xc8\x88 \x9a\xa7\x89\x1b'
 
+    # Number of decoded trie nodes kept in memory
+    NODE_CACHE_SIZE = 4096
+
     def __init__(self, keyValueStorage: KeyValueStorage):
         self._kv = keyValueStorage
+        # Decoded committed head, it is decoded again only once a different
+        # root hash is committed
+        self._committed_head = None
+        self._committed_head_hash = None
         if self.rootHashKey in self._kv:
             rootHash = bytes(self._kv.get(self.rootHashKey))
         else:
@@ -34,7 +41,9 @@ class PruningState(State):
             self._kv.put(self.rootHashKey, BLANK_ROOT)
         self._trie = Trie(
             PersistentDB(self._kv),
-            rootHash)
+            rootHash,
+            node_cache_size=self.NODE_CACHE_SIZE,
+            write_batched=True)
 
     @property
     def head(self):
@@ -46,7 +55,16 @@ class PruningState(State):
     def committedHead(self):
         # The committed head of the state, if the state is a merkle tree then
         # head is the root
-        return self._hash_to_node(self.committedHeadHash)
+        return copy_node(self._get_committed_head())
+
+    def _get_committed_head(self):
+        head_hash = self.committedHeadHash
+        if head_hash != self._committed_head_hash:
+            head = BLANK_NODE if head_hash == BLANK_ROOT \
+                else self._trie._get_node(head_hash)
+            self._committed_head = head
+            self._committed_head_hash = head_hash
+        return self._committed_head
 
     def _hash_to_node(self, node_hash):
         if node_hash == BLANK_ROOT:
@@ -60,13 +78,14 @@ class PruningState(State):
         if not isCommitted:
             val = self._trie.get(key)
         else:
-            val = self._trie._get(self.committedHead,
+            val = self._trie._get(self._get_committed_head(),
                                   bin_to_nibbles(to_string(key)))
         if val:
             return rlp_decode(val)[0]
 
     def get_for_root_hash(self, root_hash, key: bytes) -> Optional[bytes]:
-        root = self._hash_to_node(root_hash)
+        root = BLANK_NODE if root_hash == BLANK_ROOT \
+            else self._trie._get_node(root_hash)
         val = self._trie._get(root,
                               bin_to_nibbles(to_string(key)))
         if val:
@@ -86,8 +105,12 @@ class PruningState(State):
             rootHash = rootHash
         else:
             rootHash = self.headHash
+        self._trie.flush(rootHash)
         self._kv.put(self.rootHashKey, rootHash)
 
+    def flush(self):
+        self._trie.flush()
+
     def revertToHead(self, headHash=None):
         head = self._hash_to_node(headHash)
         self._trie.replace_root_hash(self._trie.root_node, head)
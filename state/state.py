@@ -32,6 +32,12 @@ class State:
     def commit(self, rootHash=None, rootNode=None):
         raise NotImplementedError
 
+    @abstractmethod
+    def flush(self):
+        # Persist the current head so that it can be reverted to, changes
+        # made before it which were reverted are discarded
+        raise NotImplementedError
+
     @abstractmethod
     def revertToHead(self, headHash=None):
         # Revert to the given head
@@ -0,0 +1,29 @@
+import time
+
+import pytest
+
+from state.pruning_state import PruningState
+from storage.kv_store_leveldb import KeyValueStorageLeveldb
+
+
+@pytest.mark.parametrize('cache_size', [0, PruningState.NODE_CACHE_SIZE])
+def testMeasureCommittedStateReads(tempdir, cache_size, monkeypatch):
+    monkeypatch.setattr(PruningState, 'NODE_CACHE_SIZE', cache_size)
+    state = PruningState(KeyValueStorageLeveldb(tempdir, 'state'))
+    keys = ['key{}'.format(i).encode() for i in range(2000)]
+    for key in keys:
+        state.set(key, key)
+    state.commit()
+
+    start = time.perf_counter()
+    for _ in range(3):
+        for key in keys:
+            assert state.get(key) == key
+    elapsed = time.perf_counter() - start
+    print("{} committed state reads with node cache of size {} took {} "
+          "seconds".format(3 * len(keys), cache_size, elapsed))
+    if cache_size:
+        node_cache = state._trie.node_cache
+        print("Node cache hits: {}, misses: {}".
+              format(node_cache.hits, node_cache.misses))
+    state.close()
@@ -0,0 +1,44 @@
+import time
+
+import pytest
+
+from state.db.persistent_db import PersistentDB
+from state.trie.pruning_trie import Trie
+from state.util.fast_rlp import encode_optimized as rlp_encode
+from storage.kv_store_leveldb import KeyValueStorageLeveldb
+
+
+class CountingPersistentDB(PersistentDB):
+    written = 0
+
+    def inc_refcount(self, key, value):
+        self.written += 1
+        super().inc_refcount(key, value)
+
+    def inc_refcounts(self, items):
+        self.written += len(items)
+        super().inc_refcounts(items)
+
+
+@pytest.mark.parametrize('write_batched', [False, True])
+def testMeasureStateWritesPerBatch(tempdir, write_batched):
+    num_batches = 100
+    batch_size = 20
+    db = CountingPersistentDB(KeyValueStorageLeveldb(tempdir, 'state'))
+    trie = Trie(db, write_batched=write_batched)
+
+    start = time.perf_counter()
+    for b in range(num_batches):
+        for i in range(batch_size):
+            key = 'key{}'.format(b * batch_size + i).encode()
+            trie.update(key, rlp_encode([key]))
+        if write_batched:
+            trie.flush()
+    elapsed = time.perf_counter() - start
+    print("{} updates in batches of {} with write batching {} took {} "
+          "seconds, {} trie nodes written".
+          format(num_batches * batch_size, batch_size,
+                 'on' if write_batched else 'off', elapsed, db.written))
+    reopened = Trie(db, trie.root_hash)
+    assert len(reopened.to_dict()) == num_batches * batch_size
+    db._keyValueStorage.close()
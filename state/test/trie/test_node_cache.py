@@ -0,0 +1,85 @@
+import pytest
+
+from state.db.persistent_db import PersistentDB
+from state.pruning_state import PruningState
+from state.trie.pruning_trie import Trie, NodeCache, copy_node
+from state.util.fast_rlp import encode_optimized as rlp_encode, \
+    decode_optimized as rlp_decode
+from storage.kv_in_memory import KeyValueStorageInMemory
+
+
+def fill(trie, count, prefix='v'):
+    for i in range(count):
+        trie.update('k{}'.format(i).encode(),
+                    rlp_encode(['{}{}'.format(prefix, i)]))
+
+
+def test_node_cache_evicts_least_recently_used():
+    cache = NodeCache(2)
+    assert cache.get(b'h1') is None
+    cache.put(b'h1', [b'a'])
+    cache.put(b'h2', [b'b'])
+    assert cache.get(b'h1') == [b'a']
+    cache.put(b'h3', [b'c'])
+
+    assert len(cache) == 2
+    assert cache.get(b'h2') is None
+    assert cache.get(b'h1') == [b'a']
+    assert cache.get(b'h3') == [b'c']
+    assert (cache.hits, cache.misses) == (3, 2)
+
+
+def test_copy_node_copies_embedded_nodes():
+    node = [b'a', [b'b', [b'c', b'']], b'']
+    copied = copy_node(node)
+    assert copied == node
+    copied[1][1][0] = b'x'
+    assert node[1][1][0] == b'c'
+
+
+@pytest.mark.parametrize('cache_size', [4, 1000])
+def test_trie_with_node_cache_same_as_without(cache_size):
+    trie = Trie(PersistentDB(KeyValueStorageInMemory()))
+    cached = Trie(PersistentDB(KeyValueStorageInMemory()),
+                  node_cache_size=cache_size)
+    roots = []
+    for prefix in ('v', 'w', 'x'):
+        fill(trie, 100, prefix)
+        fill(cached, 100, prefix)
+        assert cached.root_hash == trie.root_hash
+        roots.append(cached.root_hash)
+
+    assert cached.node_cache.hits > 0
+    assert len(cached.node_cache) <= cache_size
+    # Updates of nodes taken from the cache did not modify cached nodes
+    for root, prefix in zip(roots, ('v', 'w', 'x')):
+        for i in range(100):
+            root_node = cached._decode_to_node(root)
+            val = cached.get_at(root_node, 'k{}'.format(i).encode())
+            assert rlp_decode(val) == ['{}{}'.format(prefix, i).encode()]
+
+
+def test_committed_head_decoded_once_per_commit():
+    state = PruningState(KeyValueStorageInMemory())
+    for i in range(10):
+        state.set('k{}'.format(i).encode(), b'v')
+    state.commit()
+    node_cache = state._trie.node_cache
+
+    state.get(b'k1')
+    misses = node_cache.misses
+    head = state._get_committed_head()
+    for i in range(10):
+        assert state.get('k{}'.format(i).encode()) == b'v'
+    assert node_cache.misses == misses
+    assert state._get_committed_head() is head
+
+    # A copy is returned so modifying it does not change the cached head
+    state.committedHead[0] = b''
+    assert state.committedHead == head
+
+    state.set(b'k1', b'v1')
+    assert state.get(b'k1') == b'v'
+    state.commit()
+    assert state.get(b'k1') == b'v1'
+    assert state._get_committed_head() is not head
@@ -0,0 +1,56 @@
+from state.db.persistent_db import PersistentDB
+from state.pruning_state import PruningState
+from state.trie.pruning_trie import Trie
+from state.util.fast_rlp import encode_optimized as rlp_encode
+from storage.kv_in_memory import KeyValueStorageInMemory
+
+
+def fill(trie, keys, prefix='v'):
+    for key in keys:
+        trie.update(key, rlp_encode([prefix.encode() + key]))
+
+
+def test_only_nodes_of_flushed_root_written():
+    keys = ['k{}'.format(i).encode() for i in range(200)]
+    kv = KeyValueStorageInMemory()
+    trie = Trie(PersistentDB(kv), write_batched=True)
+    unbatched_kv = KeyValueStorageInMemory()
+    unbatched = Trie(PersistentDB(unbatched_kv))
+    fill(trie, keys)
+    fill(unbatched, keys)
+
+    assert trie.root_hash == unbatched.root_hash
+    assert kv.size == 0
+    assert trie.get(keys[0]) == rlp_encode([b'v' + keys[0]])
+
+    trie.flush()
+    assert not trie.dirty_nodes
+    assert 0 < kv.size < unbatched_kv.size
+    # The root and all nodes below it can be read from the database
+    reopened = Trie(PersistentDB(kv), trie.root_hash)
+    assert reopened.to_dict() == unbatched.to_dict()
+
+
+def test_state_reverted_to_flushed_batch():
+    kv = KeyValueStorageInMemory()
+    state = PruningState(kv)
+    state.set(b'k1', b'v1')
+    state.set(b'k2', b'v2')
+    state.flush()
+    first_batch_root = state.headHash
+
+    state.set(b'k1', b'v3')
+    state.set(b'k3', b'v3')
+    state.revertToHead(first_batch_root)
+    assert state.get(b'k1', isCommitted=False) == b'v1'
+    assert state.get(b'k3', isCommitted=False) is None
+
+    state.set(b'k4', b'v4')
+    state.commit(first_batch_root)
+    assert state.get(b'k1') == b'v1'
+    assert state.get(b'k4') is None
+    assert state.get(b'k4', isCommitted=False) == b'v4'
+
+    reopened = PruningState(kv)
+    assert reopened.headHash == first_batch_root
+    assert reopened.get(b'k2') == b'v2'
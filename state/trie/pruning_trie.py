@@ -2,6 +2,7 @@
 
 import copy
 import sys
+from collections import OrderedDict
 
 import rlp
 from rlp.utils import decode_hex, encode_hex, ascii_chr, str_to_bytes
@@ -201,15 +202,69 @@ def transient_trie_exception(*args):
     raise Exception("Transient trie")
 
 
+def copy_node(node):
+    """
+    Copy of a decoded node which can be modified without modifying `node`,
+    nodes are lists of bytes and (embedded) nodes
+    """
+    if not isinstance(node, list):
+        return node
+    return [copy_node(item) if isinstance(item, list) else item
+            for item in node]
+
+
+class NodeCache:
+    """
+    LRU cache of decoded trie nodes keyed by the node's hash. Nodes are
+    content addressed, so an entry never becomes stale and is only evicted.
+    Cached nodes are shared, they must not be modified.
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._nodes = OrderedDict()
+
+    def get(self, node_hash):
+        node = self._nodes.get(node_hash)
+        if node is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._nodes.move_to_end(node_hash)
+        return node
+
+    def put(self, node_hash, node):
+        self._nodes[node_hash] = node
+        if len(self._nodes) > self.max_size:
+            self._nodes.popitem(last=False)
+
+    def clear(self):
+        self._nodes.clear()
+
+    def __len__(self):
+        return len(self._nodes)
+
+
 class Trie:
 
-    def __init__(self, db: BaseDB, root_hash=BLANK_ROOT, transient=False):
+    def __init__(self, db: BaseDB, root_hash=BLANK_ROOT, transient=False,
+                 node_cache_size=0, write_batched=False):
         '''it also present a dictionary like interface
 
         :param db key value database
         :root: blank or trie node in form of [key, value] or [v0,v1..v15,v]
+        :param node_cache_size: number of decoded nodes kept in memory, 0
+        disables the cache
+        :param write_batched: keep new nodes in memory until `flush` is
+        called instead of writing each of them to the database
         '''
         self._db = db  # Pass in a database object directly
+        # Encoded nodes not written to the database yet, by their hash
+        self.dirty_nodes = {} if write_batched else None
+        self.node_cache = NodeCache(node_cache_size) \
+            if node_cache_size else None
         self.transient = transient
         if self.transient:
             self.update = self.get = self.delete = transient_trie_exception
@@ -327,7 +382,14 @@ class Trie:
             return node
 
         hashkey = sha3(rlpnode)
-        self._db.inc_refcount(hashkey, rlpnode)
+        if self.dirty_nodes is not None:
+            self.dirty_nodes[hashkey] = rlpnode
+        else:
+            self._db.inc_refcount(hashkey, rlpnode)
+        if self.node_cache is not None:
+            # The node is likely read soon, it is copied since `node` can
+            # still be modified
+            self.node_cache.put(hashkey, copy_node(node))
         return hashkey
 
     def _decode_to_node(self, encoded):
@@ -335,10 +397,68 @@ class Trie:
             return BLANK_NODE
         if isinstance(encoded, list):
             return encoded
-        o = rlp.decode(self._db.get(encoded))
+        o = self._get_node(encoded)
+        # Nodes are modified in place on updates
+        return copy_node(o) if self.node_cache is not None else o
+
+    def _get_node(self, encoded):
+        """
+        Decoded node for `encoded`, the node can be shared with the node
+        cache so it must not be modified
+        """
+        if encoded == BLANK_NODE:
+            return BLANK_NODE
+        if isinstance(encoded, list):
+            return encoded
+        o = None
+        if self.node_cache is not None:
+            # Root hashes read from storage can be bytearrays
+            encoded = bytes(encoded)
+            o = self.node_cache.get(encoded)
+        if o is None:
+            rlpnode = self.dirty_nodes.get(bytes(encoded)) \
+                if self.dirty_nodes else None
+            o = rlp.decode(rlpnode if rlpnode is not None
+                           else self._db.get(encoded))
+            if self.node_cache is not None:
+                self.node_cache.put(encoded, o)
         self.spv_grabbing(o)
         return o
 
+    def flush(self, *root_hashes):
+        """
+        Write the new nodes which can be reached from the current root and
+        the given roots to the database in one batch. The other new nodes,
+        like the ones replaced by later updates, are dropped.
+        """
+        if not self.dirty_nodes:
+            return
+        nodes = []
+        for root_hash in (self.root_hash,) + root_hashes:
+            if root_hash != BLANK_ROOT:
+                self._collect_dirty_nodes(root_hash, nodes)
+        self.dirty_nodes.clear()
+        self._db.inc_refcounts(nodes)
+
+    def _collect_dirty_nodes(self, encoded, nodes):
+        if isinstance(encoded, list):
+            node = encoded
+        else:
+            # Popped so a node referenced more than once is written once
+            rlpnode = self.dirty_nodes.pop(bytes(encoded), None)
+            if rlpnode is None:
+                # The node and all nodes below it are in the database
+                return
+            nodes.append((encoded, rlpnode))
+            node = rlp.decode(rlpnode)
+        node_type = self._get_node_type(node)
+        if node_type == NODE_TYPE_BRANCH:
+            for item in node[:16]:
+                if item != BLANK_NODE:
+                    self._collect_dirty_nodes(item, nodes)
+        elif node_type == NODE_TYPE_EXTENSION:
+            self._collect_dirty_nodes(node[1], nodes)
+
     def _get_node_type(self, node):
         ''' get node type and content
 
@@ -373,7 +493,7 @@ class Trie:
             # already reach the expected node
             if not key:
                 return node[-1]
-            sub_node = self._decode_to_node(node[key[0]])
+            sub_node = self._get_node(node[key[0]])
             return self._get(sub_node, key[1:])
 
         # key value node
@@ -384,7 +504,7 @@ class Trie:
         if node_type == NODE_TYPE_EXTENSION:
             # traverse child nodes
             if starts_with(key, curr_key):
-                sub_node = self._decode_to_node(node[1])
+                sub_node = self._get_node(node[1])
                 return self._get(sub_node, key[len(curr_key):])
             else:
                 return BLANK_NODE
@@ -968,7 +1088,8 @@ class Trie:
     def root_hash_valid(self):
         if self.root_hash == BLANK_ROOT:
             return True
-        return self.root_hash in self._db
+        return self.root_hash in self._db or \
+            bool(self.dirty_nodes and self.root_hash in self.dirty_nodes)
 
     def produce_spv_proof(self, key, root=None):
         root = root or self.root_node
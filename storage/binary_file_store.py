@@ -55,12 +55,12 @@ class BinaryFileStore(SingleFileStore):
 
         return super().iterator(start, end, includeKey, includeValue, prefix)
 
-    def _lines(self):
-        # Move to the beginning of file
-        self.db_file.seek(0)
-        return (line.strip(self.lineSep) for line in
-                self.db_file.read().split(self.lineSep)
-                if len(line.strip(self.lineSep)) != 0)
+    @property
+    def _recordSep(self) -> bytes:
+        return self.lineSep
+
+    def _cleanRecord(self, record: bytes):
+        return record.strip(self.lineSep)
 
     def _append_new_line_if_req(self):
         pass
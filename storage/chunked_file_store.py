@@ -1,5 +1,6 @@
 import os
 import shutil
+from collections import OrderedDict
 
 from storage.kv_store_file import KeyValueStorageFile
 from storage.text_file_store import TextFileStore
@@ -22,6 +23,9 @@ class ChunkedFileStore(KeyValueStorageFile):
 
     firstChunkIndex = 1
 
+    # Number of chunks other than the current one kept open for reading
+    openChunksLimit = 4
+
     @staticmethod
     def _fileNameToChunkIndex(fileName):
         try:
@@ -61,6 +65,8 @@ class ChunkedFileStore(KeyValueStorageFile):
         self.dataDir = os.path.join(dbDir, dbName)  # chunk files destination
         self.currentChunk = None  # type: KeyValueStorageFile
         self.currentChunkIndex = None  # type: int
+        # Chunks opened for reading by their indices, in order of use
+        self._openChunks = OrderedDict()
 
         # TODO: fix chunk_creator support
         def default_chunk_creator(name):
@@ -142,6 +148,30 @@ class ChunkedFileStore(KeyValueStorageFile):
         return self._chunkCreator(
             ChunkedFileStore._chunkIndexToFileName(index))
 
+    def _getChunk(self, index) -> KeyValueStorageFile:
+        """
+        Returns chunk for reading. Recently read chunks are kept open, so the
+        offset indices of their files are not built again.
+
+        :param index: chunk index
+        :return: opened chunk
+        """
+        if index == self.currentChunkIndex:
+            return self.currentChunk
+        chunk = self._openChunks.pop(index, None)
+        if chunk is None:
+            chunk = self._openChunk(index)
+            if len(self._openChunks) >= self.openChunksLimit:
+                _, oldest = self._openChunks.popitem(last=False)
+                oldest.close()
+        self._openChunks[index] = chunk
+        return chunk
+
+    def _closeOpenChunks(self):
+        for chunk in self._openChunks.values():
+            chunk.close()
+        self._openChunks.clear()
+
     def _get_key_location(self, key) -> (int, int):
         """
         Return chunk no and 1-based offset of key
@@ -174,8 +204,7 @@ class ChunkedFileStore(KeyValueStorageFile):
         # TODO: get is creating files when a key is given which is more than
         # the store size
         chunk_no, offset = self._get_key_location(key)
-        with self._openChunk(chunk_no) as chunk:
-            return chunk.get(str(offset))
+        return self._getChunk(chunk_no).get(str(offset))
 
     def reset(self) -> None:
         """
@@ -207,6 +236,7 @@ class ChunkedFileStore(KeyValueStorageFile):
         return self.currentChunk._parse_line(line, prefix, returnKey, returnValue, key)
 
     def close(self):
+        self._closeOpenChunks()
         if self.currentChunk is not None:
             self.currentChunk.close()
         self.currentChunk = None
@@ -266,23 +296,23 @@ class ChunkedFileStore(KeyValueStorageFile):
             if start_chunk_no == end_chunk_no:
                 # If entries lie in the same range
                 assert end_offset >= start_offset
-                with self._openChunk(start_chunk_no) as chunk:
-                    yield from zip(range(start, end + 1),
-                                   (l for _, l in chunk.iterator(start=start_offset,
-                                                                 end=end_offset)))
+                chunk = self._getChunk(start_chunk_no)
+                yield from zip(range(start, end + 1),
+                               (l for _, l in chunk.iterator(start=start_offset,
+                                                             end=end_offset)))
             else:
                 current_chunk_no = start_chunk_no
                 while current_chunk_no <= end_chunk_no:
-                    with self._openChunk(current_chunk_no) as chunk:
-                        if current_chunk_no == start_chunk_no:
-                            yield from ((str(current_chunk_no + int(k) - 1), l) for k, l in
-                                        chunk.iterator(start=start_offset))
-                        elif current_chunk_no == end_chunk_no:
-                            yield from ((str(current_chunk_no + int(k) - 1), l)
-                                        for k, l in chunk.iterator(end=end_offset))
-                        else:
-                            yield from ((str(current_chunk_no + int(k) - 1), l)
-                                        for k, l in chunk.iterator(start=1, end=self.chunkSize))
+                    chunk = self._getChunk(current_chunk_no)
+                    if current_chunk_no == start_chunk_no:
+                        yield from ((str(current_chunk_no + int(k) - 1), l) for k, l in
+                                    chunk.iterator(start=start_offset))
+                    elif current_chunk_no == end_chunk_no:
+                        yield from ((str(current_chunk_no + int(k) - 1), l)
+                                    for k, l in chunk.iterator(end=end_offset))
+                    else:
+                        yield from ((str(current_chunk_no + int(k) - 1), l)
+                                    for k, l in chunk.iterator(start=1, end=self.chunkSize))
                     current_chunk_no += self.chunkSize
 
     def _append_new_line_if_req(self):
@@ -292,9 +322,13 @@ class ChunkedFileStore(KeyValueStorageFile):
     @property
     def size(self) -> int:
         """
-        This will iterate only over the last chunk since the name of the last
-        chunk indicates how many lines in total exist in all other chunks
+        This will count only lines of the last chunk since the name of the
+        last chunk indicates how many lines in total exist in all other chunks.
+        The last chunk is the current one if the store is open.
         """
+        if self.currentChunk is not None:
+            return self.currentChunkIndex - self.firstChunkIndex + \
+                self.currentChunk.size
         chunks = self._listChunks()
         num_chunks = len(chunks)
         if num_chunks == 0:
@@ -112,9 +112,14 @@ class KeyValueStorageFile(KeyValueStorage):
     def _keyValueIterator(self, lines, start=None, end=None, prefix=None):
         return self._baseIterator(lines, start, end, prefix, True, True)
 
-    def _baseIterator(self, lines, start=None, end=None, prefix=None, returnKey: bool=True, returnValue: bool=True):
+    def _baseIterator(self, lines, start=None, end=None, prefix=None, returnKey: bool=True, returnValue: bool=True,
+                      firstLineNo: int=1):
+        """
+        :param firstLineNo: number of the first of the lines, if they do not
+        start from the beginning of the store
+        """
         self._is_valid_range(start, end)
-        i = 1
+        i = firstLineNo
         for line in lines:
             k = str(i)
             if (start is None or i >= start) and (end is None or i <= end):
@@ -0,0 +1,150 @@
+import logging
+import os
+import shutil
+from itertools import islice
+from typing import Iterable, Tuple
+
+from state.util.utils import removeLockFiles
+from storage.kv_store_leveldb import KeyValueStorageLeveldb
+from storage.kv_store_leveldb_int_keys import KeyValueStorageLeveldbIntKeys
+
+try:
+    import leveldb
+except ImportError:
+    print('Cannot import leveldb, please install')
+
+
+class KeyValueStorageLeveldbFixedIntKeys(KeyValueStorageLeveldb):
+    """
+    Leveldb storage with non negative integer keys (like sequence numbers of
+    transactions) stored as fixed width big-endian bytes, so the default
+    bytewise comparator of leveldb orders them as integers and no comparator
+    implemented in Python is needed.
+
+    Keys can be given as integers or as their decimal representation (str or
+    bytes), the iterator returns them as integers.
+    """
+
+    key_size = 8
+
+    @classmethod
+    def encode_key(cls, key) -> bytes:
+        return int(key).to_bytes(cls.key_size, byteorder='big')
+
+    @staticmethod
+    def decode_key(key) -> int:
+        return int.from_bytes(key, byteorder='big')
+
+    def iterator(self, start=None, end=None, include_key=True, include_value=True, prefix=None):
+        if start is not None:
+            start = self.encode_key(start)
+        if end is not None:
+            end = self.encode_key(end)
+        itr = self._db.RangeIter(key_from=start, key_to=end,
+                                 include_value=include_value)
+        if include_value:
+            return ((self.decode_key(key), value) for key, value in itr)
+        return (self.decode_key(key) for key in itr)
+
+    def put(self, key, value):
+        if isinstance(value, str):
+            value = value.encode()
+        self._db.Put(self.encode_key(key), value)
+
+    def get(self, key):
+        return self._db.Get(self.encode_key(key))
+
+    def remove(self, key):
+        self._db.Delete(self.encode_key(key))
+
+    def setBatch(self, batch: Iterable[Tuple]):
+        b = leveldb.WriteBatch()
+        for key, value in batch:
+            if isinstance(value, str):
+                value = value.encode()
+            b.Put(self.encode_key(key), value)
+        self._db.Write(b, sync=False)
+
+    def do_ops_in_batch(self, batch: Iterable[Tuple]):
+        b = leveldb.WriteBatch()
+        for op, key, value in batch:
+            key = self.encode_key(key)
+            if isinstance(value, str):
+                value = value.encode()
+            if op == self.WRITE_OP:
+                b.Put(key, value)
+            elif op == self.REMOVE_OP:
+                b.Delete(key)
+            else:
+                raise ValueError('Unknown operation')
+        self._db.Write(b, sync=False)
+
+
+def has_int_comparator(db_path) -> bool:
+    """
+    Whether the leveldb at `db_path` exists and was created by
+    `KeyValueStorageLeveldbIntKeys`, i.e. with the Python integer comparator
+    """
+    if not os.path.isdir(db_path):
+        return False
+    try:
+        db = leveldb.LevelDB(db_path, create_if_missing=False)
+    except leveldb.LevelDBError as ex:
+        if KeyValueStorageLeveldbIntKeys.comparator_name in str(ex):
+            return True
+        raise
+    del db
+    removeLockFiles(db_path)
+    return False
+
+
+def migrate_int_keys_store(db_dir, db_name, batch_size=10000) -> bool:
+    """
+    Convert the `KeyValueStorageLeveldbIntKeys` storage `db_name` to
+    `KeyValueStorageLeveldbFixedIntKeys` if it is not converted yet. The
+    entries are copied in batches to a new storage which then replaces the
+    old one, if the migration is interrupted it is started again on the next
+    call.
+
+    :return: True if the storage was migrated
+    """
+    db_path = os.path.join(db_dir, db_name)
+    old_name = db_name + '_int_keys'
+    old_path = os.path.join(db_dir, old_name)
+    new_name = db_name + '_fixed_int_keys'
+    new_path = os.path.join(db_dir, new_name)
+
+    if os.path.isdir(old_path):
+        if os.path.isdir(db_path):
+            # The migrated storage is already in place
+            shutil.rmtree(old_path)
+        else:
+            os.rename(old_path, db_path)
+    if not has_int_comparator(db_path):
+        return False
+
+    logging.info("Migrating {} to fixed width integer keys".format(db_path))
+    if os.path.isdir(new_path):
+        shutil.rmtree(new_path)
+    old = KeyValueStorageLeveldbIntKeys(db_dir, db_name)
+    new = KeyValueStorageLeveldbFixedIntKeys(db_dir, new_name)
+    count = 0
+    try:
+        entries = old.iterator()
+        while True:
+            batch = list(islice(entries, batch_size))
+            if not batch:
+                break
+            new.setBatch(batch)
+            count += len(batch)
+        # Empty synchronous write so that all copied entries are on disk
+        new._db.Write(leveldb.WriteBatch(), sync=True)
+    finally:
+        old.close()
+        new.close()
+
+    os.rename(db_path, old_path)
+    os.rename(new_path, db_path)
+    shutil.rmtree(old_path)
+    logging.info("Migrated {} entries of {}".format(count, db_path))
+    return True
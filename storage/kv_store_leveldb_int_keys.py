@@ -7,6 +7,8 @@ except ImportError:
 
 
 class KeyValueStorageLeveldbIntKeys(KeyValueStorageLeveldb):
+    comparator_name = 'IntegerComparator'
+
     def __init__(self, db_dir, db_name, open=True):
         super().__init__(db_dir, db_name, open)
 
@@ -22,4 +24,4 @@ class KeyValueStorageLeveldbIntKeys(KeyValueStorageLeveldb):
 
     def open(self):
         self._db = leveldb.LevelDB(self.db_path, comparator=(
-            'IntegerComparator', self.compare))
+            self.comparator_name, self.compare))
@@ -1,23 +1,294 @@
+import os
+import shutil
 from typing import Iterable, Tuple
 
 from storage.kv_store import KeyValueStorage
 
-
-# TODO: WIP below
+try:
+    import rocksdb
+except ImportError:
+    # python-rocksdb is an optional dependency, the error is raised when
+    # the storage is created
+    rocksdb = None
 
 
 class KeyValueStorageRocksdb(KeyValueStorage):
-    def set(self, key, value):
-        raise NotImplementedError
+    """
+    Rocksdb storage. Several stores can share one database as its column
+    families (see `column_family`) and be written atomically in one batch
+    (see `do_ops_in_batch_of_stores`).
+
+    Options of the database are given as `db_config`, a dict with keys:
+    `block_cache_size` - size of the LRU block cache in bytes, 0 disables it,
+    `bloom_filter_bits` - bits per key of bloom filters, 0 disables them,
+    `sync_writes` - whether writes are synced to disk before returning.
+    """
+
+    default_config = {
+        'block_cache_size': 64 * 1024 * 1024,
+        'bloom_filter_bits': 10,
+        'sync_writes': False,
+    }
+
+    def __init__(self, db_dir, db_name, open=True, read_only=False,
+                 db_config=None):
+        if rocksdb is None:
+            raise RuntimeError('Rocksdb is needed to use this class')
+        self.db_path = os.path.join(db_dir, db_name)
+        self._read_only = read_only
+        self._db_config = dict(self.default_config, **(db_config or {}))
+        block_cache_size = self._db_config['block_cache_size']
+        # The block cache is shared by the database and its column families
+        self._block_cache = rocksdb.LRUCache(block_cache_size) \
+            if block_cache_size else None
+        self._db = None
+        # Stores of column families of this database by their names
+        self._column_families = {}
+        if open:
+            self.open()
+
+    def __repr__(self):
+        return self.db_path
+
+    @property
+    def is_byte(self) -> bool:
+        return True
+
+    def db_path(self) -> str:
+        return self.db_path
+
+    @property
+    def _cf(self):
+        # Handle of the column family, None for the default one
+        return None
+
+    @property
+    def _sync(self) -> bool:
+        return self._db_config['sync_writes']
+
+    @staticmethod
+    def _encode(key) -> bytes:
+        if isinstance(key, int):
+            key = str(key)
+        if isinstance(key, str):
+            key = key.encode()
+        return key
+
+    def _key(self, key):
+        key = self._encode(key)
+        return key if self._cf is None else (self._cf, key)
+
+    @staticmethod
+    def _value(value):
+        if isinstance(value, str):
+            value = value.encode()
+        return value
+
+    def iterator(self, start=None, end=None, include_key=True,
+                 include_value=True, prefix=None):
+        start, end, prefix = (self._encode(k) if k is not None else None
+                              for k in (start, end, prefix))
+        if prefix is not None and (start is None or start < prefix):
+            start = prefix
+
+        if include_value:
+            itr = self._db.iteritems(self._cf)
+        else:
+            itr = self._db.iterkeys(self._cf)
+        if start is None:
+            itr.seek_to_first()
+        else:
+            # The iterator is already bound to the column family
+            itr.seek(start)
+        return self._iterate(itr, end, prefix, include_key, include_value)
+
+    def _iterate(self, itr, end, prefix, include_key, include_value):
+        for item in itr:
+            key = item[0] if include_value else item
+            if isinstance(key, tuple):
+                key = key[1]
+            # The end is inclusive like in the leveldb storage
+            if end is not None and key > end:
+                break
+            if prefix is not None and not key.startswith(prefix):
+                break
+            if not include_value:
+                yield key
+            elif include_key:
+                yield key, item[1]
+            else:
+                yield item[1]
+
+    def put(self, key, value):
+        self._db.put(self._key(key), self._value(value), sync=self._sync)
 
     def get(self, key):
-        raise NotImplementedError
+        value = self._db.get(self._key(key))
+        if value is None:
+            raise KeyError(key)
+        return value
 
     def remove(self, key):
-        raise NotImplementedError
+        self._db.delete(self._key(key), sync=self._sync)
+
+    def _add_op(self, batch, op, key, value=None):
+        if op == self.WRITE_OP:
+            batch.put(self._key(key), self._value(value))
+        elif op == self.REMOVE_OP:
+            batch.delete(self._key(key))
+        else:
+            raise ValueError('Unknown operation')
 
     def setBatch(self, batch: Iterable[Tuple]):
-        raise NotImplementedError
+        self.do_ops_in_batch((self.WRITE_OP, key, value)
+                             for key, value in batch)
+
+    def do_ops_in_batch(self, batch: Iterable[Tuple]):
+        self.do_ops_in_batch_of_stores((self, op, key, value)
+                                       for op, key, value in batch)
+
+    def do_ops_in_batch_of_stores(self, batch: Iterable[Tuple]):
+        """
+        Atomically applies operations to this store and column families of
+        its database.
+
+        :param batch: tuples of store, operation, key and value
+        """
+        b = rocksdb.WriteBatch()
+        for store, op, key, value in batch:
+            if store._database is not self._database:
+                raise ValueError('{} does not share the database with {}'
+                                 .format(store, self))
+            store._add_op(b, op, key, value)
+        self._db.write(b, sync=self._sync)
+
+    @property
+    def _database(self):
+        return self
+
+    def column_family(self, name: str) -> 'KeyValueStorageRocksdbColumnFamily':
+        """
+        Returns store of the column family of this database with the given
+        name, the column family is created if does not exist
+        """
+        store = self._column_families.get(name)
+        if store is None:
+            store = KeyValueStorageRocksdbColumnFamily(self, name)
+            self._column_families[name] = store
+        elif store.closed and not self.closed:
+            store.open()
+        return store
+
+    def _table_factory(self):
+        bloom_filter_bits = self._db_config['bloom_filter_bits']
+        return rocksdb.BlockBasedTableFactory(
+            filter_policy=rocksdb.BloomFilterPolicy(bloom_filter_bits)
+            if bloom_filter_bits else None,
+            block_cache=self._block_cache,
+            no_block_cache=self._block_cache is None)
+
+    def _options(self):
+        opts = rocksdb.Options(create_if_missing=True)
+        opts.table_factory = self._table_factory()
+        return opts
+
+    def _column_family_options(self):
+        opts = rocksdb.ColumnFamilyOptions()
+        opts.table_factory = self._table_factory()
+        return opts
+
+    def open(self):
+        opts = self._options()
+        column_families = {}
+        if os.path.exists(self.db_path):
+            # All column families of the database have to be opened with it
+            column_families = {
+                name: self._column_family_options()
+                for name in rocksdb.list_column_families(self.db_path, opts)
+                if name != b'default'}
+        self._db = rocksdb.DB(self.db_path, opts,
+                              column_families=column_families or None,
+                              read_only=self._read_only)
+        for store in self._column_families.values():
+            store.open()
+
+    def close(self):
+        if self._db is None:
+            return
+        for store in self._column_families.values():
+            store.close()
+        del self._db
+        self._db = None
+
+    def drop(self):
+        self.close()
+        shutil.rmtree(self.db_path)
+
+    def reset(self):
+        self.drop()
+        self.open()
+
+    @property
+    def closed(self):
+        return self._db is None
+
+
+class KeyValueStorageRocksdbColumnFamily(KeyValueStorageRocksdb):
+    """
+    Store of a column family of a rocksdb database, it is opened and closed
+    together with the database.
+    """
+
+    def __init__(self, database: KeyValueStorageRocksdb, name: str):
+        self._owner = database
+        self.name = name
+        self._handle = None
+        self.open()
+
+    def __repr__(self):
+        return '{}:{}'.format(self._owner.db_path, self.name)
+
+    @property
+    def db_path(self):
+        return self._owner.db_path
+
+    @property
+    def _db(self):
+        return self._owner._db
+
+    @property
+    def _database(self):
+        return self._owner
+
+    @property
+    def _db_config(self):
+        return self._owner._db_config
+
+    @property
+    def _cf(self):
+        return self._handle
+
+    def column_family(self, name: str):
+        return self._owner.column_family(name)
+
+    def open(self):
+        name = self.name.encode()
+        self._handle = self._db.get_column_family(name)
+        if self._handle is None:
+            self._handle = self._db.create_column_family(
+                name, self._owner._column_family_options())
 
     def close(self):
-        raise NotImplementedError
+        self._handle = None
+
+    def drop(self):
+        self._db.drop_column_family(self._handle)
+        self._handle = None
+
+    def reset(self):
+        self.drop()
+        self.open()
+
+    @property
+    def closed(self):
+        return self._handle is None
@@ -1,10 +1,24 @@
 import os
+from abc import abstractmethod
 from hashlib import sha256
 
 from storage.kv_store_file import KeyValueStorageFile
 
 
 class SingleFileStore(KeyValueStorageFile):
+    """
+    Stores records in one file, records are separated by the line separator.
+
+    Offsets of records in the file are indexed, so records are read by their
+    line numbers or keys and ranges of lines are read from the start of the
+    range without reading the whole file. The index is kept in memory, it is
+    built on the first read and extended with the records appended since the
+    previous read. Records without separators (whose boundaries are known
+    only to the format of the data) are not indexed.
+    """
+
+    # Size of blocks the file is read by when records are scanned
+    readBlockSize = 1024 * 1024
 
     def __init__(self,
                  dbDir,
@@ -17,6 +31,7 @@ class SingleFileStore(KeyValueStorageFile):
                  open=True):
         self.delimiter = delimiter
         self.lineSep = lineSep
+        self._resetIndex()
         super().__init__(dbDir,
                          dbName,
                          isLineNoKey,
@@ -56,6 +71,160 @@ class SingleFileStore(KeyValueStorageFile):
             # orders of magnitude. See testMeasureWriteTime
             os.fsync(self.db_file.fileno())
 
+    @property
+    @abstractmethod
+    def _recordSep(self) -> bytes:
+        """
+        Separator of records in the file as bytes
+        """
+
+    @abstractmethod
+    def _cleanRecord(self, record: bytes):
+        """
+        Returns the line of a record read from the file
+        """
+
+    def _records(self, offset=0):
+        """
+        Yields offset in the file, size, line of every non empty record
+        starting from `offset` and whether it is terminated with the separator
+        (the last one might be not)
+        """
+        sep = self._recordSep
+        if not sep:
+            raise ValueError("Records without separator can not be read "
+                             "from {}".format(self.db_path))
+        if not self.db_file.closed:
+            self.db_file.flush()
+        with open(self.db_path, 'rb') as f:
+            f.seek(offset)
+            buf = b''
+            while True:
+                block = f.read(self.readBlockSize)
+                if not block:
+                    break
+                buf += block
+                pos = 0
+                while True:
+                    end = buf.find(sep, pos)
+                    if end < 0:
+                        break
+                    line = self._cleanRecord(buf[pos:end])
+                    if line:
+                        yield offset + pos, end - pos, line, True
+                    pos = end + len(sep)
+                buf = buf[pos:]
+                offset += pos
+            line = self._cleanRecord(buf)
+            if line:
+                yield offset, len(buf), line, False
+
+    def _lines(self):
+        return (line for _, _, line, _ in self._records())
+
+    def _resetIndex(self):
+        # Offsets and sizes of records by line numbers starting from 0
+        self._offsets = []
+        self._sizes = []
+        # Line numbers of records by their keys, if line number is not a key
+        self._lineNos = {}
+        # Size of the file up to the end of the last terminated record
+        self._indexedSize = 0
+        # Size of the file when it was read last time
+        self._readSize = 0
+        # Whether the last record is not terminated, then it is indexed
+        # again when more data is appended to the file
+        self._unterminated = False
+        self._unterminatedKey = None
+
+    def _updateIndex(self):
+        self.db_file.flush()
+        fileSize = os.fstat(self.db_file.fileno()).st_size
+        if fileSize == self._readSize:
+            return
+        if self._unterminated:
+            self._offsets.pop()
+            self._sizes.pop()
+            key = self._unterminatedKey
+            if self._lineNos.get(key) == len(self._offsets):
+                del self._lineNos[key]
+            self._unterminated = False
+        sepSize = len(self._recordSep)
+        for offset, size, line, terminated in \
+                self._records(self._indexedSize):
+            key = None if self.isLineNoKey else \
+                line.split(self.delimiter, 1)[0]
+            if key is not None:
+                # Like a scan of the file, the first record with a key wins
+                self._lineNos.setdefault(key, len(self._offsets))
+            self._offsets.append(offset)
+            self._sizes.append(size)
+            if terminated:
+                self._indexedSize = offset + size + sepSize
+            else:
+                self._unterminated = True
+                self._unterminatedKey = key
+        self._readSize = fileSize
+
+    def _readLine(self, lineNo):
+        with open(self.db_path, 'rb') as f:
+            f.seek(self._offsets[lineNo])
+            return self._cleanRecord(f.read(self._sizes[lineNo]))
+
+    @property
+    def _isIndexed(self) -> bool:
+        return bool(self._recordSep)
+
+    def get(self, key):
+        if not self._isIndexed:
+            return super().get(key)
+        self._updateIndex()
+        if self.isLineNoKey:
+            try:
+                lineNo = int(key) - 1
+            except (TypeError, ValueError):
+                lineNo = -1
+            if not 0 <= lineNo < len(self._offsets):
+                lineNo = None
+        else:
+            lineNo = self._lineNos.get(key)
+        if lineNo is None:
+            raise KeyError("'{}' doesn't contain {} key".format(
+                self.db_file, str(key)))
+        return self._parse_line(self._readLine(lineNo), returnKey=False,
+                                key=str(lineNo + 1))
+
+    def iterator(self, start=None, end=None, include_key=True, include_value=True, prefix=None):
+        if not (self._isIndexed and self.isLineNoKey and start):
+            return super().iterator(start, end, include_key, include_value,
+                                    prefix)
+        if not (include_key or include_value):
+            raise ValueError("At least one of includeKey or includeValue "
+                             "should be true")
+        self._is_valid_range(start, end)
+        self._updateIndex()
+        start = int(start)
+        if start > len(self._offsets):
+            return iter(())
+        # Reading starts from the offset of the first line of the range
+        lines = (line for _, _, line, _ in
+                 self._records(self._offsets[max(start, 1) - 1]))
+        return self._baseIterator(lines, start=start, end=end, prefix=prefix,
+                                  returnKey=include_key,
+                                  returnValue=include_value,
+                                  firstLineNo=max(start, 1))
+
+    @property
+    def size(self):
+        if not self._isIndexed:
+            return super().size
+        self._updateIndex()
+        return len(self._offsets)
+
+    def open(self):
+        self._resetIndex()
+        super().open()
+
     def close(self):
         self.db_file.close()
 
@@ -65,6 +234,7 @@ class SingleFileStore(KeyValueStorageFile):
 
     def reset(self):
         self.db_file.truncate(0)
+        self._resetIndex()
 
     def drop(self):
         self.reset()
@@ -1,5 +1,5 @@
-from collections import OrderedDict
-from typing import Tuple, List, Iterable
+from collections import OrderedDict, deque
+from typing import Tuple, List, Iterable, Deque, Dict
 
 from storage.kv_store import KeyValueStorage
 
@@ -14,46 +14,70 @@ class OptimisticKVStore:
     """
     def __init__(self, kv_store: KeyValueStorage):
         self._store = kv_store
-        # List of Tuples where first items is the state root after batch and
+        # Tuples where first items is the state root after batch and
         # second item is a dictionary similar to cache which can be queried
         # like the database, i.e `self._db`. Keys (state roots are purged)
         # when they get committed or reverted.
-        self.un_committed = []  # type: List[Tuple[bytes, OrderedDict]]
+        self.un_committed = deque()  # type: Deque[Tuple[bytes, OrderedDict]]
 
         # Relevant NYMs operation done in current batch, in order
         self.current_batch_ops = []  # type: List[Tuple]
 
+        # Latest value of each key written in current batch
+        self._current_batch = {}
+        # Values of each key in the batches of `un_committed`, in the order
+        # of batches, so that the latest value of a key is found without
+        # looking into each batch
+        self._un_committed_values = {}  # type: Dict[bytes, Deque]
+
     def create_batch_from_current(self, batch_idr):
-        self.un_committed.append((batch_idr, OrderedDict(self.current_batch_ops)))
-        self.current_batch_ops = []
+        batch = OrderedDict(self.current_batch_ops)
+        self.un_committed.append((batch_idr, batch))
+        for key, value in batch.items():
+            if key not in self._un_committed_values:
+                self._un_committed_values[key] = deque()
+            self._un_committed_values[key].append(value)
+        self._clear_current_batch()
 
     def reject_batch(self):
         # Batches are always rejected from end of `self.unCommitted`
-        self.current_batch_ops = []
-        self.un_committed = self.un_committed[:-1]
+        self._clear_current_batch()
+        if self.un_committed:
+            _, batch = self.un_committed.pop()
+            for key in batch:
+                values = self._un_committed_values[key]
+                values.pop()
+                if not values:
+                    del self._un_committed_values[key]
 
     def commit_batch(self):
         # Commit an already created batch
         if self.un_committed:
-            batch_idr = self.first_batch_idr
-            self._store.setBatch([(key, val) for key, val in
-                                  self.un_committed[0][1].items()])
-            self.un_committed = self.un_committed[1:]
+            batch_idr, batch = self.un_committed.popleft()
+            self._store.setBatch([(key, val) for key, val in batch.items()])
+            for key in batch:
+                values = self._un_committed_values[key]
+                values.popleft()
+                if not values:
+                    del self._un_committed_values[key]
             return batch_idr
         else:
             raise ValueError
 
+    def _clear_current_batch(self):
+        self.current_batch_ops = []
+        self._current_batch = {}
+
     def get(self, key, is_committed=False):
         if is_committed:
             return self._store.get(key)
-        # Looking for uncommitted values, iterating over `current_batch_ops`
-        # and `un_committed` in reverse to get the latest value
-        for k, value in reversed(self.current_batch_ops):
-            if k == key:
-                return value
-        for _, cache in reversed(self.un_committed):
-            if key in cache:
-                return cache[key]
+        # Looking for uncommitted values in current batch and then in the
+        # latest uncommitted batch with the key
+        if key in self._current_batch:
+            return self._current_batch[key]
+        values = self._un_committed_values.get(key)
+        if values:
+            return values[-1]
         return self._store.get(key)
 
     def set(self, key, value, is_committed=False):
@@ -61,6 +85,7 @@ class OptimisticKVStore:
             self._store.put(key, value)
         else:
             self.current_batch_ops.append((key, value))
+            self._current_batch[key] = value
 
     def remove(self, key, is_committed=False):
         if isinstance(key, str):
@@ -69,7 +94,8 @@ class OptimisticKVStore:
             self._store.remove(key)
         else:
             self.current_batch_ops = [(k, v) for k, v in
-                                      self.current_batch_ops if k == key]
+                                      self.current_batch_ops if k != key]
+            self._current_batch.pop(key, None)
 
     @property
     def first_batch_idr(self):
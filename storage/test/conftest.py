@@ -3,6 +3,7 @@ import pytest
 from storage.kv_in_memory import KeyValueStorageInMemory
 from storage.kv_store import KeyValueStorage
 from storage.kv_store_leveldb import KeyValueStorageLeveldb
+from storage.kv_store_rocksdb import KeyValueStorageRocksdb
 
 
 @pytest.fixture(scope='function')
@@ -10,13 +11,17 @@ def tempdir(tmpdir_factory):
     return tmpdir_factory.mktemp('').strpath
 
 
-@pytest.yield_fixture(params=['memory', 'leveldb'])
+@pytest.yield_fixture(params=['memory', 'leveldb', 'rocksdb'])
 def parametrised_storage(request, tmpdir_factory) -> KeyValueStorage:
     if request.param == 'memory':
         db = KeyValueStorageInMemory()
     elif request.param == 'leveldb':
         db = KeyValueStorageLeveldb(tmpdir_factory.mktemp('').strpath,
                                     'some_db')
+    elif request.param == 'rocksdb':
+        pytest.importorskip('rocksdb')
+        db = KeyValueStorageRocksdb(tmpdir_factory.mktemp('').strpath,
+                                    'some_db')
     else:
         raise ValueError('Unsupported storage')
     yield db
@@ -0,0 +1,48 @@
+import random
+import time
+
+from storage.chunked_file_store import ChunkedFileStore
+from storage.kv_store_file import KeyValueStorageFile
+from storage.text_file_store import TextFileStore
+
+
+def testMeasureFileStoreReads(tempdir):
+    count = 5000
+    value = '{"txn": "' + 'x' * 200 + '"}'
+    text_store = TextFileStore(tempdir, 'text', isLineNoKey=True,
+                               ensureDurability=False)
+    chunked_store = ChunkedFileStore(tempdir, 'chunked', isLineNoKey=True,
+                                     ensureDurability=False)
+    for _ in range(count):
+        text_store.put(None, value)
+        chunked_store.put(None, value)
+    keys = [str(random.randint(1, count)) for _ in range(200)]
+
+    timings = {}
+    start = time.perf_counter()
+    for key in keys:
+        KeyValueStorageFile.get(text_store, key)
+    timings['text store: 200 gets by scanning'] = time.perf_counter() - start
+
+    for name, store in (('text store', text_store),
+                        ('chunked store', chunked_store)):
+        start = time.perf_counter()
+        for key in keys:
+            assert store.get(key) == value
+        timings['{}: 200 indexed gets'.format(name)] = \
+            time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(200):
+            assert store.size == count
+        timings['{}: 200 sizes'.format(name)] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for frm in range(1, count, count // 20):
+            assert len(list(store.iterator(start=frm, end=frm + 99))) == 100
+        timings['{}: 20 range reads of 100 lines'.format(name)] = \
+            time.perf_counter() - start
+        store.close()
+
+    for operation, t in timings.items():
+        print("{} lines, {} took {} seconds".format(count, operation, t))
@@ -0,0 +1,89 @@
+import os
+import random
+
+import pytest
+
+from storage.kv_store_leveldb_fixed_int_keys import \
+    KeyValueStorageLeveldbFixedIntKeys, migrate_int_keys_store, \
+    has_int_comparator
+from storage.kv_store_leveldb_int_keys import KeyValueStorageLeveldbIntKeys
+
+
+@pytest.yield_fixture(scope="function")
+def kv(tempdir) -> KeyValueStorageLeveldbFixedIntKeys:
+    kv = KeyValueStorageLeveldbFixedIntKeys(tempdir, 'kv')
+    yield kv
+    kv.close()
+
+
+def fill_int_keys_store(db_dir, db_name, count):
+    store = KeyValueStorageLeveldbIntKeys(db_dir, db_name)
+    store.setBatch((str(i), 'value{}'.format(i)) for i in range(1, count + 1))
+    store.close()
+
+
+def test_keys_ordered_as_integers(kv):
+    keys = list(range(1, 1001))
+    random.shuffle(keys)
+    for key in keys:
+        kv.put(str(key), 'value{}'.format(key))
+
+    assert list(kv.iterator(include_value=False)) == list(range(1, 1001))
+    assert list(kv.iterator(start=9, end=11)) == \
+        [(9, b'value9'), (10, b'value10'), (11, b'value11')]
+    assert list(kv.iterator(start='998', include_value=False)) == \
+        [998, 999, 1000]
+    assert kv.size == 1000
+
+
+def test_int_str_and_bytes_keys_are_same(kv):
+    kv.put(12, 'v1')
+    assert kv.get('12') == b'v1'
+    assert kv.get(b'12') == b'v1'
+    kv.put(b'12', b'v2')
+    assert kv.get(12) == b'v2'
+    kv.remove('12')
+    assert 12 not in kv
+
+
+def test_batches(kv):
+    kv.setBatch([('1', 'v1'), (2, 'v2'), (b'3', 'v3')])
+    kv.do_ops_in_batch([(kv.REMOVE_OP, '2', None),
+                        (kv.WRITE_OP, 4, 'v4')])
+    assert list(kv.iterator()) == [(1, b'v1'), (3, b'v3'), (4, b'v4')]
+
+
+def test_migrate_int_keys_store(tempdir):
+    fill_int_keys_store(tempdir, 'txns', 25)
+    assert has_int_comparator(os.path.join(tempdir, 'txns'))
+
+    assert migrate_int_keys_store(tempdir, 'txns', batch_size=10)
+    assert not has_int_comparator(os.path.join(tempdir, 'txns'))
+    assert sorted(os.listdir(tempdir)) == ['txns']
+
+    store = KeyValueStorageLeveldbFixedIntKeys(tempdir, 'txns')
+    assert list(store.iterator()) == \
+        [(i, 'value{}'.format(i).encode()) for i in range(1, 26)]
+    store.close()
+
+    # Nothing to do for migrated storages
+    assert not migrate_int_keys_store(tempdir, 'txns')
+
+
+def test_interrupted_migration_is_resumed(tempdir):
+    fill_int_keys_store(tempdir, 'txns', 5)
+    # Migration stopped after the old storage was moved away
+    os.rename(os.path.join(tempdir, 'txns'),
+              os.path.join(tempdir, 'txns_int_keys'))
+    KeyValueStorageLeveldbFixedIntKeys(tempdir, 'txns_fixed_int_keys').close()
+
+    assert migrate_int_keys_store(tempdir, 'txns')
+    assert sorted(os.listdir(tempdir)) == ['txns']
+    store = KeyValueStorageLeveldbFixedIntKeys(tempdir, 'txns')
+    assert store.size == 5
+    store.close()
+
+
+def test_no_migration_of_missing_storage(tempdir):
+    assert not migrate_int_keys_store(tempdir, 'txns')
+    assert os.listdir(tempdir) == []
@@ -0,0 +1,39 @@
+import random
+import time
+
+import pytest
+
+from storage.kv_store_leveldb_fixed_int_keys import \
+    KeyValueStorageLeveldbFixedIntKeys
+from storage.kv_store_leveldb_int_keys import KeyValueStorageLeveldbIntKeys
+
+
+@pytest.mark.parametrize('store_class', [KeyValueStorageLeveldbIntKeys,
+                                         KeyValueStorageLeveldbFixedIntKeys])
+def testMeasureTxnLogStoreOperations(tempdir, store_class):
+    count = 20000
+    value = b'{"txn": "' + b'x' * 200 + b'"}'
+    store = store_class(tempdir, 'transactions')
+
+    timings = {}
+    start = time.perf_counter()
+    for seq_no in range(1, count + 1):
+        store.put(str(seq_no), value)
+    timings['{} appends'.format(count)] = time.perf_counter() - start
+
+    seq_nos = [random.randint(1, count) for _ in range(count)]
+    start = time.perf_counter()
+    for seq_no in seq_nos:
+        store.get(str(seq_no))
+    timings['{} random reads'.format(count)] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for frm in range(1, count, count // 20):
+        assert len(list(store.iterator(start=frm,
+                                       end=frm + 999))) == 1000
+    timings['20 range scans of 1000 txns'] = time.perf_counter() - start
+    store.close()
+
+    for operation, t in timings.items():
+        print("{}: {} took {} seconds".
+              format(store_class.__name__, operation, t))
@@ -0,0 +1,138 @@
+import os
+
+import pytest
+
+from storage.kv_store import KeyValueStorage
+from storage.kv_store_rocksdb import KeyValueStorageRocksdb
+
+pytest.importorskip('rocksdb')
+
+i = 0
+
+
+@pytest.yield_fixture(scope="function")
+def kv(tempdir) -> KeyValueStorageRocksdb:
+    global i
+    kv = KeyValueStorageRocksdb(tempdir, 'kv{}'.format(i))
+    i += 1
+    yield kv
+    kv.close()
+
+
+def test_reopen(kv):
+    kv.put('k1', 'v1')
+    kv.close()
+
+    kv.open()
+    assert b'v1' == kv.get('k1')
+    with pytest.raises(KeyError):
+        kv.get('k2')
+
+
+def test_drop(kv):
+    kv.put('k1', 'v1')
+    assert 'k1' in kv
+    kv.close()
+    kv.drop()
+
+    kv.open()
+    assert 'k1' not in kv
+
+
+def test_put_get_remove(kv):
+    kv.put(b'k1', 'v1')
+    kv.put('k2', b'v2')
+    kv.put(3, 'v3')
+    assert b'v1' == kv.get('k1')
+    assert b'v2' == kv.get(b'k2')
+    assert b'v3' == kv.get('3')
+
+    kv.remove('k1')
+    assert 'k1' not in kv
+    assert 'k2' in kv
+
+
+def test_batch(kv):
+    kv.setBatch([('k{}'.format(i), 'v{}'.format(i)) for i in range(5)])
+    for i in range(5):
+        assert 'v{}'.format(i).encode() == kv.get('k{}'.format(i))
+
+    kv.do_ops_in_batch([(KeyValueStorage.REMOVE_OP, 'k0', None),
+                        (KeyValueStorage.WRITE_OP, 'k1', 'x')])
+    assert 'k0' not in kv
+    assert b'x' == kv.get('k1')
+
+
+def test_iterator(kv):
+    kv.setBatch([('a{}'.format(i), str(i)) for i in range(5)] +
+                [('b{}'.format(i), str(i)) for i in range(5)])
+
+    assert [k for k, _ in kv.iterator()] == \
+        [b'a0', b'a1', b'a2', b'a3', b'a4', b'b0', b'b1', b'b2', b'b3', b'b4']
+    # The end is inclusive
+    assert list(kv.iterator(start='a3', end='b1')) == \
+        [(b'a3', b'3'), (b'a4', b'4'), (b'b0', b'0'), (b'b1', b'1')]
+    assert list(kv.iterator(prefix='b', include_value=False)) == \
+        [b'b0', b'b1', b'b2', b'b3', b'b4']
+    assert list(kv.iterator(start='b3', prefix='b', include_key=False)) == \
+        [b'3', b'4']
+    assert kv.size == 10
+
+
+def test_column_families(kv, tempdir):
+    txns = kv.column_family('txns')
+    state = kv.column_family('state')
+    assert kv.column_family('txns') is txns
+
+    kv.put('k', 'default')
+    txns.put('k', 'txn')
+    state.put('k', 'state')
+    assert b'default' == kv.get('k')
+    assert b'txn' == txns.get('k')
+    assert list(state.iterator()) == [(b'k', b'state')]
+    for k in ('a1', 'a2', 'b1'):
+        state.put(k, k)
+    assert list(state.iterator(start='a2', include_value=False)) == \
+        [b'a2', b'b1', b'k']
+    assert list(state.iterator(prefix='a')) == [(b'a1', b'a1'),
+                                                (b'a2', b'a2')]
+
+    # Column families are reopened with the database
+    kv.close()
+    assert txns.closed
+    kv.open()
+    assert b'txn' == txns.get('k')
+
+    state.drop()
+    assert kv.column_family('state').size == 0
+    assert b'txn' == txns.get('k')
+
+
+def test_atomic_batch_of_stores(kv, tempdir):
+    txns = kv.column_family('txns')
+    kv.do_ops_in_batch_of_stores([
+        (kv, KeyValueStorage.WRITE_OP, 'k1', 'v1'),
+        (txns, KeyValueStorage.WRITE_OP, 'k2', 'v2'),
+    ])
+    assert b'v1' == kv.get('k1')
+    assert b'v2' == txns.get('k2')
+    assert 'k2' not in kv
+
+    other = KeyValueStorageRocksdb(tempdir, 'other')
+    with pytest.raises(ValueError):
+        txns.do_ops_in_batch_of_stores([
+            (txns, KeyValueStorage.WRITE_OP, 'k3', 'v3'),
+            (other, KeyValueStorage.WRITE_OP, 'k3', 'v3'),
+        ])
+    other.close()
+    # Nothing is written if the batch fails
+    assert 'k3' not in txns
+
+
+def test_read_only(kv, tempdir):
+    kv.put('k1', 'v1')
+    kv.close()
+    read_only = KeyValueStorageRocksdb(tempdir, os.path.basename(kv.db_path),
+                                       read_only=True)
+    assert b'v1' == read_only.get('k1')
+    read_only.close()
@@ -0,0 +1,63 @@
+import random
+import time
+
+import pytest
+
+from plenum.persistence.req_id_to_txn import ReqIdrToTxn
+from state.pruning_state import PruningState
+from storage.kv_store_leveldb import KeyValueStorageLeveldb
+from storage.kv_store_rocksdb import KeyValueStorageRocksdb
+
+COUNT = 10000
+
+
+def ledger_workload(store):
+    value = b'{"txn": "' + b'x' * 200 + b'"}'
+    # Zero padded sequence numbers are ordered by both stores
+    store.setBatch(('{:012}'.format(seq_no), value)
+                   for seq_no in range(1, COUNT + 1))
+    for seq_no in random.sample(range(1, COUNT + 1), COUNT // 2):
+        store.get('{:012}'.format(seq_no))
+    for frm in range(1, COUNT, COUNT // 20):
+        assert len(list(store.iterator(
+            start='{:012}'.format(frm),
+            end='{:012}'.format(frm + 99)))) == 100
+
+
+def trie_workload(store):
+    # Updating the trie is much slower than the store, so fewer keys
+    count = COUNT // 10
+    state = PruningState(store)
+    for batch in range(count // 100):
+        for i in range(100):
+            state.set('nym{}'.format(batch * 100 + i).encode(), b'x' * 100)
+        state.commit(state.headHash)
+    for i in random.sample(range(count), count):
+        state.get('nym{}'.format(i).encode())
+
+
+def seq_no_workload(store):
+    seq_no_db = ReqIdrToTxn(store)
+    seq_no_db.addBatch(('client{}'.format(i % 100), i, i)
+                       for i in range(COUNT))
+    for i in random.sample(range(COUNT), COUNT // 2):
+        assert seq_no_db.get('client{}'.format(i % 100), i) == i
+    # Most of the requests are not ordered yet
+    for i in range(COUNT, COUNT + COUNT // 2):
+        assert seq_no_db.get('client{}'.format(i % 100), i) is None
+
+
+@pytest.mark.parametrize('workload', [ledger_workload, trie_workload,
+                                      seq_no_workload])
+@pytest.mark.parametrize('store_class', [KeyValueStorageLeveldb,
+                                         KeyValueStorageRocksdb])
+def testMeasureStoreWorkload(tempdir, store_class, workload):
+    if store_class is KeyValueStorageRocksdb:
+        pytest.importorskip('rocksdb')
+    store = store_class(tempdir, 'db')
+    start = time.perf_counter()
+    workload(store)
+    t = time.perf_counter() - start
+    store.close()
+    print("{}: {} took {} seconds".format(store_class.__name__,
+                                          workload.__name__, t))
@@ -112,3 +112,35 @@ def test_set_get_reject_same_keys(optimistic_store):
         assert optimistic_store.get(k, is_committed=False) != vals_1[k]
         assert optimistic_store.get(k, is_committed=False) != vals_2[k]
         assert optimistic_store.get(k, is_committed=False) == v
+
+
+def test_latest_uncommitted_value_after_commit_and_reject(optimistic_store):
+    key = b'key'
+    for i in range(4):
+        optimistic_store.set(key, 'v{}'.format(i).encode())
+        optimistic_store.create_batch_from_current(i)
+    optimistic_store.set(key, b'current')
+    assert optimistic_store.get(key) == b'current'
+
+    optimistic_store.reject_batch()
+    assert optimistic_store.get(key) == b'v2'
+    assert optimistic_store.commit_batch() == 0
+    assert optimistic_store.commit_batch() == 1
+    assert optimistic_store.get(key) == b'v2'
+    assert optimistic_store.get(key, is_committed=True) == b'v1'
+
+    optimistic_store.reject_batch()
+    assert optimistic_store.get(key) == b'v1'
+    assert not optimistic_store.un_committed
+
+
+def test_remove_from_current_batch(optimistic_store):
+    optimistic_store.set(b'k1', b'v1')
+    optimistic_store.create_batch_from_current(1)
+    optimistic_store.set(b'k1', b'v2')
+    optimistic_store.set(b'k2', b'v2')
+
+    optimistic_store.remove(b'k1')
+    assert optimistic_store.current_batch_ops == [(b'k2', b'v2')]
+    assert optimistic_store.get(b'k1') == b'v1'
+    assert optimistic_store.get(b'k2') == b'v2'
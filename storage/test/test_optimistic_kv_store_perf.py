@@ -0,0 +1,49 @@
+import random
+import time
+
+from storage.kv_in_memory import KeyValueStorageInMemory
+from storage.optimistic_kv_store import OptimisticKVStore
+
+
+def testMeasureUncommittedReadsWithManyBatches():
+    num_batches = 50
+    ops_per_batch = 1000
+    store = OptimisticKVStore(KeyValueStorageInMemory())
+    store.setBatch([('committed{}'.format(i).encode(), b'v')
+                    for i in range(ops_per_batch)], is_committed=True)
+
+    timings = {}
+    start = time.perf_counter()
+    for b in range(num_batches):
+        for i in range(ops_per_batch):
+            store.set('key{}'.format(b * ops_per_batch + i).encode(), b'v')
+        store.create_batch_from_current(b)
+    timings['creating {} batches of {} ops'.
+            format(num_batches, ops_per_batch)] = time.perf_counter() - start
+
+    keys = ['key{}'.format(random.randrange(num_batches * ops_per_batch))
+            for _ in range(10000)]
+    keys = [k.encode() for k in keys]
+    start = time.perf_counter()
+    for key in keys:
+        store.get(key)
+    timings['10000 reads of uncommitted keys'] = time.perf_counter() - start
+
+    committed = ['committed{}'.format(i).encode()
+                 for i in range(ops_per_batch)]
+    start = time.perf_counter()
+    for key in committed:
+        store.get(key)
+    timings['{} reads of committed keys'.format(ops_per_batch)] = \
+        time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(num_batches // 2):
+        store.reject_batch()
+    while store.un_committed:
+        store.commit_batch()
+    timings['rejecting and committing {} batches'.format(num_batches)] = \
+        time.perf_counter() - start
+
+    for operation, t in timings.items():
+        print("{} took {} seconds".format(operation, t))
@@ -0,0 +1,91 @@
+import pytest
+
+from storage.binary_file_store import BinaryFileStore
+from storage.text_file_store import TextFileStore
+
+
+@pytest.yield_fixture(params=['text', 'binary'])
+def line_no_store(request, tempdir):
+    if request.param == 'text':
+        store = TextFileStore(tempdir, 'lines', isLineNoKey=True,
+                              ensureDurability=False)
+    else:
+        store = BinaryFileStore(tempdir, 'lines', isLineNoKey=True,
+                                storeContentHash=False,
+                                ensureDurability=False)
+    yield store
+    store.close()
+
+
+def value(store, i):
+    v = 'value{}'.format(i)
+    return v.encode() if store.is_byte else v
+
+
+def test_get_and_size_follow_appends(line_no_store):
+    store = line_no_store
+    assert store.size == 0
+    for i in range(1, 11):
+        store.put(None, value(store, i))
+        assert store.size == i
+        assert store.get(str(i)) == value(store, i)
+    assert store.get(3) == value(store, 3)
+    for key in ('0', '11', 'x'):
+        with pytest.raises(KeyError):
+            store.get(key)
+
+
+def test_range_iterator(line_no_store):
+    store = line_no_store
+    for i in range(1, 11):
+        store.put(None, value(store, i))
+    assert list(store.iterator(start=4, end=6)) == \
+        [(str(i), value(store, i)) for i in range(4, 7)]
+    assert list(store.iterator(start=9)) == \
+        [(str(i), value(store, i)) for i in (9, 10)]
+    assert list(store.iterator(start=11)) == []
+    assert list(store.iterator()) == \
+        [(str(i), value(store, i)) for i in range(1, 11)]
+
+
+def test_index_is_rebuilt_after_reset_and_reopen(line_no_store):
+    store = line_no_store
+    for i in range(1, 6):
+        store.put(None, value(store, i))
+    assert store.size == 5
+    store.reset()
+    assert store.size == 0
+    store.put(None, value(store, 7))
+    store.close()
+
+    store.open()
+    assert store.size == 1
+    assert store.get('1') == value(store, 7)
+
+
+def test_get_by_key(tempdir):
+    store = TextFileStore(tempdir, 'keys', ensureDurability=False)
+    store.put('a', 'v1')
+    store.put('b', 'v2')
+    # The first value of a key is returned
+    store.put('a', 'v3')
+    assert store.get('a') == 'v1'
+    assert store.get('b') == 'v2'
+    assert store.size == 3
+    with pytest.raises(KeyError):
+        store.get('c')
+    store.close()
+
+
+def test_last_unterminated_line(tempdir):
+    store = TextFileStore(tempdir, 'lines', isLineNoKey=True,
+                          storeContentHash=False, ensureDurability=False)
+    store.put(None, 'value1')
+    store.db_file.write('val')
+    assert store.size == 2
+    assert store.get('2') == 'val'
+    store.db_file.write('ue2' + store.lineSep)
+    store.put(None, 'value3')
+    assert store.size == 3
+    assert [v for _, v in store.iterator(start=2)] == ['value2', 'value3']
+    store.close()
@@ -1,7 +1,6 @@
 import logging
 import os
 
-from storage import store_utils
 from storage.kv_store_single_file import SingleFileStore
 
 
@@ -33,10 +32,14 @@ class TextFileStore(SingleFileStore):
     def _init_db_file(self):
         return open(self.db_path, mode="a+")
 
-    def _lines(self):
-        # Move to the beginning of file
-        self.db_file.seek(0)
-        return store_utils.cleanLines(self.db_file)
+    @property
+    def _recordSep(self) -> bytes:
+        # Lines can also be separated with just a new line, like in files
+        # edited by hand
+        return b'\n'
+
+    def _cleanRecord(self, record: bytes):
+        return record.decode().strip('\r\n')
 
     def _append_new_line_if_req(self):
         try:
@@ -5,7 +5,7 @@ import signal
 import sys
 import time
 from asyncio.coroutines import CoroWrapper
-from typing import List, Optional
+from typing import List, Optional, Iterable
 
 # import uvloop
 from stp_core.common.log import getlogger
@@ -15,6 +15,9 @@ from stp_core.loop.startable import Status
 
 logger = getlogger()
 
+# Time the looper sleeps for when nothing was processed in polling mode
+POLL_INTERVAL = 0.01
+
 # TODO: move it to plenum-util repo
 
 
@@ -60,6 +63,23 @@ class Prodable:
         raise NotImplementedError("subclass {} should implement this method"
                                   .format(self))
 
+    def wakeup_fds(self) -> Iterable[int]:
+        """
+        File descriptors which become readable when the Prodable gets
+        something to process. Used by an event driven Looper to sleep until
+        one of them is ready.
+        """
+        return ()
+
+    def max_idle_time(self) -> float:
+        """
+        The longest time the Prodable can wait to be prodded again if no
+        file descriptor of `wakeup_fds` becomes ready, like the time until
+        its next scheduled action, 0 if it has something to process already.
+        Used by an event driven Looper, by default the Prodable is polled.
+        """
+        return POLL_INTERVAL
+
 
 class Looper:
     """
@@ -70,7 +90,9 @@ class Looper:
                  prodables: List[Prodable]=None,
                  loop=None,
                  debug=False,
-                 autoStart=True):
+                 autoStart=True,
+                 eventDriven=False,
+                 maxIdleTime=1):
         """
         Initialize looper with an event loop.
 
@@ -78,9 +100,18 @@ class Looper:
         :param loop: the event loop to use
         :param debug: set_debug on event loop will be set to this value
         :param autoStart: start immediately?
+        :param eventDriven: when nothing was processed, sleep until a
+        file descriptor of the prodables is ready or the time one of them
+        can be idle is over instead of sleeping for a fixed time
+        :param maxIdleTime: the longest time an event driven looper sleeps
         """
         self.prodables = list(prodables) if prodables is not None \
             else []  # type: List[Prodable]
+        self.eventDriven = eventDriven
+        self.maxIdleTime = maxIdleTime
+        # File descriptors watched by the event loop, only if event driven
+        self._wakeupFds = set()
+        self._wakeup = None
 
         # if sys.platform == 'linux':
         #     asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
@@ -103,6 +134,9 @@ class Looper:
             asyncio.set_event_loop(evl)
             self.loop = evl
 
+        if self.eventDriven:
+            self._wakeup = asyncio.Event(loop=self.loop)
+
         self.runFut = self.loop.create_task(self.runForever())  # type: Task
         self.running = True  # type: bool
 
@@ -163,6 +197,7 @@ class Looper:
         self.prodables.append(prodable)
         if self.autoStart:
             prodable.start(self.loop)
+        self._wake()
 
     def removeProdable(self, prodable: Prodable=None, name: str=None) -> Optional[Prodable]:
         """
@@ -206,12 +241,47 @@ class Looper:
         msgsProcessed = await self.prodAllOnce()
         if msgsProcessed == 0:
             # if no let other stuff run
-            await asyncio.sleep(0.01, loop=self.loop)
+            if self.eventDriven:
+                await self.waitForEvents()
+            else:
+                await asyncio.sleep(POLL_INTERVAL, loop=self.loop)
         dur = time.perf_counter() - start
         if dur >= 0.5:
             logger.debug("it took {:.3f} seconds to run once nicely".
                          format(dur), extra={"cli": False})
 
+    async def waitForEvents(self):
+        """
+        Sleep until a file descriptor of the prodables becomes ready or the
+        shortest time any of them can be idle is over.
+        """
+        # Idle times are checked before the file descriptors are watched,
+        # checking them can consume the readiness of a descriptor
+        timeout = self.maxIdleTime
+        for p in self.prodables:
+            timeout = min(timeout, p.max_idle_time())
+            if timeout <= 0:
+                await asyncio.sleep(0, loop=self.loop)
+                return
+        self._watchFds({fd for p in self.prodables for fd in p.wakeup_fds()})
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout,
+                                   loop=self.loop)
+        except asyncio.TimeoutError:
+            pass
+
+    def _watchFds(self, fds):
+        for fd in self._wakeupFds - fds:
+            self.loop.remove_reader(fd)
+        for fd in fds - self._wakeupFds:
+            self.loop.add_reader(fd, self._wakeup.set)
+        self._wakeupFds = fds
+
+    def _wake(self):
+        if self._wakeup is not None:
+            self._wakeup.set()
+
     def runFor(self, timeout):
         self.run(asyncio.sleep(timeout))
 
@@ -264,6 +334,7 @@ class Looper:
         # KeyboardInterrupt (Ctrl+C)
         logger.debug("Signal {} received, stopping looper...".format(sig))
         self.running = False
+        self._wake()
 
     async def shutdown(self):
         """
@@ -272,9 +343,12 @@ class Looper:
         logger.info("Looper shutting down now...",
                     extra={"cli": False})
         self.running = False
+        self._wake()
         start = time.perf_counter()
         if not self.runFut.done():
             await self.runFut
+        if self._wakeupFds:
+            self._watchFds(set())
         self.stopall()
         logger.info("Looper shut down in {:.3f} seconds.".
                     format(time.perf_counter() - start),
@@ -72,6 +72,12 @@ class SMotor(Motor):
     def stop(self):
         self.stack.stop()
 
+    def wakeup_fds(self):
+        return self.stack.wakeup_fds()
+
+    def max_idle_time(self):
+        return self.stack.max_idle_time()
+
 
 def prepStacks(looper, *stacks, connect=True, useKeys=True):
     motors = []
@@ -0,0 +1,77 @@
+import os
+import time
+
+from stp_core.loop.looper import Looper, Prodable
+
+
+class FdProdable(Prodable):
+    """
+    Prodable which processes the bytes written to a pipe
+    """
+
+    def __init__(self):
+        self.name = 'fd_prodable'
+        self.prods = 0
+        self.received = []
+        self._r, self._w = os.pipe()
+        os.set_blocking(self._r, False)
+
+    async def prod(self, limit) -> int:
+        self.prods += 1
+        try:
+            data = os.read(self._r, 1024)
+        except BlockingIOError:
+            return 0
+        self.received.append((data, time.perf_counter()))
+        return 1
+
+    def start(self, loop):
+        pass
+
+    def stop(self):
+        os.close(self._r)
+        os.close(self._w)
+
+    def wakeup_fds(self):
+        return [self._r]
+
+    def max_idle_time(self):
+        return float('inf')
+
+
+def test_event_driven_looper_wakes_on_ready_fd():
+    prodable = FdProdable()
+    with Looper(eventDriven=True, maxIdleTime=10) as looper:
+        looper.add(prodable)
+        looper.runFor(0.2)
+        prods_when_idle = prodable.prods
+
+        sent_at = []
+
+        def write():
+            sent_at.append(time.perf_counter())
+            os.write(prodable._w, b'x')
+
+        looper.loop.call_later(0.3, write)
+        looper.runFor(0.5)
+
+        assert [data for data, _ in prodable.received] == [b'x']
+        assert prodable.received[0][1] - sent_at[0] < 0.01
+        # The looper slept while idle instead of polling
+        assert prodable.prods - prods_when_idle < 10
+
+
+def test_event_driven_looper_polls_prodables_without_fds():
+    class Polled(FdProdable):
+        def wakeup_fds(self):
+            return []
+
+        max_idle_time = Prodable.max_idle_time
+
+    prodable = Polled()
+    with Looper(eventDriven=True) as looper:
+        looper.add(prodable)
+        looper.loop.call_later(0.1, os.write, prodable._w, b'x')
+        looper.runFor(0.3)
+        assert [data for data, _ in prodable.received] == [b'x']
+        assert prodable.prods > 10
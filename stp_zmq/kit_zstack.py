@@ -50,6 +50,10 @@ class KITZStack(SimpleZStack, KITNetworkInterface):
                      .format(self, self.nextCheck - now))
         return True
 
+    def max_idle_time(self) -> float:
+        return max(0, min(super().max_idle_time(),
+                          self.nextCheck - time.perf_counter()))
+
     def reconcileNodeReg(self) -> set:
         """
         Check whether registry contains some addresses
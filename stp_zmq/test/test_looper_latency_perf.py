@@ -0,0 +1,49 @@
+import asyncio
+import random
+import time
+
+import pytest
+import zmq.asyncio
+
+from stp_core.loop.looper import Looper
+from stp_core.network.port_dispenser import genHa
+from stp_core.test.helper import prepStacks
+from stp_zmq.test.helper import genKeys
+from stp_zmq.zstack import ZStack
+
+
+@pytest.mark.parametrize('event_driven', [False, True])
+def testMeasureRoundTripUnderLightLoad(tdir, tconf, event_driven):
+    names = ['Alpha', 'Beta']
+    genKeys(tdir, names)
+    replies = []
+    alpha = ZStack(names[0], ha=genHa(), basedirpath=tdir,
+                   msgHandler=lambda m: replies[-1].set_result(
+                       time.perf_counter()),
+                   restricted=True, config=tconf)
+    beta = ZStack(names[1], ha=genHa(), basedirpath=tdir,
+                  msgHandler=lambda m: beta.send(m[0], m[1]),
+                  restricted=True, config=tconf)
+    count = 30
+    round_trips = []
+
+    async def ping_pong():
+        for i in range(count):
+            # Pings are sent at random moments with the stacks idle between
+            await asyncio.sleep(random.uniform(0.01, 0.03))
+            replies.append(asyncio.Future())
+            start = time.perf_counter()
+            alpha.send({'ping': i}, beta.name)
+            round_trips.append(await replies[-1] - start)
+
+    loop = zmq.asyncio.ZMQEventLoop()
+    with Looper(loop=loop, eventDriven=event_driven) as looper:
+        prepStacks(looper, alpha, beta, connect=True, useKeys=True)
+        looper.run(ping_pong())
+    loop.close()
+
+    round_trips.sort()
+    print("{} looper: average round trip {} ms, median {} ms over {} "
+          "messages".format('Event driven' if event_driven else 'Polling',
+                            1000 * sum(round_trips) / count,
+                            1000 * round_trips[count // 2], count))
@@ -444,16 +444,22 @@ class ZStack(NetworkInterface):
     def _verifyAndAppend(self, msg, ident):
         try:
             self.msgLenVal.validate(msg)
-            decoded = msg.decode()
-        except (UnicodeDecodeError, InvalidMessageExceedingSizeException) as ex:
-            errstr = 'Message will be discarded due to {}'.format(ex)
-            frm = self.remotesByKeys[ident].name if ident in self.remotesByKeys else ident
-            logger.warning("Got from {} {}".format(frm, errstr))
-            self.msgRejectHandler(errstr, frm)
+        except InvalidMessageExceedingSizeException as ex:
+            self._rejectReceived(ex, ident)
             return False
-        self.rxMsgs.append((decoded, ident))
+        # Messages are kept as received and decoded only when parsed, the
+        # health messages are decoded here since they are not serialized
+        if msg in self.healthMessages:
+            msg = msg.decode()
+        self.rxMsgs.append((msg, ident))
         return True
 
+    def _rejectReceived(self, ex, ident):
+        errstr = 'Message will be discarded due to {}'.format(ex)
+        frm = self.remotesByKeys[ident].name if ident in self.remotesByKeys else ident
+        logger.warning("Got from {} {}".format(frm, errstr))
+        self.msgRejectHandler(errstr, frm)
+
     def _receiveFromListener(self, quota) -> int:
         """
         Receives messages from listener
@@ -509,6 +515,45 @@ class ZStack(NetworkInterface):
             totalReceived += i
         return totalReceived
 
+    def _sockets(self):
+        if self.listener:
+            yield self.listener
+        for remote in self.remotes.values():
+            if remote.socket:
+                yield remote.socket
+
+    def wakeup_fds(self):
+        """
+        File descriptors of the listener and the remotes' sockets, they
+        become readable when the state of the socket changes, like when a
+        message is received
+        """
+        return [sock.getsockopt(zmq.FD) for sock in self._sockets()]
+
+    def has_pending_messages(self) -> bool:
+        """
+        Whether there are received messages which are not processed yet
+        """
+        if self.rxMsgs:
+            return True
+        # Getting the events also resets the readiness of the sockets'
+        # file descriptors
+        return any(sock.getsockopt(zmq.EVENTS) & zmq.POLLIN
+                   for sock in self._sockets())
+
+    def max_idle_time(self) -> float:
+        """
+        The time the stack can wait to be serviced if no message is received
+        """
+        if self.has_pending_messages():
+            return 0
+        if not self.config.ENABLE_HEARTBEATS:
+            return float('inf')
+        if self.last_heartbeat_at is None:
+            return 0
+        return max(0, self.last_heartbeat_at + self.config.HEARTBEAT_FREQ -
+                   time.perf_counter())
+
     async def _serviceStack(self, age):
         # TODO: age is unused
 
@@ -541,6 +586,7 @@ class ZStack(NetworkInterface):
             except Exception as e:
                 logger.error('Error {} while converting message {} '
                              'to JSON from {}'.format(e, msg, ident))
+                self._rejectReceived(e, ident)
                 continue
             msg = self.doProcessReceived(msg, frm, ident)
             if msg:
@@ -774,6 +820,8 @@ class ZStack(NetworkInterface):
     @staticmethod
     def deserializeMsg(msg):
         if isinstance(msg, bytes):
+            # ujson accepts some invalid UTF-8, like stray continuation
+            # bytes, decoding rejects it
             msg = msg.decode()
         msg = json.loads(msg)
         return msg